@@ -0,0 +1,73 @@
+"""
+reading a field from 1,000 entities: get_attribute as it was before
+accessors were compiled (before) against a compiled accessor and a column
+accessor (after), for dicts, objects and a dotted path
+"""
+import bench_utils
+
+from rip import attribute_getter
+
+
+class Entity(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+DICTS = [dict(id=index, name='name') for index in range(1000)]
+OBJECTS = [Entity(id=index, name='name') for index in range(1000)]
+NESTED = [Entity(profile=dict(address=Entity(city='city')))
+          for index in range(1000)]
+
+
+def _get_from_dict(entity, field_name):
+    try:
+        return entity[field_name]
+    except (KeyError, TypeError):
+        raise AttributeError(u'{} not in {}'.format(field_name, entity))
+
+
+def _get_from_object(entity, field_name):
+    return getattr(entity, field_name)
+
+
+def get_attribute(entity, field_name):
+    if isinstance(entity, dict):
+        return _get_from_dict(entity, field_name)
+
+    return _get_from_object(entity, field_name)
+
+
+def get_nested(entity):
+    profile = get_attribute(entity, 'profile')
+    address = get_attribute(profile, 'address')
+    return get_attribute(address, 'city')
+
+
+def main():
+    get_name = attribute_getter.compile_accessor('name')
+    get_names = attribute_getter.compile_column_accessor('name')
+    get_city = attribute_getter.compile_accessor('profile.address.city')
+
+    rows = []
+    for kind, entities in (('dicts', DICTS), ('objects', OBJECTS)):
+        before = bench_utils.measure(
+            lambda: [get_attribute(entity, 'name') for entity in entities],
+            number=300)
+        rows.append(('accessor, %s' % kind, before, bench_utils.measure(
+            lambda: [get_name(entity) for entity in entities], number=300)))
+        rows.append(('column accessor, %s' % kind, before,
+                     bench_utils.measure(lambda: get_names(entities, None),
+                                         number=300)))
+    rows.append(('accessor, dotted path',
+                 bench_utils.measure(
+                     lambda: [get_nested(entity) for entity in NESTED],
+                     number=300),
+                 bench_utils.measure(
+                     lambda: [get_city(entity) for entity in NESTED],
+                     number=300)))
+
+    bench_utils.report('read a field of 1000 entities', rows)
+
+
+if __name__ == '__main__':
+    main()
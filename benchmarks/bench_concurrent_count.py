@@ -0,0 +1,60 @@
+"""
+read_list against entity actions whose fetch and count each wait on a
+stand-in database: the count after the fetch (before) against the count on
+the thread pool of the api while the page is fetched (after).
+"""
+import time
+from multiprocessing.pool import ThreadPool
+
+import bench_utils
+
+from rip.generic_steps.default_entity_actions import DefaultEntityActions
+from rip.request import Request
+
+FETCH_DELAY = 0.004
+COUNT_DELAY = 0.006
+
+
+class DelayedEntityActions(DefaultEntityActions):
+    def get_entity_list(self, request, **kwargs):
+        time.sleep(FETCH_DELAY)
+        return [{'id': index} for index in range(kwargs['limit'])]
+
+    def get_entity_list_total_count(self, request, **kwargs):
+        time.sleep(COUNT_DELAY)
+        return 1000
+
+
+class ConcurrentEntityActions(DelayedEntityActions):
+    concurrent_total_count = True
+
+
+def read_list(entity_actions, thread_pool):
+    request = Request(user=None, request_params={},
+                      context_params={'request_filters': {'name': 'John'},
+                                      'thread_pool': thread_pool})
+    return entity_actions.read_list(request)
+
+
+def main():
+    thread_pool = ThreadPool(4)
+    sequential = DelayedEntityActions(schema_cls=None, default_offset=0,
+                                      default_limit=20)
+    concurrent = ConcurrentEntityActions(schema_cls=None, default_offset=0,
+                                         default_limit=20)
+
+    rows = [
+        ('fetch {}ms, count {}ms'.format(FETCH_DELAY * 1000,
+                                         COUNT_DELAY * 1000),
+         bench_utils.measure(lambda: read_list(sequential, thread_pool),
+                             number=50),
+         bench_utils.measure(lambda: read_list(concurrent, thread_pool),
+                             number=50)),
+    ]
+    thread_pool.terminate()
+
+    bench_utils.report('read_list with a delayed backend', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+converting a column of 1,000 datetimes to timestamps: looking up the
+timezone and converting through pytz for every value (before) against
+cached timezones, the UTC fast path and the batch conversion (after)
+"""
+import calendar
+import datetime
+
+import pytz
+
+import bench_utils
+
+from rip import datetime_converter
+
+DATES = [datetime.datetime(2015, 1, 1) + datetime.timedelta(hours=index)
+         for index in range(1000)]
+
+
+def datetime_to_timestamp(_date, timezone):
+    # datetime_to_timestamp before timezones were cached
+    if not hasattr(_date, "tzinfo"):
+        _date = datetime.datetime.combine(_date, datetime.time())
+    return calendar.timegm(pytz.timezone(timezone).localize(_date).astimezone(
+        pytz.UTC).utctimetuple())
+
+
+def main():
+    rows = []
+    for timezone in ('UTC', 'Asia/Calcutta'):
+        before = bench_utils.measure(
+            lambda: [datetime_to_timestamp(_date, timezone)
+                     for _date in DATES], number=30)
+        after = bench_utils.measure(
+            lambda: datetime_converter.datetimes_to_timestamps(DATES,
+                                                               timezone),
+            number=30)
+        rows.append(('1000 datetimes, %s' % timezone, before, after))
+
+    bench_utils.report('datetime column to timestamps', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+resolving the action of a request: formatting the action name and looking
+it up on the resource (before) against the dispatch table built when the
+resource is registered (after). A disallowed method used to go through the
+validate_action wrapper of the action to be rejected.
+"""
+import bench_utils
+
+from rip import error_types
+from rip.api import Api
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.crud.crud_resource import CrudResource
+from rip.django_adapter import action_resolver
+from rip.request import Request
+from rip.response import Response
+from rip.route_match import method_to_action_mapping
+from rip.schema.string_field import StringField
+from rip.view.view_resource import ViewResource
+
+
+class TeamSchema(ApiSchema):
+    name = StringField()
+
+    class Meta:
+        schema_name = 'teams'
+
+
+class TeamResource(CrudResource):
+    schema_cls = TeamSchema
+    allowed_actions = [CrudActions.READ_DETAIL, CrudActions.READ_LIST]
+
+
+class HttpRequest(object):
+    def __init__(self, method):
+        self.method = method
+
+
+def get_action(http_request, resource, endpoint):
+    # the dispatch before, by the name of the action
+    try:
+        if isinstance(resource, ViewResource):
+            action = resource.read
+        else:
+            if endpoint == 'aggregates':
+                resource_action = 'get_aggregates'
+            else:
+                resource_action = "%s_%s" % (
+                    method_to_action_mapping.get(http_request.method),
+                    endpoint)
+            action = getattr(resource, resource_action)
+
+        return action
+    except AttributeError:
+        return None
+
+
+def reject_before(resource, http_request):
+    # the rejection before, by the validate_action wrapper
+    action = get_action(http_request, resource, 'detail')
+    request = Request(user=None, request_params={})
+    request.context_params['crud_action'] = \
+        CrudActions.resolve_action(action.__name__)
+    if not resource.is_action_allowed(action.__name__):
+        return Response(is_success=False,
+                        reason=error_types.MethodNotAllowed)
+
+
+def reject_after(route_match, http_request):
+    action = action_resolver.resolve_route_action(http_request, route_match)
+    if action_resolver.is_method_not_allowed(action):
+        return action(None)
+
+
+def main():
+    api = Api('api')
+    resource = TeamResource()
+    api.register_resource('teams', resource)
+    route_match = api.match_route('teams/1')
+    get, delete = HttpRequest('GET'), HttpRequest('DELETE')
+
+    rows = [
+        ('GET detail',
+         bench_utils.measure(lambda: get_action(get, resource, 'detail'),
+                             number=100000),
+         bench_utils.measure(lambda: action_resolver.resolve_route_action(
+             get, route_match), number=100000)),
+        ('DELETE detail (not allowed)',
+         bench_utils.measure(lambda: reject_before(resource, delete),
+                             number=100000),
+         bench_utils.measure(lambda: reject_after(route_match, delete),
+                             number=100000)),
+    ]
+
+    bench_utils.report('action dispatch', rows)
+
+
+if __name__ == '__main__':
+    main()
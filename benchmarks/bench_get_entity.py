@@ -0,0 +1,75 @@
+"""
+read_detail against a backend returning lazy result sets, like django
+querysets, which read every row when their length is taken: the length of
+the whole result (before) against a slice of two entities (after).
+"""
+import bench_utils
+
+from rip import error_types
+from rip.generic_steps.default_entity_actions import DefaultEntityActions
+from rip.request import Request
+
+ROWS = 10000
+
+
+class LazyResult(object):
+    """
+    Reads rows only when it is sliced or its length is taken
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def read(self, count):
+        return [{'id': row} for row in xrange(min(count, self.rows))]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.read(index.stop)
+        return self.read(index + 1)[index]
+
+    def __len__(self):
+        return len(self.read(self.rows))
+
+
+class LazyEntityActions(DefaultEntityActions):
+    def get_entity_list(self, request, **kwargs):
+        return LazyResult(ROWS)
+
+
+class LengthEntityActions(LazyEntityActions):
+    def get_entity(self, request, **kwargs):
+        entities = self.get_entity_list(request, **kwargs)
+        if len(entities) == 0:
+            return None
+        elif len(entities) > 1:
+            raise error_types.MultipleObjectsFound()
+        return entities[0]
+
+
+def read_detail(entity_actions):
+    request = Request(user=None, request_params={},
+                      context_params={'request_filters': {'name': 'John'}})
+    try:
+        return entity_actions.read_detail(request)
+    except error_types.MultipleObjectsFound:
+        return None
+
+
+def main():
+    before = LengthEntityActions(schema_cls=None, default_offset=0,
+                                 default_limit=20)
+    after = LazyEntityActions(schema_cls=None, default_offset=0,
+                              default_limit=20)
+
+    rows = [
+        ('{} matching rows'.format(ROWS),
+         bench_utils.measure(lambda: read_detail(before), number=20),
+         bench_utils.measure(lambda: read_detail(after), number=20)),
+    ]
+
+    bench_utils.report('read_detail with a lazy backend', rows)
+
+
+if __name__ == '__main__':
+    main()
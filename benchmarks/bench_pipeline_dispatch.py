@@ -0,0 +1,40 @@
+"""
+per request dispatch overhead of a crud action: rebuilding the pipeline from
+the configuration (before) against looking it up in the resource's compiled
+pipeline registry (after)
+"""
+import bench_utils
+
+from rip.api_schema import ApiSchema
+from rip.crud import crud_pipeline_factory
+from rip.crud.crud_actions import CrudActions
+from rip.crud.crud_resource import CrudResource
+from rip.schema.string_field import StringField
+
+
+class BenchSchema(ApiSchema):
+    name = StringField()
+
+    class Meta:
+        schema_name = 'bench'
+
+
+class BenchResource(CrudResource):
+    schema_cls = BenchSchema
+    allowed_actions = CrudActions.get_all_actions()
+
+
+def main():
+    resource = BenchResource()
+    rows = []
+    for action in CrudActions.get_all_actions():
+        factory = getattr(crud_pipeline_factory, '{}_pipeline'.format(action))
+        before = bench_utils.measure(
+            lambda: factory(configuration=resource.configuration))
+        after = bench_utils.measure(lambda: resource.get_pipeline(action))
+        rows.append((action, before, after))
+    bench_utils.report('pipeline dispatch per request', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+cost of the pipeline latency instrumentation: a pipeline without any
+instrumentation support (before) against the current pipeline with
+instrumentation disabled and enabled (after)
+"""
+import bench_utils
+
+from rip import instrumentation
+from rip.pipeline_composer import PipelineComposer
+from rip.request import Request
+from rip.response import Response
+
+
+def uninstrumented_call(pipeline, request):
+    for counter, handler in enumerate(pipeline):
+        response = handler(request=request)
+        assert type(response) in [Request, Response]
+        if isinstance(response, Response):
+            break
+    assert isinstance(response, Response)
+    return response
+
+
+def step(request):
+    return request
+
+
+def last_step(request):
+    return Response()
+
+
+def main():
+    steps = [step] * 7 + [last_step]
+    composer = PipelineComposer(name='read_list', pipeline=steps,
+                                resource_name='BenchResource')
+    request = Request(user=None, request_params=None)
+
+    before = bench_utils.measure(lambda: uninstrumented_call(steps, request))
+    disabled = bench_utils.measure(lambda: composer(request))
+    instrumentation.enable()
+    enabled = bench_utils.measure(lambda: composer(request))
+    instrumentation.disable()
+
+    bench_utils.report('8 step pipeline call', [
+        ('instrumentation disabled', before, disabled),
+        ('instrumentation enabled', before, enabled)])
+
+
+if __name__ == '__main__':
+    main()
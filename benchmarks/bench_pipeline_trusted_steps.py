@@ -0,0 +1,38 @@
+"""
+cost of a 10 step pipeline call with step checks (before) against the
+trusted steps mode (after)
+"""
+import bench_utils
+
+from rip.pipeline_composer import PipelineComposer
+from rip.request import Request
+from rip.response import Response
+
+
+def step(request):
+    return request
+
+
+def last_step(request):
+    return Response()
+
+
+def main():
+    composer = PipelineComposer(name='bench', pipeline=[step] * 9 + [last_step])
+    request = Request(user=None, request_params=None)
+
+    checked = bench_utils.measure(lambda: composer(request))
+    PipelineComposer.trusted_steps = True
+    trusted = bench_utils.measure(lambda: composer(request))
+    PipelineComposer.contract_sample_rate = 0.01
+    sampled = bench_utils.measure(lambda: composer(request))
+    PipelineComposer.trusted_steps = False
+    PipelineComposer.contract_sample_rate = 0.0
+
+    bench_utils.report('10 step pipeline call', [
+        ('trusted steps', checked, trusted),
+        ('trusted, 1% sampled', checked, sampled)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+routing a request on an api with 500 registered endpoints: splitting the
+url again in every stage of the django adapter (before) against matching
+the url once in the routing trie of the api (after)
+"""
+import types
+
+import bench_utils
+
+from rip.api import Api
+from rip.api_schema import ApiSchema
+from rip.crud.crud_resource import CrudResource
+from rip.django_adapter import action_resolver
+from rip.route_match import method_to_action_mapping
+from rip.schema.string_field import StringField
+
+ENDPOINT_COUNT = 500
+URLS = ['companies/1/teams_250/2', 'companies/1/teams_499',
+        'companies/1/teams_10/aggregates']
+
+
+class HttpRequest(object):
+    method = 'GET'
+
+
+class OldApi(Api):
+    # resource lookup before the routing trie
+    def resolve_resource(self, url):
+        url_parts = url.split('/')[::2]
+        lookup = self.resources_lookup.get("/".join(url_parts))
+        if not lookup:
+            lookup = self.resources_lookup.get(url)
+        return lookup[1] if lookup else None
+
+    def resolve_endpoint(self, url):
+        url_parts = url.split('/')[::2]
+        lookup = self.resources_lookup.get("/".join(url_parts))
+        if not lookup:
+            lookup = self.resources_lookup.get(url)
+        return lookup[0] if lookup else None
+
+
+def resolve_action(http_request, url, api):
+    # action resolution before the dispatch table of routes
+    resource = api.resolve_resource(url)
+    if url.endswith('aggregates') or url.endswith('aggregates/'):
+        endpoint = 'aggregates'
+    elif http_request.method == 'POST' or len(url.split('/')) % 2 == 0:
+        endpoint = 'detail'
+    else:
+        endpoint = 'list'
+    if endpoint == 'aggregates':
+        action_name = 'get_aggregates'
+    else:
+        action_name = '%s_%s' % (
+            method_to_action_mapping.get(http_request.method), endpoint)
+    return getattr(resource, action_name, None)
+
+
+def api_breadcrumbs(url, endpoint):
+    url_parts = url.split("/")
+    url_iterator = iter(url_parts)
+    url_items = zip(url_iterator, url_iterator)
+    if len(url_parts) % 2 == 0:
+        return url_items[:-1]
+    return url_items
+
+
+def api_breadcrumb_filters(url, endpoint):
+    breadcrumb_filters = {}
+    url_parts = url.split("/")
+    endpoint_parts = endpoint.split("/")
+    if len(endpoint_parts) < len(url_parts) and url_parts[-1] != 'aggregates':
+        endpoint_parts.append('{id}')
+    for key, value in zip(endpoint_parts, url_parts):
+        if key.startswith("{") and key.endswith("}"):
+            breadcrumb_filters[key[1:-1]] = value
+    return breadcrumb_filters
+
+
+def register_resources(api):
+    for index in range(ENDPOINT_COUNT):
+        schema_name = 'teams_%s' % index
+        schema_cls = type('Schema', (ApiSchema,), dict(
+            name=StringField(),
+            Meta=types.ClassType('Meta', (), {'schema_name': schema_name})))
+        resource_cls = type('Resource', (CrudResource,),
+                            dict(schema_cls=schema_cls))
+        api.register_resource('companies/{company_id}/' + schema_name,
+                              resource_cls())
+
+
+def route_before(api, http_request, url):
+    if not api.resolve_resource(url):
+        return None
+    action = resolve_action(http_request, url, api)
+    endpoint = api.resolve_endpoint(url)
+    return (action, api_breadcrumb_filters(url, endpoint),
+            api_breadcrumbs(url, endpoint))
+
+
+def route_after(api, http_request, url):
+    route_match = api.match_route(url)
+    if route_match is None:
+        return None
+    action = action_resolver.resolve_route_action(http_request, route_match)
+    return action, route_match.breadcrumb_filters, route_match.breadcrumbs
+
+
+def main():
+    old_api, api = OldApi('api'), Api('api')
+    register_resources(old_api)
+    register_resources(api)
+    http_request = HttpRequest()
+
+    rows = []
+    for url in URLS:
+        assert route_before(old_api, http_request, url)[1:] == \
+            route_after(api, http_request, url)[1:]
+        rows.append((url,
+                     bench_utils.measure(
+                         lambda: route_before(old_api, http_request, url)),
+                     bench_utils.measure(
+                         lambda: route_after(api, http_request, url))))
+
+    bench_utils.report('routing with %s endpoints' % ENDPOINT_COUNT, rows)
+
+
+if __name__ == '__main__':
+    main()
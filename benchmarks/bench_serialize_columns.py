@@ -0,0 +1,78 @@
+"""
+serialize_list of 1,000 entities with datetime, float, resource uri and
+list fields: serializing entity by entity (before) against serializing
+column by column with the serialize_many of the fields (after)
+"""
+import datetime
+
+import bench_utils
+
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.generic_steps.default_schema_serializer import \
+    DefaultEntitySerializer
+from rip.request import Request
+from rip.schema.datetime_field import DateTimeField
+from rip.schema.float_field import FloatField
+from rip.schema.integer_field import IntegerField
+from rip.schema.list_field import ListField
+from rip.schema.resource_uri_field import ResourceUriField
+
+
+class Schema(ApiSchema):
+    id = IntegerField()
+    resource_uri = ResourceUriField()
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+    price = FloatField()
+    discount = FloatField()
+    scores = ListField(FloatField())
+
+    class Meta:
+        schema_name = 'bench'
+
+
+ENTITIES = [dict(id=index, resource_uri=index,
+                 created_at=datetime.datetime(2015, 1, 1, index % 24),
+                 updated_at=datetime.datetime(2015, 2, 1, index % 24),
+                 price=index * 1.111, discount=0.125,
+                 scores=[1.234, 5.678])
+            for index in range(1000)]
+
+
+class RowSerializer(DefaultEntitySerializer):
+    def serialize_entities(self, request, entity_list):
+        return [self.serialize_entity(request, entity)
+                for entity in entity_list]
+
+
+def serialize_list(serializer):
+    request = Request(user=None, request_params={},
+                      context_params={'crud_action': CrudActions.READ_LIST,
+                                      'api_name': 'api',
+                                      'api_version': 'v1',
+                                      'timezone': 'UTC',
+                                      'entities': ENTITIES,
+                                      'total_count': len(ENTITIES),
+                                      'request_filters': {'offset': 0,
+                                                          'limit': 1000}})
+    return serializer.serialize_list(request)
+
+
+def main():
+    row_serializer = RowSerializer(Schema)
+    column_serializer = DefaultEntitySerializer(Schema)
+    assert serialize_list(row_serializer).context_params['serialized_data'] \
+        == serialize_list(column_serializer).context_params['serialized_data']
+
+    before = bench_utils.measure(lambda: serialize_list(row_serializer),
+                                 number=10)
+    after = bench_utils.measure(lambda: serialize_list(column_serializer),
+                                number=10)
+
+    bench_utils.report('serialize_list, 1000 entities, 7 fields',
+                       [('column by column', before, after)])
+
+
+if __name__ == '__main__':
+    main()
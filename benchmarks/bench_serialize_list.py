@@ -0,0 +1,74 @@
+"""
+serialize_list of 1,000 entities with 20 fields: looking up the fields and
+overrides for every entity (before) against a compiled serialization plan
+(after)
+"""
+import bench_utils
+
+from rip import attribute_getter
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.generic_steps.default_schema_serializer import \
+    DefaultEntitySerializer
+from rip.request import Request
+from rip.schema.integer_field import IntegerField
+from rip.schema.string_field import StringField
+
+FIELD_COUNT = 20
+
+
+class Meta:
+    schema_name = 'bench'
+
+
+Schema = type('Schema', (ApiSchema,), dict(
+    [('field_%s' % index, StringField() if index % 2 else IntegerField())
+     for index in range(FIELD_COUNT)], Meta=Meta))
+
+ENTITIES = [dict(('field_%s' % index, 'value' if index % 2 else index)
+                 for index in range(FIELD_COUNT))
+            for entity_index in range(1000)]
+
+
+class UncompiledSerializer(DefaultEntitySerializer):
+    def serialize_entity(self, request, entity):
+        serialized = {}
+        fields_to_serialize = self.get_fields_to_serialize(request)
+        for field_name, field in fields_to_serialize.items():
+            field_override = getattr(self, 'serialize_%s' % field_name, None)
+            if field_override:
+                serialized_value = field_override(request, entity)
+            else:
+                serialized_value = attribute_getter.get_attribute(
+                    entity, field.entity_attribute or field_name)
+            serialized[field_name] = field.serialize(request, serialized_value)
+        return serialized
+
+    def serialize_list(self, request):
+        entity_list = request.context_params[self.entity_list_var]
+        return [self.serialize_entity(request, entity)
+                for entity in entity_list]
+
+
+def serialize_list(serializer):
+    request = Request(user=None, request_params={},
+                      context_params={'crud_action': CrudActions.READ_LIST,
+                                      'entities': ENTITIES,
+                                      'total_count': len(ENTITIES),
+                                      'request_filters': {'offset': 0,
+                                                          'limit': 1000}})
+    return serializer.serialize_list(request)
+
+
+def main():
+    before = bench_utils.measure(
+        lambda: serialize_list(UncompiledSerializer(Schema)), number=10)
+    after = bench_utils.measure(
+        lambda: serialize_list(DefaultEntitySerializer(Schema)), number=10)
+
+    bench_utils.report('serialize_list, 1000 entities, 20 fields',
+                       [('serialization plan', before, after)])
+
+
+if __name__ == '__main__':
+    main()
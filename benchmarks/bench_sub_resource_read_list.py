@@ -0,0 +1,92 @@
+"""
+read_list of 100 entities with two sub-resource fields: instantiating the
+sub-resources for every serialized value (before) against reusing the
+shared instances of the resource registry (after)
+"""
+import bench_utils
+
+from rip import resource_registry
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.crud.crud_resource import CrudResource
+from rip.generic_steps.default_entity_actions import DefaultEntityActions
+from rip.request import Request
+from rip.schema.integer_field import IntegerField
+from rip.schema.list_sub_resource_field import ListSubResourceField
+from rip.schema.string_field import StringField
+from rip.schema.sub_resource_field import SubResourceField
+
+PARENTS = [dict(id=index, name='parent %s' % index) for index in range(100)]
+
+
+class ChildSchema(ApiSchema):
+    id = IntegerField()
+    name = StringField()
+
+    class Meta:
+        schema_name = 'children'
+
+
+class ChildEntityActions(DefaultEntityActions):
+    def get_entity_list(self, request, **kwargs):
+        return [dict(id=1, name='child')]
+
+    def get_entity_list_total_count(self, request, **kwargs):
+        return 1
+
+
+class ChildResource(CrudResource):
+    schema_cls = ChildSchema
+    filter_by_fields = {'parent_id': ()}
+    entity_actions_cls = ChildEntityActions
+
+
+class ParentSchema(ApiSchema):
+    id = IntegerField()
+    name = StringField()
+    child = SubResourceField(resource_cls=ChildResource,
+                             related_filter='parent_id')
+    children = ListSubResourceField(resource_cls=ChildResource,
+                                    related_filter='parent_id')
+
+    class Meta:
+        schema_name = 'parents'
+
+
+class ParentEntityActions(DefaultEntityActions):
+    def get_entity_list(self, request, **kwargs):
+        return PARENTS
+
+    def get_entity_list_total_count(self, request, **kwargs):
+        return len(PARENTS)
+
+
+class ParentResource(CrudResource):
+    schema_cls = ParentSchema
+    entity_actions_cls = ParentEntityActions
+    allowed_actions = [CrudActions.READ_LIST]
+
+
+def read_list(resource):
+    request = Request(user=object(), request_params={},
+                      context_params={'api_name': 'api',
+                                      'api_version': 'v1'})
+    return resource.read_list(request)
+
+
+def main():
+    resource = ParentResource()
+    get_instance = resource_registry.get_instance
+
+    resource_registry.get_instance = \
+        lambda resource_cls, request: resource_cls()
+    before = bench_utils.measure(lambda: read_list(resource), number=20)
+    resource_registry.get_instance = get_instance
+    after = bench_utils.measure(lambda: read_list(resource), number=20)
+
+    bench_utils.report('read_list, 100 rows, 2 sub-resource fields',
+                       [('shared sub-resources', before, after)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+building and cleaning 10,000 resource urls: formatting the whole url for
+every entity and splitting every url (before) against the cached list url
+and the reverse-lookup cache (after). The urls cleaned are links to 1,000
+entities, like the foreign keys in the data of many requests.
+"""
+import bench_utils
+
+from rip import url_constructor
+
+PARENTS = [('companies', 1), ('teams', 2)]
+ENTITY_IDS = range(10000)
+URLS = [url_constructor.construct_url('api', 'v1', 'users', entity_id % 1000,
+                                      parents=PARENTS)
+        for entity_id in ENTITY_IDS]
+
+
+def construct_url(api_name, api_version, schema_name,
+                  entity_id, parents=None):
+    # construct_url before list urls were cached
+    parent_url_part = ''
+    for parent_name, parent_id in parents or []:
+        parent_url_part += '{}/{}/'.format(parent_name, parent_id)
+    return u"/{api_name}/{api_version}/{parent_part}{schema_name}/" \
+           u"{entity_id}/".format(api_name=api_name,
+                                  api_version=api_version,
+                                  parent_part=parent_url_part,
+                                  schema_name=schema_name,
+                                  entity_id=entity_id)
+
+
+def get_entity_id(url):
+    id_index = -2 if url.endswith('/') else -1
+    return url.split('/')[id_index]
+
+
+def main():
+    rows = [
+        ('construct_url',
+         bench_utils.measure(
+             lambda: [construct_url('api', 'v1', 'users', entity_id,
+                                    parents=PARENTS)
+                      for entity_id in ENTITY_IDS], number=5),
+         bench_utils.measure(
+             lambda: [url_constructor.construct_url(
+                 'api', 'v1', 'users', entity_id, parents=PARENTS)
+                 for entity_id in ENTITY_IDS], number=5)),
+        ('clean (entity id of url)',
+         bench_utils.measure(
+             lambda: [get_entity_id(url) for url in URLS], number=5),
+         bench_utils.measure(
+             lambda: [url_constructor.get_entity_id(url) for url in URLS],
+             number=5)),
+    ]
+
+    bench_utils.report('10000 resource urls', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""
+helpers shared by the benchmark scripts. Run a benchmark from the root of
+the repository, for example: python benchmarks/bench_pipeline_dispatch.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure(func, number=10000, repeat=3):
+    """
+    :return: best time per call in microseconds
+    """
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def report(title, rows):
+    """
+    prints rows of (name, before, after) timings in microseconds
+    """
+    print(title)
+    print('{:<28}{:>12}{:>12}{:>10}'.format('', 'before(us)', 'after(us)',
+                                            'speedup'))
+    for name, before, after in rows:
+        print('{:<28}{:>12.2f}{:>12.2f}{:>9.1f}x'.format(
+            name, before, after, before / after))
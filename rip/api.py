@@ -1,13 +1,82 @@
+import threading
+from multiprocessing.pool import ThreadPool
+
+from rip.resource_registry import ResourceRegistry
+from rip.route_match import Route, RouteMatch, SET_PART
 from rip.view.view_resource import ViewResource
 
 
+class RouteNode(object):
+    """
+    A node of the routing trie of an api. Its children are keyed by the
+    next part of the lookup key.
+    """
+    __slots__ = ('children', 'route', 'multiple_route')
+
+    def __init__(self):
+        self.children = {}
+        # Route of the lookup key ending here
+        self.route = None
+        # Route of the resource whose set route (`<resource>/set/<ids>`)
+        # ends here
+        self.multiple_route = None
+
+
 class Api(object):
-    def __init__(self, name, version='v1'):
+    def __init__(self, name, version='v1', thread_pool_size=0):
+        """
+        :param thread_pool_size: number of threads the api can use to run
+            independent reads concurrently, like the read requests of a
+            batch. 0 runs everything in the calling thread
+        """
         self.name = name
         self.version = version
         self.resources = {}
         self.actions = {}
         self.resources_lookup = {}
+        self.routes = RouteNode()
+        self.resource_registry = ResourceRegistry()
+        self.thread_pool_size = thread_pool_size
+        self._thread_pool = None
+        self._thread_pool_lock = threading.Lock()
+
+    def get_thread_pool(self):
+        """
+        :return: the thread pool of the api, created on first use. None if
+            the api has no thread pool
+        """
+        if not self.thread_pool_size:
+            return None
+        if self._thread_pool is None:
+            with self._thread_pool_lock:
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPool(self.thread_pool_size)
+        return self._thread_pool
+
+    def _add_route(self, lookup_key, endpoint, resource, multiple=False):
+        """
+        :param multiple: also route `<endpoint>/set/<ids>` to the resource
+        """
+        self.resources_lookup[lookup_key] = (endpoint, resource)
+        node = self.routes
+        for part in lookup_key.split('/'):
+            node = node.children.setdefault(part, RouteNode())
+        node.route = Route(endpoint, resource)
+        if multiple:
+            node.children.setdefault(SET_PART, RouteNode()).multiple_route = \
+                node.route
+
+    def _find_node(self, parts):
+        node = self.routes
+        for part in parts:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def _find_route(self, parts):
+        node = self._find_node(parts)
+        return node.route if node is not None else None
 
     def register_resource(self, endpoint, resource):
         if endpoint in self.resources or self.actions:
@@ -16,7 +85,8 @@ class Api(object):
                 format(endpoint=endpoint))
         elif isinstance(resource, ViewResource):
             self.resources[endpoint] = resource
-            self.resources_lookup[endpoint] = (endpoint, resource)
+            self._add_route(endpoint, endpoint, resource)
+            self.resource_registry.register(resource)
         elif endpoint.split('/')[-1] != resource.configuration['schema_cls'].\
                 _meta.schema_name:
             # This is a requirement to ensure resource_uri calculation and
@@ -28,22 +98,53 @@ class Api(object):
         else:
             self.resources[endpoint] = resource
             endpoint_parts = endpoint.split('/')[::2]
-            self.resources_lookup["/".join(endpoint_parts)] = (
-                endpoint, resource)
+            self._add_route("/".join(endpoint_parts), endpoint, resource,
+                            multiple=True)
+            self.resource_registry.register(resource)
+
+    def get_resource(self, resource_cls):
+        """
+        :return: the instance of resource_cls registered on the api,
+            a new one if none is registered
+        """
+        return self.resource_registry.get_instance(resource_cls)
 
     def register_action(self, action):
         pass
 
+    def _resolve_route(self, url_parts):
+        """
+        :return: tuple of the Route of the url, None if no resource matches
+            it, and whether the url is the set route of the resource
+        """
+        # the resource names of a url are at its even parts. View
+        # resources are looked up by the whole url too
+        route = self._find_route(url_parts[::2]) or \
+            self._find_route(url_parts)
+        if route is not None or len(url_parts) % 2 == 0:
+            return route, False
+
+        # `<list url>/set/<ids>`: the resource names of the list url, then
+        # the set node of the resource
+        node = self._find_node(url_parts[:-2][::2] + url_parts[-2:-1])
+        if node is None or node.multiple_route is None:
+            return None, False
+        return node.multiple_route, True
+
+    def match_route(self, url):
+        """
+        :return: RouteMatch of the url, None if no resource matches it
+        """
+        url_parts = url.split('/')
+        route, multiple = self._resolve_route(url_parts)
+        if route is None:
+            return None
+        return RouteMatch(url, url_parts, route, multiple=multiple)
+
     def resolve_resource(self, url):
-        url_parts = url.split('/')[::2]
-        lookup = self.resources_lookup.get("/".join(url_parts))
-        if not lookup:
-            lookup = self.resources_lookup.get(url)
-        return lookup[1] if lookup else None
+        route, _ = self._resolve_route(url.split('/'))
+        return route.resource if route else None
 
     def resolve_endpoint(self, url):
-        url_parts = url.split('/')[::2]
-        lookup = self.resources_lookup.get("/".join(url_parts))
-        if not lookup:
-            lookup = self.resources_lookup.get(url)
-        return lookup[0] if lookup else None
+        route, _ = self._resolve_route(url.split('/'))
+        return route.endpoint if route else None
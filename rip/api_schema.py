@@ -3,15 +3,99 @@ from rip.schema.base_field import BaseField, FieldTypes
 from rip.schema.sub_resource_field import SubResourceField
 
 
+class FrozenDict(dict):
+    """
+    A dict that can not be changed. The cached field indexes of a schema are
+    frozen, so that callers do not change them by mistake.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('{} can not be changed'.format(type(self).__name__))
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = \
+        update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class SchemaFields(dict):
+    """
+    The fields of a schema. Changing them calls on_change, which rebuilds
+    the field indexes of the schema.
+    """
+
+    def __init__(self, fields, on_change):
+        super(SchemaFields, self).__init__(fields)
+        self.on_change = on_change
+
+    def _changing(method):
+        def change(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self.on_change()
+            return result
+        change.__name__ = method.__name__
+        return change
+
+    __setitem__ = _changing(dict.__setitem__)
+    __delitem__ = _changing(dict.__delitem__)
+    clear = _changing(dict.clear)
+    pop = _changing(dict.pop)
+    popitem = _changing(dict.popitem)
+    setdefault = _changing(dict.setdefault)
+    update = _changing(dict.update)
+    del _changing
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
 class ApiSchemaOptions(object):
+    # sub-resources expanded when a request has no `expand` param.
+    # None expands all of them
+    default_expand = None
+    # serialize sub-resources that are not expanded as links
+    link_unexpanded = False
+
     def __init__(self, meta_options, fields, declared_fields):
         if meta_options:
             for override_name in dir(meta_options):
                 override = getattr(meta_options, override_name)
                 setattr(self, override_name, override)
 
-        self.fields = fields
+        # changed every time the indexes are rebuilt, so that what is
+        # cached from the fields, like serialization plans, can be dropped
+        self.fields_version = 0
+        self.fields = SchemaFields(fields, on_change=self.build_indexes)
         self.declared_fields = declared_fields
+        self.build_indexes()
+
+    def build_indexes(self):
+        """
+        Caches the views of the fields that are used on every request.
+        Changing `fields` rebuilds them.
+        """
+        self.fields_version += 1
+        fields = self.fields
+        self.non_readonly_fields = FrozenDict(
+            (field_name, field) for field_name, field in fields.items()
+            if field.field_type != FieldTypes.READONLY)
+        self.updatable_fields = FrozenDict(
+            (field_name, field) for field_name, field in fields.items()
+            if field.field_type == FieldTypes.DEFAULT)
+        self.sub_resource_fields = FrozenDict(
+            (field_name, field) for field_name, field in fields.items()
+            if isinstance(field, SubResourceField))
+        self.list_fields = FrozenDict(
+            (field_name, field) for field_name, field in fields.items()
+            if field.show_in_list)
+
+        self.non_readonly_field_names = frozenset(self.non_readonly_fields)
+        self.updatable_field_names = frozenset(self.updatable_fields)
+        # entity attribute of every field
+        self.entity_attributes = FrozenDict(
+            (field_name, field.entity_attribute or field_name)
+            for field_name, field in fields.items())
 
 
 class ApiSchemaMetaClass(type):
@@ -53,6 +137,26 @@ class ApiSchemaMetaClass(type):
 
         return new_class
 
+    def __setattr__(cls, name, value):
+        if isinstance(value, BaseField):
+            cls._add_field(name, value)
+        else:
+            super(ApiSchemaMetaClass, cls).__setattr__(name, value)
+
+    def _add_field(cls, field_name, field):
+        field.schema_cls = cls
+        cls._meta.declared_fields[field_name] = field
+        cls._meta.fields[field_name] = field
+        for subclass in cls.__subclasses__():
+            subclass._inherit_field(field_name, field)
+
+    def _inherit_field(cls, field_name, field):
+        if field_name in cls._meta.declared_fields:
+            return
+        cls._meta.fields[field_name] = field
+        for subclass in cls.__subclasses__():
+            subclass._inherit_field(field_name, field)
+
 
 class ApiSchema(six.with_metaclass(ApiSchemaMetaClass)):
     def __new__(cls, *args, **kwargs):
@@ -77,24 +181,16 @@ class ApiSchema(six.with_metaclass(ApiSchemaMetaClass)):
 
     @classmethod
     def non_readonly_fields(cls):
-        return {field_name: field for field_name, field in
-                cls._meta.fields.items()
-                if field.field_type != FieldTypes.READONLY}
+        return dict(cls._meta.non_readonly_fields)
 
     @classmethod
     def updatable_fields(cls):
-        return {field_name: field for field_name, field in
-                cls._meta.fields.items()
-                if field.field_type == FieldTypes.DEFAULT}
+        return dict(cls._meta.updatable_fields)
 
     @classmethod
     def sub_resource_fields(cls):
-        return {field_name: field for field_name, field in
-                cls._meta.fields.items()
-                if isinstance(field, SubResourceField)}
+        return dict(cls._meta.sub_resource_fields)
 
     @classmethod
     def list_fields(cls):
-        return {field_name: field for field_name, field in
-                cls._meta.fields.items()
-                if field.show_in_list}
+        return dict(cls._meta.list_fields)
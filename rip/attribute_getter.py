@@ -1,16 +1,201 @@
-def _get_from_dict(entity, field_name):
-    try:
-        return entity[field_name]
-    except (KeyError, TypeError):
-        raise AttributeError(u'{} not in {}'.format(field_name, entity))
+"""
+reads the value of a field from an entity. An entity is either a dict or an
+object. The entity attribute of a field can be a dotted path, like
+`profile.address.city`, which is followed through nested dicts and objects.
+A key named like the whole path, dots included, is read in preference to
+the path. Objects of a type are read by an attribute named like the whole
+path if the first object read has one.
 
+For hot paths, compile an accessor once and call it for every entity:
 
-def _get_from_object(entity, field_name):
-        return getattr(entity, field_name)
+    get_city = attribute_getter.compile_accessor('profile.address.city')
+    cities = [get_city(entity) for entity in entities]
 
+Accessors raise AttributeError if a part of the path is missing.
+"""
+import operator
+
+PATH_SEPARATOR = '.'
+
+# accessors compiled by get_accessor, per entity attribute
+_accessors = {}
+
+
+def _compile_part(field_name, get_next=None):
+    """
+    Compiles the getter of a single attribute, which passes the value on to
+    get_next (the getter of the rest of the path) if given. Whether an
+    entity is read as a dict or an object is decided once per entity type.
+    """
+    dict_types = {dict}
+    object_types = set()
+
+    def get_part(entity):
+        entity_type = type(entity)
+        if entity_type in object_types:
+            return getattr(entity, field_name)
+        if entity_type in dict_types:
+            try:
+                return entity[field_name]
+            except (KeyError, TypeError):
+                raise AttributeError(
+                    u'{} not in {}'.format(field_name, entity))
+
+        if issubclass(entity_type, dict):
+            dict_types.add(entity_type)
+        else:
+            object_types.add(entity_type)
+        return get_part(entity)
+
+    if get_next is None:
+        return get_part
+
+    def get_path(entity):
+        return get_next(get_part(entity))
+
+    return get_path
+
+
+def _compile_chain(field_names, entity):
+    """
+    Compiles the getter of a path for entities shaped like entity, chaining
+    an itemgetter for every dict along the path and an attrgetter for every
+    run of objects. An attribute named like a method of dicts is not
+    chained, since an attrgetter would read the method from a dict.
+
+    :return: the getter, None if entity misses a part of the path
+    """
+    getters = []
+    attribute_names = []
+    value = entity
+    for field_name in field_names:
+        if isinstance(value, dict):
+            if field_name not in value:
+                return None
+            if attribute_names:
+                getters.append(operator.attrgetter(
+                    PATH_SEPARATOR.join(attribute_names)))
+                attribute_names = []
+            getters.append(operator.itemgetter(field_name))
+            value = value[field_name]
+        elif hasattr(dict, field_name) or not hasattr(value, field_name):
+            return None
+        else:
+            attribute_names.append(field_name)
+            value = getattr(value, field_name)
+    if attribute_names:
+        getters.append(
+            operator.attrgetter(PATH_SEPARATOR.join(attribute_names)))
+
+    if len(getters) == 1:
+        return getters[0]
+
+    def get_chain(entity):
+        for getter in getters:
+            entity = getter(entity)
+        return entity
+
+    return get_chain
 
-def get_attribute(entity, field_name):
-    if isinstance(entity, dict):
-        return _get_from_dict(entity, field_name)
 
-    return _get_from_object(entity, field_name)
+def compile_accessor(entity_attribute):
+    """
+    Compiles the getter of entity_attribute. For a dotted path, whether an
+    entity type is read by the whole name or by the path, and the chain of
+    getters of the path, are decided from the first entity of the type. An
+    entity shaped differently from the first of its type is read part by
+    part.
+
+    :param entity_attribute: name of the attribute, or a dotted path
+    :return: function that reads entity_attribute from an entity
+    """
+    if PATH_SEPARATOR not in entity_attribute:
+        return _compile_part(entity_attribute)
+
+    field_names = entity_attribute.split(PATH_SEPARATOR)
+    get_each = None
+    for field_name in reversed(field_names):
+        get_each = _compile_part(field_name, get_each)
+    # getter of entity_attribute, per entity type
+    readers = {}
+
+    def compile_reader(entity):
+        if not isinstance(entity, dict):
+            if entity_attribute in getattr(entity, '__dict__', ()):
+                return lambda entity: vars(entity)[entity_attribute]
+            return _compile_chain(field_names, entity)
+        if entity_attribute in entity:
+            return None
+        get_chain = _compile_chain(field_names, entity)
+        if get_chain is None:
+            return None
+        return lambda entity: entity[entity_attribute] \
+            if entity_attribute in entity else get_chain(entity)
+
+    def get_dotted(entity):
+        read = readers.get(type(entity))
+        if read is None:
+            read = compile_reader(entity)
+            if read is None:
+                return entity[entity_attribute] \
+                    if isinstance(entity, dict) and \
+                    entity_attribute in entity else get_each(entity)
+            readers[type(entity)] = read
+        try:
+            return read(entity)
+        except (KeyError, TypeError, AttributeError):
+            return get_each(entity)
+
+    return get_dotted
+
+
+def compile_column_accessor(entity_attribute):
+    """
+    Compiles the reading of entity_attribute from all the entities of a
+    list. If the entities are all dicts or all objects, and none misses the
+    attribute, the values are read without a python call per entity.
+
+    :return: function(entities, default) that returns the list of values,
+        with default for the entities that miss the attribute
+    """
+    accessor = compile_accessor(entity_attribute)
+    if PATH_SEPARATOR in entity_attribute:
+        get_from_dicts = get_from_objects = accessor
+    else:
+        get_from_dicts = operator.itemgetter(entity_attribute)
+        get_from_objects = operator.attrgetter(entity_attribute)
+
+    def get_column(entities, default):
+        entity_types = set(map(type, entities))
+        if len(entity_types) == 1:
+            getter = get_from_dicts \
+                if issubclass(entity_types.pop(), dict) else get_from_objects
+            try:
+                return map(getter, entities)
+            except (KeyError, AttributeError):
+                pass
+
+        values = []
+        for entity in entities:
+            try:
+                values.append(accessor(entity))
+            except AttributeError:
+                values.append(default)
+        return values
+
+    return get_column
+
+
+def get_accessor(entity_attribute):
+    """
+    :return: compiled accessor of entity_attribute, shared by all callers
+    """
+    accessor = _accessors.get(entity_attribute)
+    if accessor is None:
+        accessor = _accessors[entity_attribute] = \
+            compile_accessor(entity_attribute)
+    return accessor
+
+
+def get_attribute(entity, field_name):
+    return get_accessor(field_name)(entity)
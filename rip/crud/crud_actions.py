@@ -2,9 +2,13 @@ class CrudActions(object):
     GET_AGGREGATES = 'get_aggregates'
     READ_LIST = 'read_list'
     READ_DETAIL = 'read_detail'
+    READ_MULTIPLE = 'read_multiple'
     CREATE_DETAIL = 'create_detail'
+    CREATE_LIST = 'create_list'
     DELETE_DETAIL = 'delete_detail'
     UPDATE_DETAIL = 'update_detail'
+    UPDATE_LIST = 'update_list'
+    DELETE_LIST = 'delete_list'
     CREATE_OR_UPDATE_DETAIL = 'create_or_update_detail'
     _reverse_dictionary = None
 
@@ -31,6 +35,20 @@ class CrudActions(object):
             cls.CREATE_OR_UPDATE_DETAIL
         )
 
+    @classmethod
+    def get_bulk_actions(cls):
+        """
+        Actions on many entities in one call. They are not in
+        get_all_actions, so a resource allows them only if it lists them in
+        its allowed_actions
+        """
+        return (
+            cls.READ_MULTIPLE,
+            cls.CREATE_LIST,
+            cls.UPDATE_LIST,
+            cls.DELETE_LIST,
+        )
+
 
 def _build_reverse_dictionary(cls):
     return {v: k for k, v in cls.__dict__.items() if
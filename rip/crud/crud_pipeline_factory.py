@@ -1,9 +1,12 @@
 from rip.crud.crud_actions import CrudActions
 from rip import pipeline_composer
 
+READ_RELATED_LIST = 'read_related_list'
+
 
 def read_detail_pipeline(configuration):
     entity_actions = configuration['entity_actions']
+    request_params_validation = configuration['request_params_validation']
     authentication = configuration['authentication']
     authorization = configuration['authorization']
     serializer = configuration['serializer']
@@ -15,6 +18,7 @@ def read_detail_pipeline(configuration):
         name=CrudActions.READ_DETAIL,
         pipeline=[
             authentication.authenticate,
+            request_params_validation.validate_read_detail_params,
             data_cleaner.clean_data_for_read_detail,
             entity_actions.read_detail,
             authorization.authorize_read_detail,
@@ -26,6 +30,32 @@ def read_detail_pipeline(configuration):
     return get_detail_pipeline
 
 
+def read_multiple_pipeline(configuration):
+    entity_actions = configuration['entity_actions']
+    request_params_validation = configuration['request_params_validation']
+    authentication = configuration['authentication']
+    authorization = configuration['authorization']
+    serializer = configuration['serializer']
+    data_cleaner = configuration['data_cleaner']
+    post_action_hooks = configuration['post_action_hooks']
+    response_converter = configuration['response_converter']
+
+    pipeline = pipeline_composer.compose_pipeline(
+        name=CrudActions.READ_MULTIPLE,
+        pipeline=[
+            authentication.authenticate,
+            request_params_validation.validate_read_detail_params,
+            data_cleaner.clean_data_for_read_multiple,
+            entity_actions.read_multiple,
+            authorization.authorize_read_multiple,
+            serializer.serialize_multiple,
+            post_action_hooks.read_multiple_hook,
+            response_converter.convert_serialized_data_to_response
+        ])
+
+    return pipeline
+
+
 def update_detail_pipeline(configuration):
     entity_actions = configuration['entity_actions']
     authentication = configuration['authentication']
@@ -94,9 +124,21 @@ def read_list_pipeline(configuration):
     post_action_hooks = configuration['post_action_hooks']
     response_converter = configuration['response_converter']
 
-    pipeline = pipeline_composer.compose_pipeline(
-        name=CrudActions.READ_LIST,
-        pipeline=[
+    if configuration.get('cursor_pagination'):
+        # pages are read after or before a cursor, instead of at an offset
+        pipeline = [
+            authentication.authenticate,
+            request_params_validation.validate_request_params,
+            request_params_validation.validate_cursor,
+            data_cleaner.clean_data_for_read_list_by_cursor,
+            authorization.add_read_list_filters,
+            entity_actions.read_list_by_cursor,
+            serializer.serialize_list_by_cursor,
+            post_action_hooks.read_list_hook,
+            response_converter.convert_serialized_data_to_response
+        ]
+    else:
+        pipeline = [
             authentication.authenticate,
             request_params_validation.validate_request_params,
             data_cleaner.clean_data_for_read_list,
@@ -105,6 +147,33 @@ def read_list_pipeline(configuration):
             serializer.serialize_list,
             post_action_hooks.read_list_hook,
             response_converter.convert_serialized_data_to_response
+        ]
+
+    return pipeline_composer.compose_pipeline(name=CrudActions.READ_LIST,
+                                              pipeline=pipeline)
+
+
+def read_related_list_pipeline(configuration):
+    """
+    Reads the entities of a list without serializing them. Sub-resource
+    fields use it to fetch the entities of many parents at once
+    """
+    entity_actions = configuration['entity_actions']
+    request_params_validation = configuration['request_params_validation']
+    authentication = configuration['authentication']
+    authorization = configuration['authorization']
+    data_cleaner = configuration['data_cleaner']
+    response_converter = configuration['response_converter']
+
+    pipeline = pipeline_composer.compose_pipeline(
+        name=READ_RELATED_LIST,
+        pipeline=[
+            authentication.authenticate,
+            request_params_validation.validate_request_params,
+            data_cleaner.clean_data_for_read_list,
+            authorization.add_read_list_filters,
+            entity_actions.fetch_entity_list,
+            response_converter.convert_entities_to_response
         ])
 
     return pipeline
@@ -136,6 +205,32 @@ def create_detail_pipeline(configuration):
     return pipeline
 
 
+def create_list_pipeline(configuration):
+    entity_actions = configuration['entity_actions']
+    authentication = configuration['authentication']
+    authorization = configuration['authorization']
+    schema_validation = configuration['schema_validation']
+    serializer = configuration['serializer']
+    data_cleaner = configuration['data_cleaner']
+    post_action_hooks = configuration['post_action_hooks']
+    response_converter = configuration['response_converter']
+
+    pipeline = pipeline_composer.compose_pipeline(
+        name=CrudActions.CREATE_LIST,
+        pipeline=[
+            authentication.authenticate,
+            schema_validation.validate_request_data_list,
+            data_cleaner.clean_data_for_create_list,
+            authorization.authorize_create_list,
+            entity_actions.create_list,
+            serializer.serialize_list,
+            post_action_hooks.create_list_hook,
+            response_converter.convert_serialized_data_to_response
+        ])
+
+    return pipeline
+
+
 def delete_detail_pipeline(configuration):
     entity_actions = configuration['entity_actions']
     authentication = configuration['authentication']
@@ -159,6 +254,56 @@ def delete_detail_pipeline(configuration):
     return pipeline
 
 
+def update_list_pipeline(configuration):
+    entity_actions = configuration['entity_actions']
+    authentication = configuration['authentication']
+    authorization = configuration['authorization']
+    request_params_validation = configuration['request_params_validation']
+    schema_validation = configuration['schema_validation']
+    data_cleaner = configuration['data_cleaner']
+    post_action_hooks = configuration['post_action_hooks']
+    response_converter = configuration['response_converter']
+
+    pipeline = pipeline_composer.compose_pipeline(
+        name=CrudActions.UPDATE_LIST,
+        pipeline=[
+            authentication.authenticate,
+            request_params_validation.validate_bulk_request_params,
+            schema_validation.validate_request_data_for_update_list,
+            data_cleaner.clean_data_for_update_list,
+            authorization.add_update_list_filters,
+            entity_actions.update_list,
+            post_action_hooks.update_list_hook,
+            response_converter.convert_affected_count_to_response
+        ])
+
+    return pipeline
+
+
+def delete_list_pipeline(configuration):
+    entity_actions = configuration['entity_actions']
+    authentication = configuration['authentication']
+    authorization = configuration['authorization']
+    request_params_validation = configuration['request_params_validation']
+    data_cleaner = configuration['data_cleaner']
+    post_action_hooks = configuration['post_action_hooks']
+    response_converter = configuration['response_converter']
+
+    pipeline = pipeline_composer.compose_pipeline(
+        name=CrudActions.DELETE_LIST,
+        pipeline=[
+            authentication.authenticate,
+            request_params_validation.validate_bulk_request_params,
+            data_cleaner.clean_data_for_delete_list,
+            authorization.add_delete_list_filters,
+            entity_actions.delete_list,
+            post_action_hooks.delete_list_hook,
+            response_converter.convert_affected_count_to_response
+        ])
+
+    return pipeline
+
+
 def get_aggregates_pipeline(configuration):
     entity_actions = configuration['entity_actions']
     authentication = configuration['authentication']
@@ -1,3 +1,4 @@
+from rip import error_types
 from rip.crud.decorators import validate_action
 from rip.generic_steps.default_authentication import \
     DefaultAuthentication
@@ -19,6 +20,7 @@ from rip.generic_steps.default_schema_serializer import \
 from rip.generic_steps.default_schema_validation import \
     DefaultSchemaValidation
 from rip.crud import crud_pipeline_factory
+from rip.response import Response
 
 
 class CrudResource(object):
@@ -58,6 +60,9 @@ class CrudResource(object):
     allowed_filters = {'id': (EQUALS)}     # allowed filters on entity
     default_limit = 20                     # page limit for get_list
     default_offset = 0                     # default page offset for get_list
+    cursor_pagination = False              # page get_list with a cursor
+                                           # param ordered by order_by,
+                                           # instead of offsets
 
     """
     schema_cls = None
@@ -67,6 +72,7 @@ class CrudResource(object):
     aggregate_by_fields = []
     default_offset = 0
     default_limit = 20
+    cursor_pagination = False
 
     authentication_cls = DefaultAuthentication
     authorization_cls = DefaultAuthorization
@@ -90,7 +96,8 @@ class CrudResource(object):
             order_by_fields=self.order_by_fields,
             aggregate_by_fields=self.aggregate_by_fields,
             default_offset=self.default_offset,
-            default_limit=self.default_limit)
+            default_limit=self.default_limit,
+            cursor_pagination=self.cursor_pagination)
 
         authentication = self.authentication_cls(schema_cls=self.schema_cls)
         authorization = self.authorization_cls(schema_cls=self.schema_cls)
@@ -123,6 +130,49 @@ class CrudResource(object):
             post_action_hooks=post_action_hooks,
             response_converter=response_converter,
             serializer=serializer))
+        self._setup_pipelines()
+
+    def _setup_pipelines(self):
+        """
+        Compiles the pipeline of every allowed action once, so that a call
+        to an action does not rebuild its pipeline from the configuration.
+        """
+        self.pipelines = {}
+        for action in self.allowed_actions:
+            self.pipelines[action] = self._compile_pipeline(action)
+
+    def _compile_pipeline(self, action):
+        pipeline_factory = getattr(crud_pipeline_factory,
+                                   '{}_pipeline'.format(action))
+        pipeline = pipeline_factory(configuration=self.configuration)
+        pipeline.resource_name = self.__class__.__name__
+        return pipeline
+
+    def get_pipeline(self, action):
+        """
+        Returns the compiled pipeline for an action, compiling it if it
+        is not in the registry yet
+
+        :param action: string as defined in CrudActions
+        :return: rip.pipeline_composer.PipelineComposer
+        """
+        pipeline = self.pipelines.get(action)
+        if pipeline is None:
+            pipeline = self.pipelines[action] = self._compile_pipeline(action)
+        return pipeline
+
+    def invalidate_pipelines(self, *actions):
+        """
+        Drops compiled pipelines from the registry. They are compiled again
+        from the configuration on their next call. Call this after swapping
+        a step in the configuration, or changing allowed_actions in place.
+
+        :param actions: actions to invalidate. All actions if none is given
+        """
+        # a new list makes the routes of the resource dispatch by it again
+        self.allowed_actions = list(self.allowed_actions)
+        for action in actions or list(self.pipelines):
+            self.pipelines.pop(action, None)
 
     def __new__(cls, *args, **kwargs):
         if cls.schema_cls is None:
@@ -158,8 +208,19 @@ class CrudResource(object):
         :param request: rip.Request
         :return: rip.Response
         """
-        pipeline = crud_pipeline_factory.read_detail_pipeline(
-            configuration=self.configuration)
+        pipeline = self.get_pipeline(CrudActions.READ_DETAIL)
+        return pipeline(request=request)
+
+    @validate_action
+    def read_multiple(self, request):
+        """
+        Implements the Read Multiple (read many objects by their ids)
+
+        maps to GET /api/objects/set/:id;:id;:id/
+        :param request: rip.Request with the ids in the id__in request param
+        :return: rip.Response with the objects found, and the ids not found
+        """
+        pipeline = self.get_pipeline(CrudActions.READ_MULTIPLE)
         return pipeline(request=request)
 
     @validate_action
@@ -171,8 +232,7 @@ class CrudResource(object):
         :param request: rip.Request
         :return: rip.Response
         """
-        pipeline = crud_pipeline_factory.update_detail_pipeline(
-            configuration=self.configuration)
+        pipeline = self.get_pipeline(CrudActions.UPDATE_DETAIL)
         return pipeline(request=request)
 
     @validate_action
@@ -184,8 +244,23 @@ class CrudResource(object):
         :param request: rip.Request
         :return: rip.Response
         """
-        pipeline = crud_pipeline_factory.read_list_pipeline(
-            configuration=self.configuration)
+        pipeline = self.get_pipeline(CrudActions.READ_LIST)
+        return pipeline(request=request)
+
+    def read_related_list(self, request):
+        """
+        Reads the entities of a list without serializing them. Allowed if
+        read_list is allowed. Sub-resource fields use it to load the
+        entities of many parents in one call.
+
+        :param request: rip.Request
+        :return: rip.Response with the entities as data
+        """
+        request.context_params['crud_action'] = CrudActions.READ_LIST
+        if not self.is_action_allowed(CrudActions.READ_LIST):
+            return Response(
+                is_success=False, reason=error_types.MethodNotAllowed)
+        pipeline = self.get_pipeline(crud_pipeline_factory.READ_RELATED_LIST)
         return pipeline(request=request)
 
     @validate_action
@@ -197,8 +272,19 @@ class CrudResource(object):
         :param request: rip.Request
         :return: rip.Response
         """
-        pipeline = crud_pipeline_factory.create_detail_pipeline(
-            configuration=self.configuration)
+        pipeline = self.get_pipeline(CrudActions.CREATE_DETAIL)
+        return pipeline(request=request)
+
+    @validate_action
+    def create_list(self, request):
+        """
+        Implements the Create List (create many objects in one call)
+
+        maps to POST /api/objects/ with a list of objects in rest semantics
+        :param request: rip.Request
+        :return: rip.Response
+        """
+        pipeline = self.get_pipeline(CrudActions.CREATE_LIST)
         return pipeline(request=request)
 
     @validate_action
@@ -210,8 +296,33 @@ class CrudResource(object):
         :param request: rip.Request
         :return: rip.Response
         """
-        pipeline = crud_pipeline_factory.delete_detail_pipeline(
-            configuration=self.configuration)
+        pipeline = self.get_pipeline(CrudActions.DELETE_DETAIL)
+        return pipeline(request=request)
+
+    @validate_action
+    def update_list(self, request):
+        """
+        Implements the Update List (partially update all the objects matching
+        the filters of the request)
+
+        maps to PATCH /api/objects/?filters in rest semantics
+        :param request: rip.Request
+        :return: rip.Response with the number of updated objects
+        """
+        pipeline = self.get_pipeline(CrudActions.UPDATE_LIST)
+        return pipeline(request=request)
+
+    @validate_action
+    def delete_list(self, request):
+        """
+        Implements the Delete List (delete all the objects matching the
+        filters of the request)
+
+        maps to DELETE /api/objects/?filters in rest semantics
+        :param request: rip.Request
+        :return: rip.Response with the number of deleted objects
+        """
+        pipeline = self.get_pipeline(CrudActions.DELETE_LIST)
         return pipeline(request=request)
 
     @validate_action
@@ -223,9 +334,7 @@ class CrudResource(object):
         :param request: rip.Request
         :return: rip.Response
         """
-        pipeline = crud_pipeline_factory.get_aggregates_pipeline(
-            configuration=self.configuration)
-
+        pipeline = self.get_pipeline(CrudActions.GET_AGGREGATES)
         return pipeline(request=request)
 
     @validate_action
@@ -238,7 +347,5 @@ class CrudResource(object):
        :return: rip.Response
        """
 
-        pipeline = crud_pipeline_factory.create_or_update_detail_pipeline(
-            configuration=self.configuration)
-
+        pipeline = self.get_pipeline(CrudActions.CREATE_OR_UPDATE_DETAIL)
         return pipeline(request=request)
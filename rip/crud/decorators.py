@@ -4,8 +4,10 @@ from rip.response import Response
 
 
 def validate_action(func):
+    # the action is resolved once, when the method is decorated
+    action = CrudActions.resolve_action(func.__name__)
+
     def wrapper(self, request):
-        action = CrudActions.resolve_action(func.__name__)
         request.context_params['crud_action'] = action
 
         if not self.is_action_allowed(action):
@@ -13,4 +15,6 @@ def validate_action(func):
                 is_success=False, reason=error_types.MethodNotAllowed)
         return func(self, request=request)
 
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
     return wrapper
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+keyset (cursor) pagination of read_list.
+
+A page is read after (or before) the position of a cursor instead of at an
+offset. The entities are ordered by a sort key: the `order_by` param of the
+request, with `id` appended to break ties. The cursor is an opaque string
+of the sort key and the serialized values of the sort key of the first or
+last entity of a page. Dates and datetimes are not serialized by their
+field, which drops the microseconds, but kept whole in the cursor, so that
+entities sharing a second are not skipped.
+
+Entity actions receive the position as a `keyset` filter: the entities
+strictly after `keyset.values` in the `keyset.order_by` order. The order_by
+filter is the same order, so a backend has one condition to implement, like
+`WHERE (name, id) > (%s, %s) ORDER BY name, id` for ascending orders.
+"""
+import base64
+import datetime
+import json
+
+import pytz
+
+from rip import filter_operators
+
+__all__ = ['NEXT', 'PREV', 'Keyset', 'encode_cursor', 'decode_cursor',
+           'get_sort_key', 'reverse_order']
+
+NEXT = 'next'
+PREV = 'prev'
+
+TIE_BREAKER = 'id'
+
+# values kept whole in a cursor instead of serialized by their field
+RAW_VALUE_TYPES = (datetime.date,)
+
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+DATE_FORMAT = '%Y-%m-%d'
+UTC_SUFFIX = 'Z'
+
+
+class Keyset(object):
+    """
+    The position of a cursor: the entities strictly after `values` in the
+    `order_by` order. order_by is a list of entity attributes, prefixed
+    with `-` for a descending order
+    """
+    __slots__ = ('order_by', 'values')
+
+    def __init__(self, order_by, values):
+        self.order_by = order_by
+        self.values = values
+
+    def __eq__(self, other):
+        return isinstance(other, Keyset) and \
+            self.order_by == other.order_by and self.values == other.values
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Keyset({!r}, {!r})'.format(self.order_by, self.values)
+
+
+def get_sort_key(order_by):
+    """
+    :param order_by: list of the field names of the order_by param
+    :return: order_by with the tie breaker appended, if it is not in it
+    """
+    sort_key = list(order_by)
+    field_names = [filter_operators.split_to_field_and_order_type(name)[0]
+                   for name in sort_key]
+    if TIE_BREAKER not in field_names:
+        sort_key.append(TIE_BREAKER)
+    return sort_key
+
+
+def reverse_order(order_by):
+    return [name[1:] if name.startswith(filter_operators.REVERSE_ORDER)
+            else filter_operators.REVERSE_ORDER + name
+            for name in order_by]
+
+
+def _encode_value(value):
+    """
+    json encoding of the dates and datetimes of a cursor, to the
+    microsecond. Aware datetimes are encoded in UTC.
+    """
+    if isinstance(value, datetime.datetime):
+        suffix = ''
+        if value.tzinfo is not None:
+            value = value.astimezone(pytz.UTC).replace(tzinfo=None)
+            suffix = UTC_SUFFIX
+        # isoformat, since strftime cannot format years before 1900
+        return {'datetime': value.replace(microsecond=0).isoformat() +
+                '.{:06d}'.format(value.microsecond) + suffix}
+    if isinstance(value, datetime.date):
+        return {'date': value.isoformat()}
+    raise TypeError('{!r} is not JSON serializable'.format(value))
+
+
+def _decode_value(value):
+    if value.keys() == ['datetime']:
+        encoded = value['datetime']
+        if encoded.endswith(UTC_SUFFIX):
+            return datetime.datetime.strptime(
+                encoded[:-len(UTC_SUFFIX)], DATETIME_FORMAT).replace(
+                tzinfo=pytz.UTC)
+        return datetime.datetime.strptime(encoded, DATETIME_FORMAT)
+    if value.keys() == ['date']:
+        return datetime.datetime.strptime(value['date'], DATE_FORMAT).date()
+    return value
+
+
+def encode_cursor(sort_key, values, direction):
+    """
+    :param sort_key: list of field names
+    :param values: the serialized values of the sort key fields, with the
+        dates and datetimes of RAW_VALUE_TYPES as they are
+    :param direction: NEXT to read the entities after the values, PREV to
+        read the entities before them
+    """
+    cursor = json.dumps([sort_key, values, direction],
+                        separators=(',', ':'), default=_encode_value)
+    return base64.urlsafe_b64encode(cursor).rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    :return: tuple of sort key, values and direction of the cursor
+    :raises ValueError: if the cursor is not valid
+    """
+    try:
+        cursor = str(cursor)
+        decoded = json.loads(base64.urlsafe_b64decode(
+            cursor + '=' * (-len(cursor) % 4)), object_hook=_decode_value)
+        sort_key, values, direction = decoded
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('invalid cursor')
+    if not isinstance(sort_key, list) or not isinstance(values, list) or \
+            len(sort_key) != len(values) or direction not in (NEXT, PREV):
+        raise ValueError('invalid cursor')
+    return sort_key, values, direction
@@ -1,15 +1,62 @@
-import calendar
 import datetime
 import pytz
 
-def datetime_to_timestamp(_date, timezone):
+EPOCH = datetime.datetime(1970, 1, 1)
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# tz objects by timezone name. pytz.timezone normalizes the name on every
+# call, so the tz objects are looked up once per name
+_timezones = {}
+
+
+def get_timezone(timezone):
+    tz = _timezones.get(timezone)
+    if tz is None:
+        tz = _timezones[timezone] = pytz.timezone(timezone)
+    return tz
+
+
+def _is_utc(tz):
+    return tz is pytz.UTC
+
+
+def _to_datetime(_date):
     if not hasattr(_date, "tzinfo"):
         _date = datetime.datetime.combine(_date, datetime.time())
-    return calendar.timegm(pytz.timezone(timezone).localize(_date).astimezone(
-        pytz.UTC).utctimetuple())
+    return _date
+
+
+def _seconds_since_epoch(naive_datetime):
+    # whole seconds, like calendar.timegm of the utctimetuple
+    delta = naive_datetime - EPOCH
+    return delta.days * SECONDS_PER_DAY + delta.seconds
+
+
+def _to_timestamp(_date, tz):
+    _date = _to_datetime(_date)
+    if _is_utc(tz):
+        if _date.tzinfo is not None:
+            raise ValueError('Not naive datetime (tzinfo is already set)')
+        return _seconds_since_epoch(_date)
+    return _seconds_since_epoch(_date - tz.localize(_date).utcoffset())
+
+
+def datetime_to_timestamp(_date, timezone):
+    return _to_timestamp(_date, get_timezone(timezone))
+
+
+def datetimes_to_timestamps(dates, timezone):
+    """
+    Converts a whole column of dates at once. None stays None.
+    """
+    tz = get_timezone(timezone)
+    return [None if _date is None else _to_timestamp(_date, tz)
+            for _date in dates]
 
 
 def timestamp_to_datetime(timestamp, timezone):
-    tz = pytz.timezone(timezone)
+    tz = get_timezone(timezone)
+    if _is_utc(tz):
+        return datetime.datetime.utcfromtimestamp(timestamp)
     tz_aware_datetime = datetime.datetime.fromtimestamp(timestamp, tz=tz)
     return tz_aware_datetime.replace(tzinfo=None)
@@ -1,48 +1,16 @@
-from rip.view.view_resource import ViewResource
+from rip.route_match import method_not_allowed
 
-method_to_action_mapping = {
-    'GET': 'read',
-    'POST': 'create',
-    'PATCH': 'update',
-    'DELETE': 'delete',
-    'PUT': 'create_or_update'
-}
 
-
-def is_detail_url(http_request, url):
-    if http_request.method == 'POST':
-        return True
-    return len(url.split('/')) % 2 == 0
-
-
-def determine_end_point(http_request, url):
-    """
-    returns detail, list or aggregates
+def resolve_route_action(http_request, route_match, many=False):
     """
-    if url.endswith('aggregates') or url.endswith('aggregates/'):
-        return 'aggregates'
-    else:
-        return 'detail' if is_detail_url(http_request, url) else 'list'
-
-
-def is_valid_resource(url, api):
-    return True if api.resolve_resource(url) else False
+    resolves the action of a url already matched by `Api.match_route`,
+    from the dispatch table of its route. Returns `method_not_allowed` for
+    the actions the resource does not allow
 
+    :param many: the request data is a list, like for create_list
+    """
+    return route_match.get_action(http_request.method, many=many)
 
-def resolve_action(http_request, url, api):
-    try:
-        resource = api.resolve_resource(url)
-        endpoint = determine_end_point(http_request, url)
-        if isinstance(resource, ViewResource):
-            action = resource.read
-        else:
-            if endpoint == 'aggregates':
-                resource_action = 'get_aggregates'
-            else:
-                resource_action = "%s_%s" % (
-                    method_to_action_mapping.get(http_request.method), endpoint)
-            action = getattr(resource, resource_action)
 
-        return action
-    except AttributeError:
-        return None
+def is_method_not_allowed(action):
+    return action is method_not_allowed
@@ -4,6 +4,7 @@ creates an api request given a django http request object
 from django import conf
 import simplejson
 
+from rip import resource_registry
 from rip.django_adapter import \
     metadata_factory
 from rip.request import Request
@@ -22,12 +23,23 @@ def _build_request_params(http_request, breadcrumb_filters):
     return request_params
 
 
-def _resolve_user(http_request):
+def resolve_user(http_request):
     return http_request.user \
         if not http_request.user.is_anonymous() \
         else None
 
 
+def _build_context_params(url, api, parent_breadcrumbs, thread_pool=None):
+    return {'protocol': 'http',
+            'url': url,
+            'api_name': api.name,
+            'api_version': api.version,
+            'timezone': conf.settings.TIME_ZONE,
+            'api_breadcrumbs': parent_breadcrumbs,
+            'thread_pool': thread_pool,
+            resource_registry.CONTEXT_PARAM: api.resource_registry}
+
+
 def build_request_data(request_body, request_meta):
     content_types = request_meta.get('CONTENT_TYPE', '').split(";")
     if request_body and 'application/json' in content_types:
@@ -40,19 +52,47 @@ def build_request_data(request_body, request_meta):
     return request_data
 
 
-def build_request(http_request, url, api, request_data, request_body):
-    endpoint = api.resolve_endpoint(url)
-    breadcrumb_filters = metadata_factory.api_breadcrumb_filters(url, endpoint)
-    parent_breadcrumbs = metadata_factory.api_breadcrumbs(url, endpoint)
+def build_request(http_request, url, api, request_data, request_body,
+                  route_match=None):
+    """
+    :param route_match: the RouteMatch of the url, if it is already matched
+    """
+    if route_match is not None:
+        breadcrumb_filters = route_match.breadcrumb_filters
+        parent_breadcrumbs = route_match.breadcrumbs
+    else:
+        endpoint = api.resolve_endpoint(url)
+        breadcrumb_filters = metadata_factory.api_breadcrumb_filters(
+            url, endpoint)
+        parent_breadcrumbs = metadata_factory.api_breadcrumbs(url, endpoint)
     return Request(
-        user=_resolve_user(http_request),
+        user=resolve_user(http_request),
         request_params=_build_request_params(http_request, breadcrumb_filters),
-        context_params={'protocol': 'http',
-                        'url': url,
-                        'api_name': api.name,
-                        'api_version': api.version,
-                        'timezone': conf.settings.TIME_ZONE,
-                        'api_breadcrumbs': parent_breadcrumbs},
+        context_params=_build_context_params(url, api, parent_breadcrumbs,
+                                             api.get_thread_pool()),
         data=request_data,
         request_headers=http_request.META,
         request_body=request_body)
+
+
+def build_sub_request(http_request, user, route_match, api, request_params,
+                      request_data):
+    """
+    creates the api request of one of the requests of a batch
+
+    :param user: the user of the batch, resolved once for all its requests
+    :param route_match: the RouteMatch of the url of the request
+
+    The requests of a batch may themselves run on the thread pool of the
+    api, so they are not given the thread pool: a request waiting on a
+    task queued behind it on the same pool would never finish.
+    """
+    request_params = dict(request_params or {})
+    request_params.update(route_match.breadcrumb_filters)
+    return Request(
+        user=user,
+        request_params=request_params,
+        context_params=_build_context_params(route_match.url, api,
+                                             route_match.breadcrumbs),
+        data=request_data,
+        request_headers=http_request.META)
@@ -0,0 +1,168 @@
+"""
+handles many api calls made in a single http request.
+
+The body of the http request is a json array of requests, like
+
+    [{"method": "GET", "url": "companies/1/teams", "params": {"limit": 5}},
+     {"method": "PATCH", "url": "companies/1", "body": {"name": "rip"}}]
+
+`url` is relative to the api, `method` defaults to GET, `params` are the
+query params and `body` is the data of the request (a list for actions on
+many entities, like create_list). The requests are
+dispatched in process to the actions of the api and the response is a json
+array of {"status": <http status code>, "body": <response data>}, in the
+order of the requests. The batch is authenticated once: a batch without
+a user gets a 401 response, and its requests all run as the user of the
+batch.
+
+If the api has a thread pool, consecutive GET requests at the start of a
+batch run concurrently in it, each on the database connection of its
+thread. Requests with other methods, and every request after the first of
+them, run one by one, in order, on the connection of the batch, so a read
+after a write in a batch sees the write. A request that raises an error
+gets a 500 response, and the other requests of the batch still run.
+"""
+from functools import partial
+import logging
+
+from django.http import HttpResponse, HttpResponseBadRequest, \
+    HttpResponseNotAllowed
+import simplejson
+
+from rip import error_types
+from rip.django_adapter import action_resolver, api_request_builder, \
+    db_connections, django_response_builder
+from rip.response import Response
+from rip.route_match import method_to_action_mapping
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 50
+
+READ_METHODS = frozenset(['GET'])
+
+
+def _bad_request(error_message):
+    return HttpResponseBadRequest(
+        simplejson.dumps({'error_message': error_message}),
+        content_type='application/json')
+
+
+def _error_result(status, error_message):
+    return {'status': status, 'body': {'error_message': error_message}}
+
+
+def get_method(sub_request):
+    """
+    :return: the http method of a request of the batch, None if the request
+        is not valid
+    """
+    if not isinstance(sub_request, dict):
+        return None
+    method = sub_request.get('method', 'GET')
+    return method.upper() if isinstance(method, basestring) else None
+
+
+def execute_sub_request(sub_request, http_request, user, api):
+    """
+    :return: dict of status and body of the response of the request
+    """
+    try:
+        return _execute_sub_request(sub_request, http_request, user, api)
+    except Exception:
+        logger.exception('request of a batch failed')
+        return _error_result(500, 'internal error')
+
+
+def _execute_sub_request(sub_request, http_request, user, api):
+    method = get_method(sub_request)
+    url = sub_request.get('url') if method is not None else None
+    if not isinstance(url, basestring):
+        return _error_result(400, 'request needs a url')
+    params = sub_request.get('params') or {}
+    data = sub_request.get('body') or {}
+    if not isinstance(params, dict):
+        return _error_result(400, 'params of a request should be an object')
+
+    route_match = api.match_route(url.strip('/'))
+    if route_match is None:
+        return _error_result(404, 'no resource at `{}`'.format(url))
+    action = route_match.get_action(method, many=isinstance(data, list)) \
+        if method in method_to_action_mapping else None
+    if action is None:
+        return _error_result(
+            405, '{} not allowed on `{}`'.format(method, url))
+
+    if action_resolver.is_method_not_allowed(action):
+        response = action(None)
+    else:
+        request = api_request_builder.build_sub_request(
+            http_request=http_request, user=user, route_match=route_match,
+            api=api, request_params=params, request_data=data)
+        response = action(request)
+    return {'status': django_response_builder.get_status_code(method,
+                                                              response),
+            'body': response.data}
+
+
+def execute_sub_requests(sub_requests, execute, thread_pool=None):
+    """
+    Executes the requests of a batch. With a thread pool, the read requests
+    before the first write are executed concurrently. A request run on the
+    thread pool closes the database connections of its thread. The other
+    requests are executed in the calling thread, so that they read the
+    writes of the batch on its connection, even if not yet committed.
+
+    :param execute: function executing a single request
+    :return: list of the results of execute, in the order of the requests
+    """
+    if thread_pool is None:
+        return [execute(sub_request) for sub_request in sub_requests]
+
+    read_count = 0
+    for sub_request in sub_requests:
+        if get_method(sub_request) not in READ_METHODS:
+            break
+        read_count += 1
+
+    execute_pooled = partial(db_connections.run_and_close_db_connections,
+                             execute)
+    results = list(thread_pool.map(execute_pooled,
+                                   sub_requests[:read_count])) \
+        if read_count > 1 else []
+    return results + [execute(sub_request)
+                      for sub_request in sub_requests[len(results):]]
+
+
+def handle_batch_call(http_request, api, max_batch_size=MAX_BATCH_SIZE):
+    if http_request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    sub_requests = api_request_builder.build_request_data(
+        http_request.read(), http_request.META)
+    if not isinstance(sub_requests, list):
+        error_message = sub_requests.get('error_message') \
+            if isinstance(sub_requests, dict) else None
+        return _bad_request(error_message or
+                            'expected a json array of requests')
+    if len(sub_requests) > max_batch_size:
+        return _bad_request(
+            'a batch can have at most {} requests'.format(max_batch_size))
+
+    user = api_request_builder.resolve_user(http_request)
+    if user is None:
+        return django_response_builder.build_http_response(
+            http_request, Response(is_success=False,
+                                   reason=error_types.AuthenticationFailed))
+
+    execute = partial(execute_sub_request, http_request=http_request,
+                      user=user, api=api)
+    results = execute_sub_requests(sub_requests, execute,
+                                   thread_pool=api.get_thread_pool())
+    return HttpResponse(status=200,
+                        content=simplejson.dumps(results),
+                        content_type='application/json')
+
+
+def create_batch_handler(api, max_batch_size=MAX_BATCH_SIZE):
+    return partial(handle_batch_call, api=api, max_batch_size=max_batch_size)
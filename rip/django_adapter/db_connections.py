@@ -0,0 +1,36 @@
+"""
+database connections of the threads of a thread pool.
+
+Django opens a database connection per thread and closes it at the end of
+an http request, in the thread that served it. The threads of a pool
+outlive the tasks they run, so a task using the database closes the
+connections of its thread when it is done; otherwise they stay open, and
+in a transaction, for the life of the pool.
+"""
+from django.conf import settings
+
+
+def close_db_connections():
+    """
+    Closes the database connections of the current thread. Call it at the
+    end of a task run on a thread pool, never in the thread of an http
+    request. Does nothing if the django settings are not loaded, since no
+    connection can be open then
+    """
+    if not settings.configured:
+        return
+    # django.db reads the settings when it is imported
+    from django import db
+    for connection in db.connections.all():
+        connection.close()
+
+
+def run_and_close_db_connections(func, *args):
+    """
+    :return: the result of func(*args), after closing the database
+        connections func opened
+    """
+    try:
+        return func(*args)
+    finally:
+        close_db_connections()
@@ -9,25 +9,41 @@ from rip.django_adapter import api_request_builder
 
 
 def handle_api_call(http_request, url, api):
-    if not action_resolver.is_valid_resource(url, api):
+    # the url is parsed once, and the route match is used from here on
+    route_match = api.match_route(url)
+    if route_match is None:
         return HttpResponseNotFound()
 
-    action = action_resolver.resolve_action(http_request, url, api)
+    action = action_resolver.resolve_route_action(http_request, route_match)
     if action is None:
         # we could not resolve what action to call for this http request.
         # return method not allowed response
         return HttpResponseNotAllowed("%s:%s" % (url, http_request.method))
+    if action_resolver.is_method_not_allowed(action) and \
+            action_resolver.is_method_not_allowed(
+                action_resolver.resolve_route_action(
+                    http_request, route_match, many=True)):
+        return django_response_builder.build_http_response(
+            http_request, action(None))
 
     request_body = http_request.read()
     request_data = api_request_builder.build_request_data(request_body, http_request.META)
-    if request_data.get('error_message'):
+    if isinstance(request_data, dict) and request_data.get('error_message'):
         return HttpResponseBadRequest(
             json.dumps(request_data), content_type='application/json')
+    if isinstance(request_data, list):
+        # a list of entities, like the data of create_list
+        action = action_resolver.resolve_route_action(
+            http_request, route_match, many=True)
+        if action is None:
+            return HttpResponseNotAllowed(
+                "%s:%s" % (url, http_request.method))
 
     request = api_request_builder.build_request(http_request=http_request,
                                                 url=url, api=api,
                                                 request_data=request_data,
-                                                request_body=request_body)
+                                                request_body=request_body,
+                                                route_match=route_match)
 
     response = action(request)
 
@@ -28,10 +28,37 @@ http_response_mapping = {
 }
 
 
+error_status_code_mapping = {
+    error_types.ObjectNotFound: 404,
+    error_types.ActionForbidden: 403,
+    error_types.AuthenticationFailed: 401,
+    error_types.InvalidData: 400,
+    error_types.MethodNotAllowed: 405
+}
+
+
+def _get_success_status_code(http_method, response):
+    status_code = http_status_code_mapping.get(http_method, 200)
+    if status_code == 204 and response.data:
+        # like the count of delete_list, which a 204 would drop
+        return 200
+    return status_code
+
+
+def get_status_code(http_method, response):
+    """
+    the http status code of the response of an action, without building the
+    http response
+    """
+    if response.is_success:
+        return _get_success_status_code(http_method, response)
+    return error_status_code_mapping[response.reason]
+
+
 def build_http_response(http_request, response):
     if response.is_success:
         return HttpResponse(
-            status=http_status_code_mapping[http_request.method],
+            status=_get_success_status_code(http_request.method, response),
             content=simplejson.dumps(response.data),
             content_type='application/json')
         # return a successful response
@@ -31,4 +31,15 @@ def transform_to_list(val):
     if isinstance(val, (list, tuple)):
         return val
     else:
-        return [val]
\ No newline at end of file
+        return [val]
+
+
+def split_to_list(val, separator=','):
+    """
+    returns the list of values of a param given either as a list or as
+    a single separated string
+    """
+    values = []
+    for item in transform_to_list(val):
+        values.extend(part for part in item.split(separator) if part)
+    return values
@@ -1,3 +1,7 @@
+from rip import attribute_getter, error_types
+from rip.pipeline_composer import is_pass_through_step, pass_through_step
+from rip.response import Response
+
 
 class DefaultAuthorization(object):
     """
@@ -13,6 +17,7 @@ class DefaultAuthorization(object):
     def __init__(self, schema_cls):
         self.schema_cls = schema_cls
 
+    @pass_through_step
     def add_read_list_filters(self, request):
         """
         This step is called before read_list entity action
@@ -24,7 +29,40 @@ class DefaultAuthorization(object):
         """
         return request
 
+    def add_update_list_filters(self, request):
+        """
+        This step is called before update_list entity action. Override this
+        to add request filters that limit the update to the objects the user
+        can update. Defaults to the filters of add_read_list_filters.
+        If authorize_update_detail is overridden, the entities are not
+        checked one by one, so the update is forbidden unless this step is
+        overridden too.
+
+        :param request:
+        :return: request if success, response if unauthorized
+        """
+        if not is_pass_through_step(self.authorize_update_detail):
+            return Response(is_success=False,
+                            reason=error_types.ActionForbidden)
+        return self.add_read_list_filters(request)
+
+    def add_delete_list_filters(self, request):
+        """
+        This step is called before delete_list entity action. Override this
+        to add request filters that limit the delete to the objects the user
+        can delete. Defaults to the filters of add_read_list_filters.
+        If authorize_delete_detail is overridden, the delete is forbidden
+        unless this step is overridden too, like add_update_list_filters.
 
+        :param request:
+        :return: request if success, response if unauthorized
+        """
+        if not is_pass_through_step(self.authorize_delete_detail):
+            return Response(is_success=False,
+                            reason=error_types.ActionForbidden)
+        return self.add_read_list_filters(request)
+
+    @pass_through_step
     def authorize_read_detail(self, request):
         """
         :param request:
@@ -32,6 +70,32 @@ class DefaultAuthorization(object):
         """
         return request
 
+    def authorize_read_multiple(self, request):
+        """
+        Authorizes each of the entities read by read_multiple with
+        authorize_read_detail, if it is overridden. The entities the user
+        may not read are reported as not found.
+
+        :param request:
+        :return: request with the entities the user may read
+        """
+        if is_pass_through_step(self.authorize_read_detail):
+            return request
+
+        context_params = request.context_params
+        get_id = attribute_getter.get_accessor(context_params['id_attribute'])
+        entities = []
+        for entity in context_params['entities']:
+            context_params['entity'] = entity
+            if isinstance(self.authorize_read_detail(request), Response):
+                context_params['not_found'].append(get_id(entity))
+            else:
+                entities.append(entity)
+        context_params.pop('entity', None)
+        context_params['entities'] = entities
+        return request
+
+    @pass_through_step
     def authorize_update_detail(self, request):
         """
         :param request:
@@ -39,6 +103,7 @@ class DefaultAuthorization(object):
         """
         return request
 
+    @pass_through_step
     def authorize_delete_detail(self, request):
         """
         :param request:
@@ -46,9 +111,34 @@ class DefaultAuthorization(object):
         """
         return request
 
+    @pass_through_step
     def authorize_create_detail(self, request):
         """
         :param request:
         :return: request if success, response if unauthorized
         """
         return request
+
+    def authorize_create_list(self, request):
+        """
+        The cleaned items to create are in request.context_params['data'].
+        Authorizes each of them with authorize_create_detail, if it is
+        overridden. The list is created only if every item is authorized.
+
+        :param request:
+        :return: request if success, response if unauthorized
+        """
+        if is_pass_through_step(self.authorize_create_detail):
+            return request
+
+        context_params = request.context_params
+        data_list = context_params['data']
+        try:
+            for data in data_list:
+                context_params['data'] = data
+                response = self.authorize_create_detail(request)
+                if isinstance(response, Response):
+                    return response
+        finally:
+            context_params['data'] = data_list
+        return request
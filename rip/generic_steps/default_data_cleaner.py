@@ -1,20 +1,33 @@
-from rip import filter_operators
+from rip import cursor_pagination, filter_operators
 from rip.crud.crud_actions import CrudActions
+from rip.generic_steps.default_request_params_validation import \
+    NON_FILTER_PARAMS
 
 
 class DefaultRequestCleaner(object):
+    # request params which are not filters on the entities, unless the
+    # schema has a field of the same name
+    non_filter_params = NON_FILTER_PARAMS
 
     def __init__(self, schema_cls):
         self.schema_cls = schema_cls
 
+    def is_non_filter_param(self, param_name):
+        return param_name in self.non_filter_params and \
+            param_name not in self.schema_cls._meta.fields
+
+    def get_non_filter_param(self, request, param_name):
+        """
+        :return: the value of a request param that is not a filter, None if
+            the request does not have it
+        """
+        if not self.is_non_filter_param(param_name):
+            return None
+        return request.request_params.get(param_name)
+
     def _get_attribute_name(self, field_name):
-        fields = self.schema_cls._meta.fields
-        if field_name not in fields:
-            cleaned_field_name = field_name
-        else:
-            field_obj = fields[field_name]
-            cleaned_field_name = field_obj.entity_attribute or field_name
-        return cleaned_field_name
+        return self.schema_cls._meta.entity_attributes.get(field_name,
+                                                           field_name)
 
 
     def _get_filter_value(self, request, field_name, value, filter_type):
@@ -48,6 +61,8 @@ class DefaultRequestCleaner(object):
         request_params = request.request_params
         request_filters = {}
         for filter_name in request_params.keys():
+            if self.is_non_filter_param(filter_name):
+                continue
             field_name, filter_type = filter_operators. \
                 split_to_field_and_filter_type(filter_name)
 
@@ -85,20 +100,149 @@ class DefaultRequestCleaner(object):
     def clean_data_for_read_list(self, request):
         request_filters = self.clean_request_params(request)
         request.context_params['request_filters'] = request_filters
+        request.context_params['expand'] = self.clean_expand(request)
+        total_count_mode = self.get_non_filter_param(request, 'total')
+        if total_count_mode is not None:
+            request.context_params['total_count_mode'] = total_count_mode
+
+        action = request.context_params.get('crud_action')
+        fields = self.clean_fields(request)
+        if fields is not None and action in (CrudActions.READ_LIST,
+                                             CrudActions.READ_DETAIL,
+                                             CrudActions.READ_MULTIPLE):
+            # keyed by schema, so that nested schemas are serialized whole.
+            # The projection lets get_entity_list fetch only these attributes
+            request.context_params['fields'] = {self.schema_cls: fields}
+            request_filters['fields'] = self.get_projection(fields)
+        return request
+
+    def clean_data_for_read_list_by_cursor(self, request):
+        """
+        Orders the entities by the sort key of the request and sets the
+        position of the cursor as the `keyset` filter. For a cursor to the
+        previous page, both are in the reverse order.
+
+        Sets the sort key (field names, in the order of the page) and the
+        direction of the cursor in the request context.
+        """
+        request = self.clean_data_for_read_list(request)
+        request_params = request.request_params
+        request_filters = request.context_params['request_filters']
+        sort_key = cursor_pagination.get_sort_key(
+            filter_operators.transform_to_list(
+                request_params.get('order_by', [])))
+
+        order_by = []
+        for name in sort_key:
+            field_name, order_type = \
+                filter_operators.split_to_field_and_order_type(name)
+            order_by.append((order_type or '') +
+                            self._get_attribute_name(field_name))
+
+        direction = cursor_pagination.NEXT
+        cursor = self.get_non_filter_param(request, 'cursor')
+        if cursor is not None:
+            _, values, direction = cursor_pagination.decode_cursor(cursor)
+            if direction == cursor_pagination.PREV:
+                order_by = cursor_pagination.reverse_order(order_by)
+            fields = self.schema_cls._meta.fields
+            cleaned_values = []
+            for name, value in zip(sort_key, values):
+                field_name, _ = \
+                    filter_operators.split_to_field_and_order_type(name)
+                field_obj = fields.get(field_name)
+                cleaned_values.append(
+                    value if field_obj is None or value is None or
+                    isinstance(value, cursor_pagination.RAW_VALUE_TYPES)
+                    else field_obj.clean(request, value))
+            request_filters['keyset'] = cursor_pagination.Keyset(
+                order_by, cleaned_values)
+        request_filters['order_by'] = order_by
+        request_filters.pop('offset', None)
+
+        # the cursors are made of the sort key of the entities
+        projection = request_filters.get('fields')
+        if projection is not None:
+            for name in order_by:
+                attribute_name, _ = \
+                    filter_operators.split_to_field_and_order_type(name)
+                if attribute_name not in projection:
+                    projection.append(attribute_name)
+
+        request.context_params['sort_key'] = sort_key
+        request.context_params['cursor_direction'] = direction
         return request
 
+    def clean_data_for_read_multiple(self, request):
+        """
+        Sets the ids to read, without duplicates, and the entity attribute
+        of the id in the request context
+        """
+        request = self.clean_data_for_read_list(request)
+        request_filters = request.context_params['request_filters']
+        id_attribute = self._get_attribute_name('id')
+        ids = []
+        for entity_id in filter_operators.transform_to_list(
+                request_filters.get(id_attribute +
+                                    filter_operators.OPERATOR_SEPARATOR +
+                                    filter_operators.IN, [])):
+            if entity_id not in ids:
+                ids.append(entity_id)
+        request.context_params['ids'] = ids
+        request.context_params['id_attribute'] = id_attribute
+
+        # the entities are matched to the ids by their id attribute
+        projection = request_filters.get('fields')
+        if projection is not None and id_attribute not in projection:
+            projection.append(id_attribute)
+        return request
+
+    def clean_fields(self, request):
+        """
+        :return: tuple of the field names asked for in the `fields` param,
+            None if the request does not have it
+        """
+        fields = self.get_non_filter_param(request, 'fields')
+        if fields is None:
+            return None
+        return tuple(filter_operators.split_to_list(fields))
+
+    def get_projection(self, field_names):
+        """
+        :return: list of the entity attributes needed for field_names
+        """
+        projection = []
+        for field_name in field_names:
+            attribute_name = self._get_attribute_name(field_name)
+            if attribute_name not in projection:
+                projection.append(attribute_name)
+        return projection
+
+    def clean_expand(self, request):
+        """
+        :return: tuple of the sub-resource names to expand, None if the
+            request does not have the expand param
+        """
+        expand = self.get_non_filter_param(request, 'expand')
+        if expand is None:
+            return None
+        return tuple(filter_operators.split_to_list(expand))
+
     def clean_data_for_get_aggregates(self, request):
         return self.clean_data_for_read_detail(request)
 
     def _get_fields_to_clean(self, request, data):
         action = request.context_params['crud_action']
-        non_read_only_fields = self.schema_cls.non_readonly_fields()
+        schema_options = self.schema_cls._meta
+        non_read_only_fields = schema_options.non_readonly_fields
 
-        if action in (CrudActions.UPDATE_DETAIL, CrudActions.CREATE_OR_UPDATE_DETAIL):
-            updatable_fields = self.schema_cls.updatable_fields()
-            field_names = set(data).intersection(set(updatable_fields))
-        elif action == CrudActions.CREATE_DETAIL:
-            field_names = set(data).intersection(set(non_read_only_fields))
+        if action in (CrudActions.UPDATE_DETAIL, CrudActions.UPDATE_LIST,
+                      CrudActions.CREATE_OR_UPDATE_DETAIL):
+            field_names = schema_options.updatable_field_names.intersection(
+                data)
+        elif action in (CrudActions.CREATE_DETAIL, CrudActions.CREATE_LIST):
+            field_names = schema_options.non_readonly_field_names.intersection(
+                data)
         else:
             field_names = []
 
@@ -118,6 +262,22 @@ class DefaultRequestCleaner(object):
         request = self.clean_data_for_read_detail(request)
         return request
 
+    def clean_data_for_create_list(self, request):
+        request.context_params['data'] = [self.clean(request, data)
+                                          for data in request.data]
+        request = self.clean_data_for_read_list(request)
+        return request
+
+    def clean_data_for_delete_list(self, request):
+        request.context_params['request_filters'] = \
+            self.clean_request_params(request)
+        return request
+
+    def clean_data_for_update_list(self, request):
+        request = self.clean_data_for_delete_list(request)
+        request.context_params['data'] = self.clean(request, request.data)
+        return request
+
     def clean_data_for_view_read(self, request):
         request_filters = self.clean_request_params(request)
         request.context_params['request_filters'] = request_filters
@@ -1,6 +1,22 @@
+import itertools
+
 from django.conf import settings
 from rip.response import Response
-from rip import error_types
+from rip import attribute_getter, cursor_pagination, error_types
+from rip.django_adapter import db_connections
+from rip.total_count import TotalCountCache, TotalCountModes, \
+    get_cache_key, resolve_mode
+
+
+def _take(entities, count):
+    """
+    :return: list of the first count entities. A sequence, like a list or
+        a lazy django queryset, is sliced, so that a queryset reads only
+        count rows. Any other iterable is read up to count entities
+    """
+    if hasattr(entities, '__getitem__'):
+        return list(entities[:count])
+    return list(itertools.islice(entities, count))
 
 
 class DefaultEntityActions(object):
@@ -13,11 +29,36 @@ class DefaultEntityActions(object):
     entity_list_total_count_property_name = 'total_count'
     detail_property_name = 'entity'
     updated_property_name = 'entity'
+    affected_count_property_name = 'affected_count'
+    not_found_property_name = 'not_found'
+    has_more_property_name = 'has_more'
+    cursor_direction_property_name = 'cursor_direction'
+    total_count_mode_property_name = 'total_count_mode'
+    thread_pool_property_name = 'thread_pool'
+
+    # how read_list computes the total count, one of TotalCountModes. The
+    # `total` request param can switch to a cheaper mode, not a costlier one
+    total_count_mode = TotalCountModes.EXACT
+    # seconds a total count is cached for, in the cached mode
+    total_count_cache_ttl = 60
+    max_cached_total_counts = 1024
+    # count the entities of read_list while the page is fetched, on the
+    # thread pool of the api (see `Api(thread_pool_size=...)`). Without a
+    # thread pool on the request, the count runs after the fetch. The count
+    # then runs in another thread, so with django it uses another database
+    # connection, in another transaction: the count and the page are not
+    # transactionally consistent. The count does not see the uncommitted
+    # writes of the request, and may see writes committed between the two
+    # reads, so the total can disagree with the page
+    concurrent_total_count = False
 
     def __init__(self, schema_cls, default_offset, default_limit):
         self.schema_cls = schema_cls
         self.default_limit = default_limit
         self.default_offset = default_offset
+        self.total_count_cache = TotalCountCache(
+            ttl=self.total_count_cache_ttl,
+            max_size=self.max_cached_total_counts)
 
     def get_limit_and_offset(self, request_filters):
         default_limit =  self.default_limit
@@ -35,22 +76,129 @@ class DefaultEntityActions(object):
         :param request: an apiv2 request object
         :return: request if successful with entities set on request
         """
-        request_filters = request.context_params.get(
+        request_filters = request.context_params.setdefault(
             self.request_filters_property, {})
-        request_filters.update(**self.get_limit_and_offset(request_filters))
-        entities = self.get_entity_list(request, **request_filters)
-        request.context_params[self.list_property_name] = entities
 
         # offset and limit don't make sense to get aggregates
         count_request_filters = request_filters.copy()
         count_request_filters.pop('offset', None)
         count_request_filters.pop('limit', None)
         count_request_filters.pop('order_by', None)
-        total_count = self.get_entity_list_total_count(request,
-                                                       **count_request_filters)
+        count_request_filters.pop('fields', None)
+        count_request_filters.pop('keyset', None)
+        total_count_mode = resolve_mode(
+            self.total_count_mode,
+            request.context_params.get(self.total_count_mode_property_name))
+
+        thread_pool = request.context_params.get(
+            self.thread_pool_property_name) \
+            if self.concurrent_total_count else None
+        if thread_pool is None or total_count_mode == TotalCountModes.NONE:
+            request = self.fetch_entity_list(request)
+            total_count, total_count_mode = self.count_entity_list(
+                request, total_count_mode, count_request_filters)
+        else:
+            request, (total_count, total_count_mode) = \
+                self._fetch_and_count_entity_list(
+                    request, thread_pool, total_count_mode,
+                    count_request_filters)
 
         request.context_params[self.entity_list_total_count_property_name] = \
             total_count
+        request.context_params[self.total_count_mode_property_name] = \
+            total_count_mode
+        return request
+
+    def read_list_by_cursor(self, request):
+        """
+        Reads a page after the `keyset` filter, like read_list. One more
+        entity than the limit is fetched to know if there are more entities
+        after the page. A page before a cursor is fetched in the reverse
+        order, and set in the order of the sort key.
+
+        :param request: an apiv2 request object
+        :return: request if successful with entities and has_more set on
+            request
+        """
+        context_params = request.context_params
+        request_filters = context_params.setdefault(
+            self.request_filters_property, {})
+        # no limit would read every entity on every page
+        limit = self.get_limit_and_offset(request_filters)['limit'] or \
+            self.default_limit
+        request_filters['limit'] = limit + 1
+        request_filters['offset'] = 0
+
+        request = self.read_list(request)
+        entities = list(context_params[self.list_property_name])
+        context_params[self.has_more_property_name] = len(entities) > limit
+        entities = entities[:limit]
+        if context_params.get(self.cursor_direction_property_name) == \
+                cursor_pagination.PREV:
+            entities.reverse()
+        context_params[self.list_property_name] = entities
+        request_filters['limit'] = limit
+        return request
+
+    def _fetch_and_count_entity_list(self, request, thread_pool,
+                                     total_count_mode, count_request_filters):
+        """
+        Counts the entities on the thread pool while the page is fetched in
+        the calling thread. The count is always waited for. If the fetch
+        fails, its error is raised and the result of the count is dropped.
+        Otherwise an error of the count is raised.
+
+        The count runs in its own database connection and transaction, so
+        it is not consistent with the page. The connection is closed when
+        the count is done.
+        """
+        pending_count = thread_pool.apply_async(
+            db_connections.run_and_close_db_connections,
+            (self.count_entity_list, request, total_count_mode,
+             count_request_filters))
+        try:
+            request = self.fetch_entity_list(request)
+        except Exception:
+            pending_count.wait()
+            raise
+        return request, pending_count.get()
+
+    def count_entity_list(self, request, total_count_mode, request_filters):
+        """
+        :param total_count_mode: one of TotalCountModes
+        :return: tuple of the total count and the mode that produced it
+        """
+        if total_count_mode == TotalCountModes.NONE:
+            return None, total_count_mode
+        if total_count_mode == TotalCountModes.ESTIMATE:
+            estimate = self.get_entity_list_total_count_estimate(
+                request, **request_filters)
+            if estimate is not None:
+                return estimate, total_count_mode
+        elif total_count_mode == TotalCountModes.CACHED:
+            cache_key = get_cache_key(request_filters, request.user)
+            if cache_key is not None:
+                total_count = self.total_count_cache.get(cache_key)
+                if total_count is None:
+                    total_count = self.get_entity_list_total_count(
+                        request, **request_filters)
+                    self.total_count_cache.set(cache_key, total_count)
+                return total_count, total_count_mode
+        return self.get_entity_list_total_count(request, **request_filters), \
+            TotalCountModes.EXACT
+
+    def fetch_entity_list(self, request):
+        """
+        Fetches the entities like read_list does, without counting them
+
+        :param request: an apiv2 request object
+        :return: request if successful with entities set on request
+        """
+        request_filters = request.context_params.setdefault(
+            self.request_filters_property, {})
+        request_filters.update(**self.get_limit_and_offset(request_filters))
+        entities = self.get_entity_list(request, **request_filters)
+        request.context_params[self.list_property_name] = entities
         return request
 
     def read_detail(self, request):
@@ -69,6 +217,29 @@ class DefaultEntityActions(object):
 
         return request
 
+    def read_multiple(self, request):
+        """
+        Reads the entities of all the ids of the request with a single call
+        to get_entity_list.
+
+        :param request: an apiv2 request object
+        :return: request with the entities found set on request, in the order
+            of the ids, and the ids not found
+        """
+        context_params = request.context_params
+        request_filters = context_params.get(self.request_filters_property, {})
+        get_id = attribute_getter.get_accessor(context_params['id_attribute'])
+        entities_by_id = {get_id(entity): entity for entity in
+                          self.get_entity_list(request, **request_filters)}
+
+        ids = context_params['ids']
+        context_params[self.list_property_name] = [
+            entities_by_id[entity_id] for entity_id in ids
+            if entity_id in entities_by_id]
+        context_params[self.not_found_property_name] = [
+            entity_id for entity_id in ids if entity_id not in entities_by_id]
+        return request
+
     def update_detail(self, request):
         """
         :param request: an apiv2 request object
@@ -100,9 +271,54 @@ class DefaultEntityActions(object):
         request.context_params[self.detail_property_name] = entity
         return request
 
+    def create_list(self, request):
+        """
+        :param request: an apiv2 request object
+        :return: request if successful with the created entities set on
+            request
+        """
+        entities = self.create_entities(request, request.context_params['data'])
+        request.context_params[self.list_property_name] = entities
+        request.context_params[self.entity_list_total_count_property_name] = \
+            len(entities)
+        return request
+
+    def get_bulk_filters(self, request):
+        """
+        :return: the request filters of update_list and delete_list, without
+            the params that make sense only for reading a list
+        """
+        request_filters = request.context_params[
+            self.request_filters_property].copy()
+        for param in ('offset', 'limit', 'order_by', 'fields'):
+            request_filters.pop(param, None)
+        return request_filters
+
+    def update_list(self, request):
+        """
+        :param request: an apiv2 request object
+        :return: request if successful with the number of updated entities
+            set on request
+        """
+        request.context_params[self.affected_count_property_name] = \
+            self.update_entities(request, self.get_bulk_filters(request),
+                                 request.context_params['data'])
+        return request
+
+    def delete_list(self, request):
+        """
+        :param request: an apiv2 request object
+        :return: request if successful with the number of deleted entities
+            set on request
+        """
+        request.context_params[self.affected_count_property_name] = \
+            self.delete_entities(request, self.get_bulk_filters(request))
+        return request
+
     def get_aggregates(self, request):
         request_filters = request.context_params[self.request_filters_property]
         request_filters['aggregate_by'] = request_filters.get('aggregate_by', [])
+        request_filters.pop('fields', None)
         aggregates = self.get_entity_aggregates(request,
                                         **request_filters)
         request.context_params[self.get_aggregates_property_name] = aggregates
@@ -117,8 +333,26 @@ class DefaultEntityActions(object):
     def get_entity_list_total_count(self, request, **kwargs):
         raise NotImplementedError
 
+    def get_entity_list_total_count_estimate(self, request, **kwargs):
+        """
+        Override this to estimate the total count cheaply, like from the
+        statistics of a table. Used in the estimate total count mode
+
+        :return: the estimated count, None to count exactly
+        """
+        return None
+
     def get_entity(self, request, **kwargs):
-        entities = self.get_entity_list(request, **kwargs)
+        """
+        Reads the entity of the filters with get_entity_list, limited to two
+        entities: enough to tell one entity from many, without reading every
+        match. Override this for a dedicated lookup of a single entity.
+
+        :return: the entity, None if no entity matches
+        :raises MultipleObjectsFound: if more than one entity matches
+        """
+        kwargs.update(offset=0, limit=2)
+        entities = _take(self.get_entity_list(request, **kwargs), 2)
         if len(entities) == 0:
             return None
         elif len(entities) > 1:
@@ -129,9 +363,46 @@ class DefaultEntityActions(object):
     def create_entity(self, request, **kwargs):
         raise NotImplementedError
 
+    def create_entities(self, request, items):
+        """
+        Creates an entity per item, one at a time. Override this to create
+        all of them in one call, like a bulk insert.
+
+        :param items: list of dicts of the cleaned data of each entity
+        :return: list of the created entities, in the order of items
+        """
+        return [self.create_entity(request, **item) for item in items]
+
     def delete_entity(self, request, entity):
         raise NotImplementedError
 
+    def update_entities(self, request, filters, update_params):
+        """
+        Updates the entities matching filters, one at a time. Override this
+        to update all of them in one call, like a single UPDATE statement.
+
+        :param filters: dict of the cleaned request filters
+        :param update_params: dict of the cleaned data to update
+        :return: number of updated entities
+        """
+        entities = self.get_entity_list(request, **filters)
+        for entity in entities:
+            self.update_entity(request, entity, **update_params)
+        return len(entities)
+
+    def delete_entities(self, request, filters):
+        """
+        Deletes the entities matching filters, one at a time. Override this
+        to delete all of them in one call.
+
+        :param filters: dict of the cleaned request filters
+        :return: number of deleted entities
+        """
+        entities = self.get_entity_list(request, **filters)
+        for entity in entities:
+            self.delete_entity(request, entity)
+        return len(entities)
+
     def get_entity_aggregates(self, request, **kwargs):
         raise NotImplementedError
 
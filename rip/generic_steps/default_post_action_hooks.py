@@ -1,23 +1,47 @@
+from rip.pipeline_composer import pass_through_step
+
 
 class DefaultPostActionHooks(object):
 
     def __init__(self, schema_cls):
         self.schema_cls = schema_cls
 
+    @pass_through_step
     def read_list_hook(self, request):
         return request
 
+    @pass_through_step
     def read_detail_hook(self, request):
         return request
 
+    @pass_through_step
+    def read_multiple_hook(self, request):
+        return request
+
+    @pass_through_step
     def create_detail_hook(self, request):
         return request
 
+    @pass_through_step
+    def create_list_hook(self, request):
+        return request
+
+    @pass_through_step
     def update_detail_hook(self, request):
         return request
 
+    @pass_through_step
     def delete_detail_hook(self, request):
         return request
 
+    @pass_through_step
+    def update_list_hook(self, request):
+        return request
+
+    @pass_through_step
+    def delete_list_hook(self, request):
+        return request
+
+    @pass_through_step
     def get_aggregates_hook(self, request):
         return request
@@ -1,9 +1,14 @@
-from rip import filter_operators
+from rip import cursor_pagination, filter_operators
 from rip.response import Response
 from rip import error_types
+from rip.total_count import TotalCountModes
 
 
-SPECIAL_FILTERS = ['offset', 'limit', 'aggregate_by', 'order_by']
+SPECIAL_FILTERS = ['offset', 'limit', 'aggregate_by', 'order_by', 'expand',
+                   'fields', 'total', 'cursor']
+# special filters which are filters on the entities if the schema has a
+# field of the same name
+NON_FILTER_PARAMS = ('expand', 'fields', 'total', 'cursor')
 
 class DefaultRequestParamsValidation(object):
     def __init__(self, schema_cls, filter_by_fields, order_by_fields, aggregate_by_fields):
@@ -12,6 +17,16 @@ class DefaultRequestParamsValidation(object):
         self.filter_by_fields = filter_by_fields
         self.schema_cls = schema_cls
 
+    def is_special_filter(self, filter_name):
+        if filter_name in NON_FILTER_PARAMS:
+            return filter_name not in self.schema_cls._meta.fields
+        return filter_name in SPECIAL_FILTERS
+
+    def _get_special_filter(self, request_params, filter_name, default=None):
+        if not self.is_special_filter(filter_name):
+            return default
+        return request_params.get(filter_name, default)
+
     def validate_order_by(self, request_params):
         order_by_params = request_params.get('order_by', [])
         order_by_params = filter_operators.transform_to_list(order_by_params)
@@ -42,6 +57,41 @@ class DefaultRequestParamsValidation(object):
             return validation_errors
         return None
 
+    def validate_expand(self, request_params):
+        expand_params = filter_operators.split_to_list(
+            self._get_special_filter(request_params, 'expand', []))
+        sub_resource_fields = self.schema_cls._meta.sub_resource_fields
+
+        validation_errors = {}
+        for field_name in expand_params:
+            if field_name not in sub_resource_fields:
+                validation_errors.update(
+                    {field_name: "Expanding this field is not allowed"})
+        if validation_errors:
+            return validation_errors
+        return None
+
+    def validate_fields(self, request_params):
+        fields_params = filter_operators.split_to_list(
+            self._get_special_filter(request_params, 'fields', []))
+        schema_fields = self.schema_cls._meta.fields
+
+        validation_errors = {}
+        for field_name in fields_params:
+            if field_name not in schema_fields:
+                validation_errors.update({field_name: "No such field"})
+        if validation_errors:
+            return validation_errors
+        return None
+
+    def validate_total(self, request_params):
+        total = self._get_special_filter(request_params, 'total',
+                                         TotalCountModes.EXACT)
+        if total not in TotalCountModes.ALL:
+            return {'total': 'Should be one of {}'.format(
+                ', '.join(TotalCountModes.ALL))}
+        return None
+
     def validate_offset(self, request_params):
         try:
             offset = request_params.get('offset', 0)
@@ -70,9 +120,15 @@ class DefaultRequestParamsValidation(object):
             validation_errors = self.validate_order_by(request_params)
         if validation_errors is None:
             validation_errors = self.validate_aggregate_by(request_params)
+        if validation_errors is None:
+            validation_errors = self.validate_expand(request_params)
+        if validation_errors is None:
+            validation_errors = self.validate_fields(request_params)
         if validation_errors is None:
             validation_errors = self.validate_limit(request_params) or \
                                 self.validate_offset(request_params)
+        if validation_errors is None:
+            validation_errors = self.validate_total(request_params)
 
         if validation_errors:
             return Response(is_success=False,
@@ -80,16 +136,76 @@ class DefaultRequestParamsValidation(object):
                             data=validation_errors)
         return request
 
+    def validate_read_detail_params(self, request):
+        """
+        Validates the params of read_detail and read_multiple. Their filters
+        come from the url, so only the params that shape the response are
+        validated
+        """
+        request_params = request.request_params
+        validation_errors = self.validate_expand(request_params) or \
+            self.validate_fields(request_params)
+
+        if validation_errors:
+            return Response(is_success=False,
+                            reason=error_types.InvalidData,
+                            data=validation_errors)
+        return request
+
+    def validate_cursor(self, request):
+        """
+        Validates the cursor of a read_list paged by cursor. The cursor
+        should be of the ordering of the request, and not used with offset.
+        """
+        request_params = request.request_params
+        cursor = self._get_special_filter(request_params, 'cursor')
+        if cursor is None:
+            return request
+
+        validation_errors = None
+        if 'offset' in request_params:
+            validation_errors = {'cursor': 'Cannot be used with offset'}
+        else:
+            try:
+                sort_key, values, direction = \
+                    cursor_pagination.decode_cursor(cursor)
+            except ValueError:
+                validation_errors = {'cursor': 'Invalid cursor'}
+            else:
+                order_by = filter_operators.transform_to_list(
+                    request_params.get('order_by', []))
+                if sort_key != cursor_pagination.get_sort_key(order_by):
+                    validation_errors = {
+                        'cursor': 'Cursor of another order_by'}
+
+        if validation_errors:
+            return Response(is_success=False,
+                            reason=error_types.InvalidData,
+                            data=validation_errors)
+        return request
+
+    def validate_bulk_request_params(self, request):
+        """
+        Validates the params of update_list and delete_list. They need at
+        least one filter, so that a call does not change every entity.
+        """
+        request_params = request.request_params
+        if all(self.is_special_filter(filter_name)
+               for filter_name in request_params):
+            return Response(is_success=False,
+                            reason=error_types.InvalidData,
+                            data={'filters': 'At least one filter is required'})
+        return self.validate_request_params(request)
+
     def _validate_fields(self, request_params):
         allowed_filters = self.filter_by_fields
 
-        special_filters = SPECIAL_FILTERS
         validation_errors = {}
         for filter_name in request_params:
             field_name, filter_type = filter_operators. \
                 split_to_field_and_filter_type(filter_name)
             if field_name not in allowed_filters and \
-                            field_name not in special_filters:
+                    not self.is_special_filter(field_name):
                 validation_errors.update(
                     {field_name: "Filtering not allowed"})
 
@@ -2,6 +2,8 @@ from rip.response import Response
 
 
 class DefaultResponseConverter(object):
+    entity_list_var = 'entities'
+    affected_count_var = 'affected_count'
 
     def __init__(self, schema_cls):
         self.schema_cls = schema_cls
@@ -11,4 +13,13 @@ class DefaultResponseConverter(object):
                         data=request.context_params['serialized_data'])
 
     def convert_to_simple_response(self, request):
-        return Response(is_success=True)
\ No newline at end of file
+        return Response(is_success=True)
+
+    def convert_affected_count_to_response(self, request):
+        return Response(is_success=True,
+                        data={'count': request.context_params[
+                            self.affected_count_var]})
+
+    def convert_entities_to_response(self, request):
+        return Response(is_success=True,
+                        data=request.context_params[self.entity_list_var])
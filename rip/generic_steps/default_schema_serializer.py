@@ -2,68 +2,242 @@
 serializes an entity or a list of entities to response data
 """
 
-from rip import filter_operators, attribute_getter
+import six
+
+from rip import cursor_pagination, filter_operators, attribute_getter
 from rip.crud.crud_actions import CrudActions
+from rip.total_count import TotalCountModes
+
+# value of a field missing on an entity
+MISSING = object()
 
 
 class DefaultEntitySerializer(object):
     entity_list_var = 'entities'
     entity_var = 'entity'
+    not_found_var = 'not_found'
     aggregates_var = 'entity_aggregates'
     serialized_data_var = 'serialized_data'
     serialized_data_var_pre_update = 'serialized_data_pre_update'
 
+    # methods that decide the fields to serialize. If a subclass overrides
+    # any of them, serialization plans are not cached, since the fields
+    # may then depend on more than the crud action, expand and fields params
+    fields_selection_methods = ('get_fields_to_serialize',
+                                'expand_sub_resource_fields',
+                                'select_requested_fields')
+    # the fields and expand params come from the client, so the number of
+    # cached plans is bounded
+    max_cached_plans = 256
+
     def __init__(self, schema_cls):
         self.schema_cls = schema_cls
+        self._serialization_plans = {}
+        # the fields_version of the schema the cached plans were compiled for
+        self._plans_fields_version = None
+        self._cache_serialization_plans = all(
+            six.get_unbound_function(getattr(type(self), method_name)) is
+            six.get_unbound_function(getattr(DefaultEntitySerializer,
+                                             method_name))
+            for method_name in self.fields_selection_methods)
+        # a subclass that overrides serialize_entity serializes the entities
+        # of a list with it too
+        self._serialize_entity_overridden = \
+            six.get_unbound_function(type(self).serialize_entity) is not \
+            six.get_unbound_function(DefaultEntitySerializer.serialize_entity)
 
     def get_fields_to_serialize(self, request):
         schema_fields = self.schema_cls._meta.fields
         if request.context_params.get('crud_action') == CrudActions.READ_LIST:
-            return self.schema_cls.list_fields()
+            fields = self.schema_cls.list_fields()
 
         elif request.context_params.get('crud_action') == \
                 CrudActions.GET_AGGREGATES:
             aggregate_by_fields = filter_operators.transform_to_list(
                 request.request_params.get('aggregate_by', []))
             return {key: schema_fields[key] for key in aggregate_by_fields}
-        return schema_fields
+        else:
+            fields = schema_fields
+
+        fields = self.expand_sub_resource_fields(request, fields)
+        return self.select_requested_fields(request, fields)
+
+    def select_requested_fields(self, request, fields):
+        """
+        Keeps only the fields asked for in the `fields` request param
+        (a sparse fieldset), if the request has it
+        """
+        requested_fields = request.context_params.get('fields', {}).get(
+            self.schema_cls)
+        if requested_fields is None:
+            return fields
+        return {field_name: field for field_name, field in fields.items()
+                if field_name in requested_fields}
+
+    def expand_sub_resource_fields(self, request, fields):
+        """
+        Embeds only the sub-resources asked for in the `expand` request
+        param. Without it, the `default_expand` Meta option of the schema
+        applies. If neither is set, all sub-resources in fields are embedded.
+        Sub-resources that are not expanded are left out, or serialized as
+        links if the `link_unexpanded` Meta option of the schema is set.
+        show_in_list still decides if a sub-resource has a link in a list.
+        """
+        expand = request.context_params.get('expand')
+        if expand is None:
+            expand = self.schema_cls._meta.default_expand
+        if expand is None:
+            return fields
+
+        link_unexpanded = self.schema_cls._meta.link_unexpanded
+        fields = fields.copy()
+        for field_name, field in \
+                self.schema_cls._meta.sub_resource_fields.items():
+            if field_name in expand:
+                fields[field_name] = field
+            elif link_unexpanded and field_name in fields:
+                fields[field_name] = field.link_field
+            else:
+                fields.pop(field_name, None)
+        return fields
 
     def serialize_aggregated_entity(self, request, aggregate_entity):
         aggregate_by_fields = self.get_fields_to_serialize(request)
 
         serialized = {}
         for field_name, field in aggregate_by_fields.items():
-            field_attribute = field.entity_attribute or field_name
-            serialized[field_name] = \
-                attribute_getter.get_attribute(aggregate_entity,
-                                               field_attribute)
+            get_value = attribute_getter.get_accessor(
+                field.entity_attribute or field_name)
+            serialized[field_name] = get_value(aggregate_entity)
         serialized['count'] = aggregate_entity['count']
         return serialized
 
-    def serialize_entity(self, request, entity):
+    def get_serialization_plan(self, request):
         """
-        @param: entity -> entity object returned by the entity_actions step
+        A serialization plan is a tuple of entries, one per field to
+        serialize, of
+        (field name, override, accessor, serialize, required,
+         column accessor, serialize many, serializes by column)
+        Plans are compiled once per crud action, expand and fields params,
+        and reused for every entity serialized. They are dropped when the
+        fields of the schema change.
         """
-        serialized = {}
-        fields_to_serialize = self.get_fields_to_serialize(request)
-        for field_name, field in fields_to_serialize.items():
+        fields_version = self.schema_cls._meta.fields_version
+        if fields_version != self._plans_fields_version:
+            self._serialization_plans = {}
+            self._plans_fields_version = fields_version
+        context_params = request.context_params
+        key = (context_params.get('crud_action'),
+               context_params.get('expand'),
+               context_params.get('fields', {}).get(self.schema_cls))
+        plan = self._serialization_plans.get(key)
+        if plan is None:
+            plan = self.compile_serialization_plan(request)
+            # the fields of aggregates depend on the aggregate_by param
+            if self._cache_serialization_plans and \
+                    key[0] != CrudActions.GET_AGGREGATES and \
+                    len(self._serialization_plans) < self.max_cached_plans:
+                self._serialization_plans[key] = plan
+        return plan
+
+    def compile_serialization_plan(self, request):
+        plan = []
+        for field_name, field in self.get_fields_to_serialize(request).items():
             field_override = getattr(self, 'serialize_%s' % field_name, None)
             if field_override:
-                serialized_value = field_override(request, entity)
+                accessor = get_column = None
             else:
                 entity_attribute = field.entity_attribute or field_name
+                accessor = attribute_getter.compile_accessor(entity_attribute)
+                get_column = attribute_getter.compile_column_accessor(
+                    entity_attribute)
+
+            # fields that load in batch (like sub-resources with batch set)
+            # load the values of all the entities of a list at once
+            if getattr(field, 'batch', False) and not field_override:
+                serialize_many = field.serialize_batch
+            else:
+                serialize_many = field.get_serialize_many()
 
+            plan.append((field_name, field_override, accessor,
+                         field.serialize, field.required, get_column,
+                         serialize_many, field.serializes_by_column()))
+        return tuple(plan)
+
+    def serialize_entity(self, request, entity):
+        """
+        @param: entity -> entity object returned by the entity_actions step
+        """
+        serialized = {}
+        for field_name, field_override, accessor, serialize, required, \
+                get_column, serialize_many, by_column in \
+                self.get_serialization_plan(request):
+            if field_override is not None:
+                value = field_override(request, entity)
+            else:
                 try:
-                    serialized_value = attribute_getter.get_attribute(
-                        entity, entity_attribute)
+                    value = accessor(entity)
                 except AttributeError as ex:
-                    if field.required:
+                    if required:
                         raise ex
                     continue
 
-            serialized[field_name] = field.serialize(request, serialized_value)
+            serialized[field_name] = serialize(request, value)
         return serialized
 
+    def serialize_entities(self, request, entity_list):
+        """
+        Serializes a list of entities column by column: the values of each
+        field are read from all the entities, and serialized together with
+        the serialize_many of the field. The rows are built at the end.
+        If serialize_entity, or the serialize of a field object, is
+        overridden, every entity is serialized with serialize_entity.
+        """
+        plan = self.get_serialization_plan(request)
+        if self._serialize_entity_overridden or \
+                not all(entry[-1] for entry in plan):
+            return [self.serialize_entity(request, entity)
+                    for entity in entity_list]
+        entity_list = list(entity_list)
+        if not entity_list:
+            return []
+        field_names, columns, sparse_field_names = [], [], []
+        for field_name, field_override, accessor, serialize, required, \
+                get_column, serialize_many, by_column in plan:
+            if field_override is not None:
+                values = [field_override(request, entity)
+                          for entity in entity_list]
+                column = serialize_many(request, values)
+            else:
+                values = get_column(entity_list, MISSING)
+                indexes = [index for index, value in enumerate(values)
+                           if value is not MISSING]
+                if len(indexes) == len(values):
+                    column = serialize_many(request, values)
+                elif required:
+                    raise AttributeError(
+                        u'{} missing on some entities'.format(field_name))
+                else:
+                    # leaves the field out of the entities missing it
+                    column = [MISSING] * len(values)
+                    serialized_values = serialize_many(
+                        request, [values[index] for index in indexes])
+                    for index, serialized_value in zip(indexes,
+                                                       serialized_values):
+                        column[index] = serialized_value
+                    sparse_field_names.append(field_name)
+
+            field_names.append(field_name)
+            columns.append(column)
+
+        rows = [dict(zip(field_names, row)) for row in zip(*columns)] \
+            if columns else [{} for entity in entity_list]
+        for field_name in sparse_field_names:
+            for row in rows:
+                if row[field_name] is MISSING:
+                    del row[field_name]
+        return rows
+
     def serialize_detail(self, request):
         """
         @param: request -> request object that will be converted into a response
@@ -86,13 +260,17 @@ class DefaultEntitySerializer(object):
         @param: request -> request object that will be converted into a response
         """
         entity_list = request.context_params[self.entity_list_var]
-        serialized_objects = [self.serialize_entity(request, entity) for
-                              entity in entity_list]
+        serialized_objects = self.serialize_entities(request, entity_list)
         request_filters = request.context_params.get('request_filters', {})
-        serialized_meta = {'offset': int(request_filters['offset']),
+        # a list of created entities has no offset and limit
+        serialized_meta = {'offset': int(request_filters.get('offset', 0)),
                            # handles null case. Legacy requirements
-                           'limit': int(request_filters['limit'] or 0),
+                           'limit': int(request_filters.get('limit') or 0),
                            'total': request.context_params['total_count']}
+        # a total that is not an exact count says how it was produced
+        total_count_mode = request.context_params.get('total_count_mode')
+        if total_count_mode not in (None, TotalCountModes.EXACT):
+            serialized_meta['total_mode'] = total_count_mode
 
         data = dict(meta=serialized_meta,
                     objects=serialized_objects)
@@ -100,6 +278,76 @@ class DefaultEntitySerializer(object):
         request.context_params[self.serialized_data_var] = data
         return request
 
+    def get_cursor(self, request, entity, direction):
+        """
+        :return: cursor to the entities after (or before, for PREV) entity,
+            in the sort key order of the request
+        """
+        schema_options = self.schema_cls._meta
+        sort_key = request.context_params['sort_key']
+        values = []
+        for name in sort_key:
+            field_name, _ = filter_operators.split_to_field_and_order_type(
+                name)
+            field = schema_options.fields.get(field_name)
+            value = attribute_getter.get_attribute(
+                entity, schema_options.entity_attributes.get(field_name,
+                                                             field_name))
+            if field is not None and value is not None and \
+                    not isinstance(value, cursor_pagination.RAW_VALUE_TYPES):
+                value = field.serialize(request, value)
+            values.append(value)
+        return cursor_pagination.encode_cursor(sort_key, values, direction)
+
+    def serialize_list_by_cursor(self, request):
+        """
+        Serializes a page of read_list paged by cursor. The meta has the
+        cursors of the next and previous pages instead of an offset. A
+        cursor is null if there is no such page.
+        """
+        context_params = request.context_params
+        entity_list = context_params[self.entity_list_var]
+        has_more = context_params.get('has_more', False)
+        if context_params.get('cursor_direction') == cursor_pagination.PREV:
+            has_next, has_prev = True, has_more
+        else:
+            has_next = has_more
+            has_prev = 'keyset' in context_params.get('request_filters', {})
+
+        next_cursor = prev_cursor = None
+        if entity_list and has_next:
+            next_cursor = self.get_cursor(request, entity_list[-1],
+                                          cursor_pagination.NEXT)
+        if entity_list and has_prev:
+            prev_cursor = self.get_cursor(request, entity_list[0],
+                                          cursor_pagination.PREV)
+
+        request_filters = context_params.get('request_filters', {})
+        serialized_meta = {'limit': int(request_filters.get('limit') or 0),
+                           'total': context_params['total_count'],
+                           'next': next_cursor,
+                           'prev': prev_cursor}
+        total_count_mode = context_params.get('total_count_mode')
+        if total_count_mode not in (None, TotalCountModes.EXACT):
+            serialized_meta['total_mode'] = total_count_mode
+
+        context_params[self.serialized_data_var] = dict(
+            meta=serialized_meta,
+            objects=self.serialize_entities(request, entity_list))
+        return request
+
+    def serialize_multiple(self, request):
+        """
+        Serializes the entities of read_multiple, with the ids that were not
+        found
+        """
+        entity_list = request.context_params[self.entity_list_var]
+        data = dict(objects=self.serialize_entities(request, entity_list),
+                    not_found=request.context_params[self.not_found_var])
+
+        request.context_params[self.serialized_data_var] = data
+        return request
+
     def serialize_entity_aggregates(self, request):
         aggregates = request.context_params[self.aggregates_var]
         serialized_data = [self.serialize_aggregated_entity(request, aggregate)
@@ -11,13 +11,14 @@ class DefaultSchemaValidation(object):
 
     def _get_fields_to_validate_data(self, request, data):
         action = request.context_params['crud_action']
-        non_read_only_fields = self.schema_cls.non_readonly_fields()
-        if action == CrudActions.UPDATE_DETAIL:
-            updatable_fields = self.schema_cls.updatable_fields()
-            field_names = set(data).intersection(set(updatable_fields))
+        schema_options = self.schema_cls._meta
+        non_read_only_fields = schema_options.non_readonly_fields
+        if action in (CrudActions.UPDATE_DETAIL, CrudActions.UPDATE_LIST):
+            field_names = schema_options.updatable_field_names.intersection(
+                data)
         elif action == CrudActions.CREATE_OR_UPDATE_DETAIL:
-            field_names = self.schema_cls.updatable_fields()
-        elif action == CrudActions.CREATE_DETAIL:
+            field_names = schema_options.updatable_field_names
+        elif action in (CrudActions.CREATE_DETAIL, CrudActions.CREATE_LIST):
             field_names = non_read_only_fields.keys()
         else:
             field_names = []
@@ -51,3 +52,37 @@ class DefaultSchemaValidation(object):
                             data=errors)
         else:
             return request
+
+    def validate_request_data_for_update_list(self, request):
+        """
+        Validates the data of update_list, which is applied to every entity
+        that matches the filters. It should be a non-empty object
+        """
+        data = request.data
+        if type(data) != dict or not data:
+            return Response(is_success=False, reason=error_types.InvalidData,
+                            data="This should be a non-empty object.")
+        return self.validate_request_data(request)
+
+    def validate_request_data_list(self, request):
+        """
+        Validates every item of a list of objects. The errors are reported
+        per item, keyed by the index of the item in the list
+        """
+        data_list = request.data
+        if type(data_list) != list or not data_list:
+            return Response(is_success=False, reason=error_types.InvalidData,
+                            data="This should be a non-empty list of objects.")
+
+        errors = {}
+        for index, data in enumerate(data_list):
+            if type(data) != dict:
+                errors[index] = "This item should be an object."
+                continue
+            item_errors = self.validate_data(request, data=data)
+            if item_errors:
+                errors[index] = item_errors
+        if errors:
+            return Response(is_success=False, reason=error_types.InvalidData,
+                            data=errors)
+        return request
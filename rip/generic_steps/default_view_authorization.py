@@ -1,3 +1,7 @@
+from rip.pipeline_composer import pass_through_step
+
+
 class DefaultViewAuthorization(object):
+    @pass_through_step
     def authorize_read(self, request):
         return request
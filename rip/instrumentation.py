@@ -0,0 +1,136 @@
+"""
+opt-in latency instrumentation of pipeline steps.
+
+Once enabled, every pipeline records the wall and cpu time spent in each of
+its steps, keyed by resource name, pipeline name and step name. The timings
+are aggregated in process into latency histograms.
+
+    from rip import instrumentation
+    instrumentation.enable()
+    ...
+    instrumentation.get_step_latencies()
+
+When disabled (the default), pipelines only pay for a single check of the
+`recorder` attribute of this module.
+"""
+import bisect
+import threading
+import time
+
+__all__ = ['enable', 'disable', 'is_enabled', 'get_step_latencies', 'reset',
+           'LatencyHistogram', 'LatencyRecorder']
+
+# upper bounds (in seconds) of the histogram buckets: 10us doubling up to ~80s
+BUCKET_BOUNDS = tuple(10e-6 * 2 ** power for power in range(24))
+
+# cpu time of the process. time.clock is the cpu clock on python 2 (posix)
+cpu_clock = getattr(time, 'process_time', None) or time.clock
+wall_clock = time.time
+
+recorder = None
+
+
+class LatencyHistogram(object):
+    """
+    A histogram of latencies with exponential buckets. Percentiles are
+    estimated as the upper bound of the bucket they fall in.
+    """
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        self.bucket_counts[bisect.bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        if not self.count:
+            return None
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                break
+        if index == len(BUCKET_BOUNDS):
+            return self.max
+        return min(BUCKET_BOUNDS[index], self.max)
+
+    def summary(self):
+        return dict(count=self.count,
+                    mean=self.total / self.count if self.count else None,
+                    p50=self.percentile(50),
+                    p95=self.percentile(95),
+                    p99=self.percentile(99),
+                    max=self.max)
+
+
+class LatencyRecorder(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def record(self, resource_name, pipeline_name, step_name, wall_time,
+               cpu_time):
+        key = (resource_name, pipeline_name, step_name)
+        with self._lock:
+            histograms = self._histograms.get(key)
+            if histograms is None:
+                histograms = self._histograms[key] = (LatencyHistogram(),
+                                                      LatencyHistogram())
+            histograms[0].record(wall_time)
+            histograms[1].record(cpu_time)
+
+    def get_step_latencies(self):
+        """
+        :return: dict of (resource name, pipeline name, step name) to
+            dict(wall=summary, cpu=summary). Latencies are in seconds
+        """
+        with self._lock:
+            return {key: dict(wall=wall.summary(), cpu=cpu.summary())
+                    for key, (wall, cpu) in self._histograms.items()}
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+
+
+def enable():
+    global recorder
+    if recorder is None:
+        recorder = LatencyRecorder()
+    return recorder
+
+
+def disable():
+    global recorder
+    recorder = None
+
+
+def is_enabled():
+    return recorder is not None
+
+
+def get_step_latencies():
+    return recorder.get_step_latencies() if recorder is not None else {}
+
+
+def reset():
+    if recorder is not None:
+        recorder.reset()
+
+
+def get_step_name(handler):
+    name = getattr(handler, '__name__', None)
+    if name is None:
+        return str(handler)
+    owner = getattr(handler, '__self__', None)
+    if owner is not None:
+        return '{}.{}'.format(type(owner).__name__, name)
+    return name
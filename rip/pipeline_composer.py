@@ -1,20 +1,66 @@
+import random
+
+from rip import instrumentation
 from rip.request import Request
 from rip.response import Response
 
-__all__ = ["PipelineComposer"]
+__all__ = ["PipelineComposer", "pass_through_step"]
+
+
+def pass_through_step(func):
+    """
+    Marks a step that returns the request it is given without looking at it.
+    Such steps are dropped from a pipeline when it is composed. Overriding
+    the step in a subclass (without this decorator) keeps it in the pipeline.
+    """
+    func.is_pass_through_step = True
+    return func
+
+
+def is_pass_through_step(handler):
+    # compare with True, so that mock steps are not elided
+    return getattr(handler, 'is_pass_through_step', False) is True
 
 
 class PipelineComposer(object):
     """
     An action helps to compose a series of handlers into a pipeline. The output of a handler is passed as the input
     to the next handler. If a handler returns a reponse, the pipeline is exited and the response returned.
+
+    Every step is checked to return a request or a response object. In production, set `trusted_steps` to skip these
+    checks on the hot path. The checks then run only for a `contract_sample_rate` fraction of the calls.
+
+    Steps marked with `pass_through_step` are left out of the pipeline.
     """
+    trusted_steps = False
+    contract_sample_rate = 0.0
 
-    def __init__(self, name=None, pipeline=None):
+    def __init__(self, name=None, pipeline=None, resource_name=None):
         self.name = name
-        self.pipeline = pipeline or []
+        self.pipeline = [handler for handler in pipeline or []
+                         if not is_pass_through_step(handler)]
+        self.resource_name = resource_name
+        self._step_names = None
+
+        for handler in self.pipeline:
+            assert callable(handler), \
+                "{handler_name} in pipeline `{pipeline_name}` is not callable".format(
+                    handler_name=str(handler), pipeline_name=self.name)
 
     def __call__(self, request):
+        if instrumentation.recorder is not None:
+            return self._call_instrumented(request, instrumentation.recorder)
+
+        if self.trusted_steps and not (
+                self.contract_sample_rate and
+                random.random() < self.contract_sample_rate):
+            for handler in self.pipeline:
+                response = handler(request=request)
+                if isinstance(response, Response):
+                    return response
+            raise AssertionError(
+                "pipeline `{pipeline_name}` did not return a response object".format(
+                    pipeline_name=self.name))
 
         pipeline = self.pipeline
 
@@ -32,6 +78,31 @@ class PipelineComposer(object):
 
         return response
 
+    def _call_instrumented(self, request, recorder):
+        if self._step_names is None:
+            self._step_names = [instrumentation.get_step_name(handler)
+                                for handler in self.pipeline]
+        wall_clock = instrumentation.wall_clock
+        cpu_clock = instrumentation.cpu_clock
+
+        for handler, step_name in zip(self.pipeline, self._step_names):
+            wall_start, cpu_start = wall_clock(), cpu_clock()
+            response = handler(request=request)
+            recorder.record(self.resource_name, self.name, step_name,
+                            wall_clock() - wall_start,
+                            cpu_clock() - cpu_start)
+            assert type(response) in [Request, Response], \
+                "handle_request of {handler_name} handler did not return a request or a response object".format(
+                    handler_name=str(handler))
+            if isinstance(response, Response):
+                break
+
+        assert isinstance(response, Response), \
+            "pipeline `{pipeline_name}` did not return a response object".format(
+                pipeline_name=self.name)
+
+        return response
+
 
 def compose_pipeline(name, pipeline):
     return PipelineComposer(name=name, pipeline=pipeline)
@@ -0,0 +1,53 @@
+"""
+keeps one shared instance per resource class.
+
+Resources hold no per-request state, so a single instance can serve every
+request. Every Api has a registry of the resources registered on it, and
+the requests it builds carry that registry, so that sub-resource fields
+reuse the instances of their api instead of instantiating their resource
+for every value they serialize. Requests not built by an api use the
+default registry.
+"""
+
+__all__ = ['ResourceRegistry', 'default_registry', 'get_registry',
+           'get_instance']
+
+# context param of a request holding the registry of its api
+CONTEXT_PARAM = 'resource_registry'
+
+
+class ResourceRegistry(object):
+    def __init__(self):
+        self._instances = {}
+
+    def register(self, resource):
+        self._instances[type(resource)] = resource
+
+    def get_instance(self, resource_cls):
+        """
+        Returns the registered instance of resource_cls. An instance is
+        created and registered if there isn't one yet
+        """
+        resource = self._instances.get(resource_cls)
+        if resource is None:
+            resource = self._instances.setdefault(resource_cls,
+                                                  resource_cls())
+        return resource
+
+    def clear(self):
+        self._instances.clear()
+
+
+default_registry = ResourceRegistry()
+
+
+def get_registry(request):
+    """
+    :return: the registry of the api of the request, the default registry
+        if the request was not built by an api
+    """
+    return request.context_params.get(CONTEXT_PARAM) or default_registry
+
+
+def get_instance(resource_cls, request):
+    return get_registry(request).get_instance(resource_cls)
@@ -0,0 +1,212 @@
+"""
+the result of matching a url against the endpoints of an api. The url is
+split once, and everything that depends on it (the resource, the kind of
+endpoint, the breadcrumbs and the breadcrumb filters) is read from the
+route match.
+"""
+from rip import error_types, filter_operators
+from rip.response import Response
+from rip.view.view_resource import ViewResource
+
+method_to_action_mapping = {
+    'GET': 'read',
+    'POST': 'create',
+    'PATCH': 'update',
+    'DELETE': 'delete',
+    'PUT': 'create_or_update'
+}
+
+
+# a url like `persons/set/1;2;3` reads the entities with ids 1, 2 and 3
+SET_PART = 'set'
+IDS_SEPARATOR = ';'
+IDS_FILTER = 'id' + filter_operators.OPERATOR_SEPARATOR + filter_operators.IN
+
+
+class EndpointKinds(object):
+    DETAIL = 'detail'
+    LIST = 'list'
+    AGGREGATES = 'aggregates'
+    MULTIPLE = 'multiple'
+
+
+def get_endpoint_kind(url, url_parts, multiple=False):
+    """
+    :param multiple: the url matched the set route of a resource
+    """
+    if multiple:
+        return EndpointKinds.MULTIPLE
+    if url.endswith('aggregates') or url.endswith('aggregates/'):
+        return EndpointKinds.AGGREGATES
+    if len(url_parts) % 2 == 0:
+        return EndpointKinds.DETAIL
+    return EndpointKinds.LIST
+
+
+def method_not_allowed(request):
+    """
+    The action of the dispatch table for actions the resource does not allow
+    """
+    return Response(is_success=False, reason=error_types.MethodNotAllowed)
+
+
+def get_breadcrumbs(url_parts):
+    url_iterator = iter(url_parts)
+    url_items = zip(url_iterator, url_iterator)
+
+    if len(url_parts) % 2 == 0:
+        #this is a request with id at the end.
+        # We don't want it in parent bread crumbs
+        return url_items[:-1]
+    return url_items
+
+
+class Route(object):
+    """
+    A resource registered on an endpoint of an api, like
+    `companies/{company_id}/teams`.
+
+    Its dispatch table maps (http method, endpoint kind) to the name and
+    the action of the resource, with the actions the resource does not
+    allow mapped to method_not_allowed. The table is built from the
+    allowed_actions of the resource, and built again when a new list is
+    assigned to them. After changing the list in place, call the
+    invalidate_pipelines of the resource, which assigns a copy.
+    A view resource reads with any http method.
+    """
+    __slots__ = ('endpoint', 'resource', 'endpoint_length', 'filter_positions',
+                 'dispatch_table', 'allowed_actions')
+
+    def __init__(self, endpoint, resource):
+        endpoint_parts = endpoint.split('/')
+        self.endpoint = endpoint
+        self.resource = resource
+        self.endpoint_length = len(endpoint_parts)
+        # (index of the url part, filter name) of the {filter} parts
+        self.filter_positions = [
+            (index, key[1:-1]) for index, key in enumerate(endpoint_parts)
+            if key.startswith("{") and key.endswith("}")]
+        # the allowed_actions of the resource the table was built from
+        self.allowed_actions = None
+        self.dispatch_table = {}
+        if resource is not None:
+            self.allowed_actions = resource.allowed_actions
+            self.dispatch_table = self.build_dispatch_table(resource)
+
+    @staticmethod
+    def build_dispatch_table(resource):
+        if isinstance(resource, ViewResource):
+            # a view is read with any http method, keyed by None
+            action_names = {(None, kind): 'read'
+                            for kind in (EndpointKinds.DETAIL,
+                                         EndpointKinds.LIST)}
+        else:
+            action_names = {
+                (http_method, kind): '%s_%s' % (action_prefix, kind)
+                for http_method, action_prefix in
+                method_to_action_mapping.items()
+                for kind in (EndpointKinds.DETAIL, EndpointKinds.LIST)}
+        # aggregates are read with any http method
+        action_names[None, EndpointKinds.AGGREGATES] = \
+            'read' if isinstance(resource, ViewResource) else 'get_aggregates'
+        if not isinstance(resource, ViewResource):
+            action_names['GET', EndpointKinds.MULTIPLE] = 'read_multiple'
+
+        dispatch_table = {}
+        for key, action_name in action_names.items():
+            action = getattr(resource, action_name, None)
+            if action is None:
+                continue
+            if not resource.is_action_allowed(action_name):
+                action = method_not_allowed
+            dispatch_table[key] = action
+        return dispatch_table
+
+    def get_dispatch_table(self):
+        """
+        :return: the dispatch table, built again if a new list was assigned
+            to the allowed_actions of the resource
+        """
+        resource = self.resource
+        if resource.allowed_actions is not self.allowed_actions:
+            allowed_actions = resource.allowed_actions
+            self.dispatch_table = self.build_dispatch_table(resource)
+            self.allowed_actions = allowed_actions
+        return self.dispatch_table
+
+    def get_action(self, http_method, kind):
+        """
+        :return: the action of the resource for the http method and endpoint
+            kind, method_not_allowed if the resource does not allow it, None
+            if the resource has none
+        """
+        dispatch_table = self.get_dispatch_table()
+        action = dispatch_table.get((http_method, kind))
+        if action is None:
+            # views, and aggregates, are dispatched with any http method
+            action = dispatch_table.get((None, kind))
+        return action
+
+    def get_breadcrumb_filters(self, url_parts):
+        url_length = len(url_parts)
+        breadcrumb_filters = {name: url_parts[index]
+                              for index, name in self.filter_positions
+                              if index < url_length}
+        if self.endpoint_length < url_length and \
+                url_parts[-1] != EndpointKinds.AGGREGATES:
+            # if id is present in url, need to map this as well
+            breadcrumb_filters['id'] = url_parts[self.endpoint_length]
+        return breadcrumb_filters
+
+
+class RouteMatch(object):
+    __slots__ = ('url', 'route', 'endpoint', 'resource', 'kind',
+                 'breadcrumbs', 'breadcrumb_filters')
+
+    def __init__(self, url, url_parts, route, multiple=False):
+        """
+        :param url_parts: the url split on '/'
+        :param route: the Route the url matched
+        :param multiple: the url matched the set route of the resource, like
+            `companies/1/teams/set/2;3`
+        """
+        self.url = url
+        self.route = route
+        self.endpoint = route.endpoint
+        self.resource = route.resource
+        self.kind = get_endpoint_kind(url, url_parts, multiple=multiple)
+        if self.kind == EndpointKinds.MULTIPLE:
+            ids = [entity_id for entity_id in
+                   url_parts[-1].split(IDS_SEPARATOR) if entity_id]
+            url_parts = url_parts[:-2]
+        self.breadcrumbs = get_breadcrumbs(url_parts)
+        self.breadcrumb_filters = route.get_breadcrumb_filters(url_parts)
+        if self.kind == EndpointKinds.MULTIPLE:
+            self.breadcrumb_filters[IDS_FILTER] = ids
+
+    def get_endpoint_kind(self, http_method, many=False):
+        """
+        A POST on a list creates an entity, so it goes to the detail
+        endpoint. A POST of many entities (`many`) stays on the list
+        """
+        if self.kind != EndpointKinds.AGGREGATES and http_method == 'POST' \
+                and not many:
+            return EndpointKinds.DETAIL
+        return self.kind
+
+    def get_action(self, http_method, many=False):
+        """
+        :param many: the data of the request is a list of entities
+        """
+        kind = self.kind
+        if http_method == 'POST':
+            kind = self.get_endpoint_kind(http_method, many=many)
+        # Route.get_action, inlined on the hot path of every request
+        route = self.route
+        dispatch_table = route.dispatch_table
+        if route.resource.allowed_actions is not route.allowed_actions:
+            dispatch_table = route.get_dispatch_table()
+        action = dispatch_table.get((http_method, kind))
+        if action is None:
+            action = dispatch_table.get((None, kind))
+        return action
@@ -44,6 +44,39 @@ class BaseField(six.with_metaclass(ABCMeta)):
     def serialize(self, request, value):
         return value
 
+    def serialize_many(self, request, values):
+        """
+        Serializes a column of values, like the values of the field in all
+        the entities of a list. Override it where serializing the values
+        together is cheaper than serializing them one by one.
+        :param values: list of values
+        :return: list of serialized values, in the order of values
+        """
+        return [self.serialize(request, value) for value in values]
+
+    def get_serialize_many(self):
+        """
+        :return: serialize_many, if it serializes like serialize does. A
+            subclass that overrides serialize, but not serialize_many, gets
+            its values serialized one by one
+        """
+        mro = type(self).__mro__
+        serialize_owner = next(cls for cls in mro if 'serialize' in vars(cls))
+        serialize_many_owner = next(cls for cls in mro
+                                    if 'serialize_many' in vars(cls))
+        if issubclass(serialize_many_owner, serialize_owner):
+            return self.serialize_many
+        return lambda request, values: BaseField.serialize_many(
+            self, request, values)
+
+    def serializes_by_column(self):
+        """
+        :return: False if serialize is overridden on the field object
+            itself, which get_serialize_many cannot see. The entities of a
+            list with such a field are serialized one by one
+        """
+        return 'serialize' not in vars(self)
+
     def clean(self, request, value):
         """
         Called during update and create
@@ -15,6 +15,16 @@ class DateTimeField(BaseField):
         return datetime_converter.datetime_to_timestamp(
             value, timezone=timezone)
 
+    def serialize_many(self, request, values):
+        """
+        Serializes a whole column of values, like the values of the field in
+        all the entities of a list
+        """
+        if all(value is None for value in values):
+            return [None] * len(values)
+        timezone = request.context_params['timezone']
+        return datetime_converter.datetimes_to_timestamps(values, timezone)
+
     def clean(self, request, value):
         if value is None:
             return value
@@ -18,3 +18,7 @@ class FloatField(BaseField):
     def serialize(self, request, value):
         format = '%.{}f'.format(self.precision)
         return float(format % value)
+
+    def serialize_many(self, request, values):
+        format = '%.{}f'.format(self.precision)
+        return [float(format % value) for value in values]
@@ -53,3 +53,18 @@ class ListField(BaseField):
         if value is None:
             return None
         return [self.field.serialize(request, item) for item in value]
+
+    def serializes_by_column(self):
+        return super(ListField, self).serializes_by_column() and \
+            self.field.serializes_by_column()
+
+    def serialize_many(self, request, values):
+        # serializes the items of all the lists together, then splits them
+        values = [None if value is None else list(value) for value in values]
+        items = [item for value in values if value is not None
+                 for item in value]
+        serialized_items = iter(
+            self.field.get_serialize_many()(request, items))
+        return [None if value is None else
+                [next(serialized_items) for item in value]
+                for value in values]
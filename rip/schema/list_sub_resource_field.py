@@ -1,3 +1,4 @@
+from rip.crud.crud_actions import CrudActions
 from rip.schema.sub_resource_field import \
     SubResourceField
 
@@ -7,12 +8,17 @@ class ListSubResourceField(SubResourceField):
     This field enables one to many relationship between the parent
     resource and the
     """
+    batch_crud_action = CrudActions.READ_LIST
+    # the list of each parent is read with the read list filters too
+    batch_sensitive_steps = (('post_action_hooks', 'read_list_hook'),)
 
     def __init__(self, resource_cls, related_filter, required=False,
-                 nullable=True, entity_attribute='id', show_in_list=True):
+                 nullable=True, entity_attribute='id', show_in_list=True,
+                 batch=False, related_attribute=None):
         super(ListSubResourceField, self).__init__(
             resource_cls, related_filter, required, nullable,
-            entity_attribute, show_in_list=show_in_list)
+            entity_attribute, show_in_list=show_in_list, batch=batch,
+            related_attribute=related_attribute)
         self.null_return_value = []
 
     def get_data(self, resource_obj, request):
@@ -20,3 +26,7 @@ class ListSubResourceField(SubResourceField):
 
     def get_data_from_response(self, response):
         return response.data['objects']
+
+    def get_data_from_entities(self, serializer, request, entities):
+        return [serializer.serialize_entity(request, entity)
+                for entity in entities]
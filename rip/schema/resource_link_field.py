@@ -52,9 +52,18 @@ class ResourceLinkField(StringField):
             schema_name=schema_name,
             entity_id=value)
 
+    def serialize_many(self, request, values):
+        if all(value is None for value in values):
+            return [None] * len(values)
+        # the url up to the entity id is the same for all the values
+        list_url = url_constructor.construct_list_url(
+            api_name=request.context_params['api_name'],
+            api_version=request.context_params['api_version'],
+            schema_name=self.of_type._meta.schema_name)
+        return [None if value is None else list_url + unicode(value) + u'/'
+                for value in values]
+
     def clean(self, request, value):
         if value is None:
             return value
-        id_index = -2 if value.endswith('/') else -1
-        url_parts = value.split('/')
-        return url_parts[id_index]
+        return url_constructor.get_entity_id(value)
@@ -42,8 +42,19 @@ class ResourceUriField(StringField):
             parents=request.context_params.get('api_breadcrumbs', [])
         )
 
+    def serialize_many(self, request, values):
+        if not values:
+            return []
+        # the url up to the entity id is the same for all the values
+        schema = self.of_type or self.schema_cls
+        list_url = url_constructor.construct_list_url(
+            api_name=request.context_params['api_name'],
+            api_version=request.context_params['api_version'],
+            schema_name=schema._meta.schema_name,
+            parents=request.context_params.get('api_breadcrumbs', []))
+        return [list_url + unicode(value) + u'/' for value in values]
+
     def clean(self, request, value):
         if value is None:
             return value
-        id_index = -2 if value.endswith('/') else -1
-        return value.split('/')[id_index]
+        return url_constructor.get_entity_id(value)
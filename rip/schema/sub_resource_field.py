@@ -1,16 +1,63 @@
 import copy
+from collections import defaultdict
 
+import six
+
+from rip import attribute_getter, error_types, filter_operators, \
+    resource_registry, url_constructor
+from rip.crud.crud_actions import CrudActions
+from rip.pipeline_composer import is_pass_through_step
 from rip.request import Request
 from rip.schema.base_field import BaseField, FieldTypes
 
 
+class SubResourceLinkField(BaseField):
+    """
+    Serializes a sub-resource as the url of the sub-resource, instead of
+    embedding it. Used for sub-resources which are not expanded.
+    """
+
+    def __init__(self, sub_resource_field):
+        super(SubResourceLinkField, self).__init__(
+            required=sub_resource_field.required,
+            nullable=sub_resource_field.nullable,
+            entity_attribute=sub_resource_field.entity_attribute,
+            field_type=FieldTypes.READONLY,
+            show_in_list=sub_resource_field.show_in_list)
+        self.sub_resource_field = sub_resource_field
+
+    def serialize(self, request, value):
+        parent_schema_name = \
+            self.sub_resource_field.schema_cls._meta.schema_name
+        schema_name = \
+            self.sub_resource_field.resource_cls.schema_cls._meta.schema_name
+        parents = list(request.context_params.get('api_breadcrumbs', []))
+        parents.append((parent_schema_name, value))
+
+        return url_constructor.construct_list_url(
+            api_name=request.context_params['api_name'],
+            api_version=request.context_params['api_version'],
+            schema_name=schema_name,
+            parents=parents)
+
+
 class SubResourceField(BaseField):
+    batch_crud_action = CrudActions.READ_DETAIL
+    # (configuration key, step) of the steps of the sub-resource that differ
+    # between reading it per parent and in a batch. A batch is read only if
+    # the sub-resource leaves all of them to the defaults
+    batch_sensitive_steps = (('authorization', 'add_read_list_filters'),
+                             ('authorization', 'authorize_read_detail'),
+                             ('post_action_hooks', 'read_detail_hook'))
+
     def __init__(self, resource_cls,
                  related_filter,
                  required=False,
                  nullable=True,
                  entity_attribute='id',
-                 show_in_list=True):
+                 show_in_list=True,
+                 batch=False,
+                 related_attribute=None):
         """
         In case you want to show the content of resource1 as a part of resource2
         sub-resource on resource2 is the way to go. This is not recommended at
@@ -22,6 +69,12 @@ class SubResourceField(BaseField):
         :param required:
         :param nullable:
         :param entity_attribute: the attribute on
+        :param batch: when serializing a list, read the sub-resource of all
+            the parents in one call filtered by `<related_filter>__in`,
+            instead of one call per parent
+        :param related_attribute: attribute on the sub-resource entities that
+            holds the value of the parent. Used to group the entities of a
+            batch per parent. Defaults to related_filter
         :return:
         """
         super(SubResourceField, self).__init__(required=required,
@@ -32,6 +85,11 @@ class SubResourceField(BaseField):
         self.related_filter = related_filter
         self.resource_cls = resource_cls
         self.null_return_value = None
+        self.batch = batch
+        self.related_attribute = related_attribute or related_filter
+        self.get_related_value = attribute_getter.compile_accessor(
+            self.related_attribute)
+        self.link_field = SubResourceLinkField(self)
 
     def get_data(self, resource_obj, request):
         return resource_obj.read_detail(request)
@@ -39,17 +97,32 @@ class SubResourceField(BaseField):
     def get_data_from_response(self, response):
         return response.data
 
-    def serialize(self, request, value):
+    def get_data_from_entities(self, serializer, request, entities):
+        if len(entities) > 1:
+            raise error_types.MultipleObjectsFound()
+        if not entities:
+            return self._get_data_for_unsuccessful_response(None)
+        return serializer.serialize_entity(request, entities[0])
+
+    def _get_data_for_unsuccessful_response(self, response):
+        if self.nullable:
+            return self.null_return_value
+        raise TypeError(
+            "`{}` subResource returned unsuccessful response with {}".format(
+                self.resource_cls, response))
+
+    def _build_request(self, request, related_filters, parent_breadcrumb=None):
         new_context_params = {}
 
         #make a copy of the api_breadcrumbs and append current resource
         breadcrumbs = copy.deepcopy(
             request.context_params.get('api_breadcrumbs', []))
-        breadcrumbs.append((self.schema_cls._meta.schema_name, value))
+        if parent_breadcrumb is not None:
+            breadcrumbs.append(parent_breadcrumb)
         breadcrumb_filters = copy.deepcopy(
             request.context_params.get('api_breadcrumb_filters',{}))
-        breadcrumb_filters.update({self.related_filter: value,
-                                   'offset': 0,
+        breadcrumb_filters.update(related_filters)
+        breadcrumb_filters.update({'offset': 0,
                                    'limit': 0}) #get all objects
 
         new_context_params.update(api_breadcrumbs = breadcrumbs,
@@ -58,19 +131,95 @@ class SubResourceField(BaseField):
         for key, value in request.context_params.items():
             if isinstance(value, (basestring, int, long)):
                 new_context_params[key] = value
+        # sub-resources of sub-resources are read from the same api
+        new_context_params[resource_registry.CONTEXT_PARAM] = \
+            resource_registry.get_registry(request)
+
+        return Request(user=request.user,
+                       request_params=breadcrumb_filters,
+                       context_params=new_context_params)
 
-        request = Request(user=request.user,
-                          request_params=breadcrumb_filters,
-                          context_params=new_context_params)
+    def serialize(self, request, value):
+        request = self._build_request(
+            request, {self.related_filter: value},
+            parent_breadcrumb=(self.schema_cls._meta.schema_name, value))
 
-        resource_obj = self.resource_cls()
+        resource_obj = resource_registry.get_instance(self.resource_cls, request)
         response = self.get_data(resource_obj, request)
         if response.is_success:
             return self.get_data_from_response(response)
-        elif self.nullable:
-            return self.null_return_value
-        else:
-            raise TypeError(
-                "`{}` subResource returned unsuccessful response with {}".format(
-                    self.resource_cls, response))
+        return self._get_data_for_unsuccessful_response(response)
+
+    def serializes_by_column(self):
+        # a batch is read without calling serialize, so a subclass that
+        # overrides serialize is serialized entity by entity
+        if self.batch and six.get_unbound_function(type(self).serialize) is \
+                not six.get_unbound_function(SubResourceField.serialize):
+            return False
+        return super(SubResourceField, self).serializes_by_column()
+
+    def can_batch(self, resource_obj):
+        """
+        :return: True if reading the sub-resource of many parents in one
+            call is allowed, and authorizes and hooks like reading it per
+            parent does
+        """
+        if not resource_obj.is_action_allowed(CrudActions.READ_LIST) or \
+                not resource_obj.is_action_allowed(self.batch_crud_action):
+            return False
+        configuration = resource_obj.configuration
+        return all(is_pass_through_step(getattr(configuration[key], step))
+                   for key, step in self.batch_sensitive_steps)
+
+    def _serialize_each(self, request, values):
+        return [self.serialize(request, value) for value in values]
+
+    def serialize_batch(self, request, values):
+        """
+        Serializes the sub-resource of many parents, reading the entities of
+        all of them in a single call. If the sub-resource can not be read in
+        a batch (see can_batch), the batch read fails, or its entities do
+        not have the related_attribute, the sub-resource of each parent is
+        read on its own instead.
+
+        :param values: the values of the parents
+        :return: list of serialized values, in the order of values
+        """
+        resource_obj = resource_registry.get_instance(self.resource_cls, request)
+        if not self.can_batch(resource_obj):
+            return self._serialize_each(request, values)
+
+        # a parent without a value has no sub-resource to read
+        unique_values = list(set(value for value in values
+                                 if value is not None))
+        if not unique_values:
+            return [self._get_data_for_unsuccessful_response(None)
+                    for value in values]
+
+        batch_request = self._build_request(
+            request,
+            {self.related_filter + filter_operators.OPERATOR_SEPARATOR +
+             filter_operators.IN: unique_values})
+        response = resource_obj.read_related_list(batch_request)
+        if not response.is_success:
+            return self._serialize_each(request, values)
+
+        entities_by_value = defaultdict(list)
+        try:
+            for entity in response.data:
+                related_value = self.get_related_value(entity)
+                entities_by_value[related_value].append(entity)
+        except AttributeError:
+            return self._serialize_each(request, values)
 
+        serializer = resource_obj.configuration['serializer']
+        serialized_values = []
+        for value in values:
+            value_request = self._build_request(
+                request, {self.related_filter: value},
+                parent_breadcrumb=(self.schema_cls._meta.schema_name, value))
+            value_request.context_params['crud_action'] = \
+                self.batch_crud_action
+            serialized_values.append(self.get_data_from_entities(
+                serializer, value_request, entities_by_value.get(value, [])))
+        return serialized_values
@@ -0,0 +1,102 @@
+"""
+modes of computing the total count of a read_list.
+
+    exact    - get_entity_list_total_count, on every call (the default)
+    none     - no count, the total is null
+    estimate - get_entity_list_total_count_estimate, an optional hook of
+               the entity actions. Falls back to exact if it returns None
+    cached   - get_entity_list_total_count, memoized by the user and the
+               filters of the request for a time to live
+
+The mode is set per resource by the `total_count_mode` of its entity
+actions. The `total` request param can only lower the cost of the count
+(none < estimate < cached < exact): a request asking for a costlier mode
+than the one of the resource is counted in the mode of the resource.
+"""
+import time
+
+__all__ = ['TotalCountModes', 'TotalCountCache', 'get_cache_key',
+           'resolve_mode']
+
+
+class TotalCountModes(object):
+    EXACT = 'exact'
+    NONE = 'none'
+    ESTIMATE = 'estimate'
+    CACHED = 'cached'
+
+    ALL = (EXACT, NONE, ESTIMATE, CACHED)
+    # from the cheapest to the costliest
+    BY_COST = (NONE, ESTIMATE, CACHED, EXACT)
+
+
+def resolve_mode(mode, requested_mode=None):
+    """
+    :param mode: the mode of the resource
+    :param requested_mode: the mode asked for by the request, if any
+    :return: requested_mode if it costs no more than mode, else mode
+    """
+    if requested_mode is None or \
+            TotalCountModes.BY_COST.index(requested_mode) > \
+            TotalCountModes.BY_COST.index(mode):
+        return mode
+    return requested_mode
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item))
+                            for key, item in value.items()))
+    return value
+
+
+def get_cache_key(filters, user=None):
+    """
+    :param user: the user of the request, since the entities a user can see
+        may depend on them
+    :return: hashable key of a user and a dict of filters, the same for
+        filters given in any order. None if a filter value or the user
+        cannot be hashed
+    """
+    key = (user, _freeze(filters))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class TotalCountCache(object):
+    """
+    Total counts by filters, each valid for `ttl` seconds. Once it holds
+    `max_size` counts, the cache is cleared.
+    """
+
+    def __init__(self, ttl, max_size=1024, clock=time.time):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self._counts = {}
+
+    def get(self, key):
+        """
+        :return: the count of key, None if it is not cached or expired
+        """
+        entry = self._counts.get(key)
+        if entry is None:
+            return None
+        count, expires_at = entry
+        if expires_at <= self.clock():
+            self._counts.pop(key, None)
+            return None
+        return count
+
+    def set(self, key, count):
+        if len(self._counts) >= self.max_size:
+            self._counts = {}
+        self._counts[key] = (count, self.clock() + self.ttl)
+
+    def clear(self):
+        self._counts = {}
@@ -1,3 +1,17 @@
+"""
+builds the urls of resources. The url up to the entity id of a resource is
+the same for all its entities, so list urls are cached per api name, api
+version, breadcrumbs and schema name, and a resource url is the list url
+followed by the entity id.
+"""
+
+# bound on the number of urls cached. Breadcrumbs hold the ids of parent
+# entities, so the caches are cleared once they are full
+MAX_CACHED_URLS = 4096
+
+_list_urls = {}
+_entity_ids = {}
+
 
 def _get_parent_url_part(parents):
     url = ''
@@ -6,17 +20,47 @@ def _get_parent_url_part(parents):
     return url
 
 
-def construct_url(api_name, api_version, schema_name,
-                  entity_id, parents=None):
+def _cache(cache, key, value):
+    if len(cache) >= MAX_CACHED_URLS:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def construct_list_url(api_name, api_version, schema_name, parents=None):
+    parents_key = tuple(tuple(parent) for parent in parents) \
+        if parents else ()
+    key = (api_name, api_version, parents_key, schema_name)
+    list_url = _list_urls.get(key)
+    if list_url is not None:
+        return list_url
 
     if parents is not None:
         parent_url_part = _get_parent_url_part(parents)
     else:
         parent_url_part = ''
-    link_url = u"/{api_name}/{api_version}/{parent_part}{schema_name}/{entity_id}/".\
+    link_url = u"/{api_name}/{api_version}/{parent_part}{schema_name}/".\
     format(api_name=api_name,
            api_version=api_version,
            parent_part=parent_url_part,
-           schema_name=schema_name,
-           entity_id=entity_id)
-    return link_url
\ No newline at end of file
+           schema_name=schema_name)
+    return _cache(_list_urls, key, link_url)
+
+
+def construct_url(api_name, api_version, schema_name,
+                  entity_id, parents=None):
+    list_url = construct_list_url(api_name, api_version, schema_name,
+                                  parents=parents)
+    return list_url + unicode(entity_id) + u'/'
+
+
+def get_entity_id(url):
+    """
+    :return: the entity id at the end of a resource url, like
+        /api/v1/users/2/ or /api/v1/users/2
+    """
+    entity_id = _entity_ids.get(url)
+    if entity_id is None:
+        path = url[:-1] if url.endswith('/') else url
+        entity_id = _cache(_entity_ids, url, path.rpartition('/')[2])
+    return entity_id
@@ -4,8 +4,10 @@ from rip.view.view_actions import ViewActions
 
 
 def validate_view_action(func):
+    # the action is resolved once, when the method is decorated
+    action = ViewActions.resolve_action(func.__name__)
+
     def wrapper(self, request):
-        action = ViewActions.resolve_action(func.__name__)
         request.context_params['view_action'] = action
 
         if not self.is_action_allowed(action):
@@ -13,4 +15,6 @@ def validate_view_action(func):
                 is_success=False, reason=error_types.MethodNotAllowed)
         return func(self, request=request)
 
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
     return wrapper
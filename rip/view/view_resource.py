@@ -89,6 +89,27 @@ class ViewResource(object):
             response_converter=response_converter,
             data_cleaner=data_cleaner,
             serializer=serializer))
+        self._setup_pipelines()
+
+    def _setup_pipelines(self):
+        """
+        Compiles the pipeline of every view action once, so that a call
+        to an action does not rebuild its pipeline from the configuration.
+        """
+        read_pipeline = view_pipeline_factory.read_pipeline(
+            configuration=self.configuration)
+        read_pipeline.resource_name = self.__class__.__name__
+        self.pipelines = {ViewActions.READ: read_pipeline}
+
+    def invalidate_pipelines(self):
+        """
+        Compiles the pipelines again from the configuration.
+        Call this after swapping a step in the configuration, or changing
+        allowed_actions in place.
+        """
+        # a new list makes the routes of the resource dispatch by it again
+        self.allowed_actions = list(self.allowed_actions)
+        self._setup_pipelines()
 
     def __new__(cls, *args, **kwargs):
         if cls.schema_cls is None:
@@ -122,6 +143,5 @@ class ViewResource(object):
         :param request: rip.Request
         :return: rip.Response
         """
-        pipeline = view_pipeline_factory.read_pipeline(
-            configuration=self.configuration)
+        pipeline = self.pipelines[ViewActions.READ]
         return pipeline(request=request)
@@ -126,9 +126,13 @@ class PersonResource(CrudResource):
     schema_cls = PersonSchema
     allowed_actions = [CrudActions.READ_LIST,
                        CrudActions.READ_DETAIL,
+                       CrudActions.READ_MULTIPLE,
                        CrudActions.UPDATE_DETAIL,
                        CrudActions.CREATE_OR_UPDATE_DETAIL,
                        CrudActions.CREATE_DETAIL,
+                       CrudActions.CREATE_LIST,
+                       CrudActions.UPDATE_LIST,
                        CrudActions.DELETE_DETAIL,
+                       CrudActions.DELETE_LIST,
                        CrudActions.GET_AGGREGATES]
     entity_actions_cls = PersonEntityActions
@@ -0,0 +1,99 @@
+import json
+import os
+import unittest
+
+from mock import MagicMock
+
+from rip import filter_operators
+from rip.api import Api
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.crud.crud_resource import CrudResource
+from rip.django_adapter.batch_handler import create_batch_handler
+from rip.generic_steps.default_entity_actions import DefaultEntityActions
+from rip.schema.base_field import FieldTypes
+from rip.schema.string_field import StringField
+
+
+class TeamSchema(ApiSchema):
+    id = StringField(field_type=FieldTypes.READONLY)
+    name = StringField(required=True)
+
+    class Meta:
+        schema_name = 'teams'
+
+
+class TeamEntityActions(DefaultEntityActions):
+    teams = None
+
+    def get_entity_list(self, request, **kwargs):
+        return [team for team in self.teams
+                if kwargs.get('id') in (None, team['id'])]
+
+    def get_entity_list_total_count(self, request, **kwargs):
+        return len(self.get_entity_list(request, **kwargs))
+
+    def update_entity(self, request, entity, **update_params):
+        entity.update(update_params)
+        return entity
+
+
+class TeamResource(CrudResource):
+    schema_cls = TeamSchema
+    entity_actions_cls = TeamEntityActions
+    allowed_actions = [CrudActions.READ_LIST, CrudActions.READ_DETAIL,
+                       CrudActions.UPDATE_DETAIL]
+    filter_by_fields = {'id': (filter_operators.EQUALS,)}
+
+
+class DummyUser(object):
+    def is_anonymous(self):
+        return False
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        os.environ['DJANGO_SETTINGS_MODULE'] = 'tests.settings'
+        TeamEntityActions.teams = [{'id': '1', 'name': 'rip'},
+                                   {'id': '2', 'name': 'django'}]
+        self.api = Api(name='api', version='v1')
+        self.api.register_resource('teams', TeamResource())
+
+    def call(self, sub_requests, api=None):
+        handler = create_batch_handler(api or self.api)
+        http_request = MagicMock(user=DummyUser(), method='POST',
+                                 META={'CONTENT_TYPE': 'application/json'})
+        http_request.read.return_value = json.dumps(sub_requests)
+        return handler(http_request)
+
+    def test_should_return_the_responses_in_order(self):
+        response = self.call([
+            {'url': 'teams/2'},
+            {'method': 'PATCH', 'url': 'teams/1', 'body': {'name': 'new'}},
+            {'url': 'teams', 'params': {'id': '1'}},
+            {'url': 'teams/3'},
+            {'method': 'DELETE', 'url': 'teams/1'},
+            {'url': 'companies'}])
+
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(response.content)
+        self.assertEqual([result['status'] for result in results],
+                         [200, 202, 200, 404, 405, 404])
+        self.assertEqual(results[0]['body'], {'id': '2', 'name': 'django'})
+        self.assertEqual(results[1]['body'], {'id': '1', 'name': 'new'})
+        self.assertEqual(results[2]['body']['objects'],
+                         [{'id': '1', 'name': 'new'}])
+
+    def test_should_run_reads_in_the_thread_pool_of_the_api(self):
+        api = Api(name='api', version='v1', thread_pool_size=2)
+        api.register_resource('teams', TeamResource())
+
+        response = self.call([
+            {'url': 'teams/1'},
+            {'url': 'teams/2'},
+            {'method': 'PATCH', 'url': 'teams/2', 'body': {'name': 'new'}},
+            {'url': 'teams/2'}], api=api)
+
+        results = json.loads(response.content)
+        self.assertEqual([result['body']['name'] for result in results],
+                         ['rip', 'django', 'new', 'new'])
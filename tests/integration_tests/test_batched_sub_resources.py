@@ -0,0 +1,333 @@
+import unittest
+
+from hamcrest import assert_that, equal_to
+from mock import patch
+
+from rip import error_types, resource_registry
+from rip.api import Api
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.crud.crud_resource import CrudResource
+from rip.filter_operators import EQUALS
+from rip.generic_steps.default_authorization import DefaultAuthorization
+from rip.generic_steps.default_entity_actions import DefaultEntityActions
+from rip.generic_steps.default_post_action_hooks import \
+    DefaultPostActionHooks
+from rip.response import Response
+from rip.schema.integer_field import IntegerField
+from rip.schema.list_sub_resource_field import ListSubResourceField
+from rip.schema.string_field import StringField
+from rip.schema.sub_resource_field import SubResourceField
+from tests import request_factory
+
+TEAMS = [dict(id=1, name='red'), dict(id=2, name='blue'),
+         dict(id=3, name='green')]
+PLAYERS = [dict(name='anna', team_id=1), dict(name='bob', team_id=1),
+           dict(name='carl', team_id=2)]
+
+
+class CountingEntityActions(DefaultEntityActions):
+    entities = []
+    calls = []
+
+    def get_entity_list(self, request, **kwargs):
+        self.calls.append(kwargs)
+        if 'team_id' in kwargs:
+            return [entity for entity in self.entities
+                    if entity['team_id'] == kwargs['team_id']]
+        team_ids = kwargs.get('team_id__in')
+        if team_ids is None:
+            return self.entities
+        return [entity for entity in self.entities
+                if entity['team_id'] in team_ids]
+
+    def get_entity_list_total_count(self, request, **kwargs):
+        return len(self.entities)
+
+
+class PlayerEntityActions(CountingEntityActions):
+    entities = PLAYERS
+
+
+class TeamEntityActions(CountingEntityActions):
+    entities = TEAMS
+
+
+class PlayerSchema(ApiSchema):
+    name = StringField()
+
+    class Meta:
+        schema_name = 'players'
+
+
+class PlayerResource(CrudResource):
+    schema_cls = PlayerSchema
+    filter_by_fields = {'team_id': (EQUALS)}
+    entity_actions_cls = PlayerEntityActions
+
+
+class TeamSchema(ApiSchema):
+    id = IntegerField()
+    name = StringField()
+    players = ListSubResourceField(resource_cls=PlayerResource,
+                                   related_filter='team_id', batch=True)
+
+    class Meta:
+        schema_name = 'teams'
+
+
+class TeamResource(CrudResource):
+    schema_cls = TeamSchema
+    entity_actions_cls = TeamEntityActions
+
+
+class TestBatchedListSubResource(unittest.TestCase):
+    def setUp(self):
+        CountingEntityActions.calls = []
+
+    def test_should_read_sub_resources_of_all_parents_in_one_call(self):
+        request = request_factory.get_request(user=object())
+
+        response = TeamResource().read_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(len(CountingEntityActions.calls), equal_to(2))
+        assert_that(sorted(CountingEntityActions.calls[1]['team_id__in']),
+                    equal_to([1, 2, 3]))
+
+    def test_should_read_sub_resources_from_api_of_request(self):
+        api = Api(name='api')
+        player_resource = PlayerResource()
+        api.register_resource('players', player_resource)
+        context_params = {'api_name': 'api', 'api_version': 'v1',
+                          resource_registry.CONTEXT_PARAM:
+                              api.resource_registry}
+        request = request_factory.get_request(user=object(),
+                                              context_params=context_params)
+
+        with patch.object(player_resource, 'read_related_list',
+                          wraps=player_resource.read_related_list) as read:
+            TeamResource().read_list(request)
+
+        assert_that(read.call_count, equal_to(1))
+
+    def test_should_group_sub_resources_per_parent(self):
+        request = request_factory.get_request(user=object())
+
+        response = TeamResource().read_list(request)
+
+        players = [team['players'] for team in response.data['objects']]
+        assert_that(players, equal_to([[{'name': 'anna'}, {'name': 'bob'}],
+                                       [{'name': 'carl'}],
+                                       []]))
+
+    def test_detail_sub_resource_of_parent_without_entity_is_null(self):
+        class CaptainEntityActions(CountingEntityActions):
+            entities = PLAYERS[1:]
+
+        class CaptainResource(PlayerResource):
+            entity_actions_cls = CaptainEntityActions
+
+        class CaptainTeamSchema(ApiSchema):
+            id = IntegerField()
+            captain = SubResourceField(resource_cls=CaptainResource,
+                                       related_filter='team_id', batch=True)
+
+            class Meta:
+                schema_name = 'teams'
+
+        class CaptainTeamResource(CrudResource):
+            schema_cls = CaptainTeamSchema
+            entity_actions_cls = TeamEntityActions
+
+        request = request_factory.get_request(user=object())
+
+        response = CaptainTeamResource().read_list(request)
+
+        captains = [team['captain'] for team in response.data['objects']]
+        assert_that(captains, equal_to([{'name': 'bob'}, {'name': 'carl'},
+                                        None]))
+
+    def test_should_respect_allowed_actions_of_sub_resource(self):
+        request = request_factory.get_request(user=object())
+
+        class NoListPlayerResource(PlayerResource):
+            allowed_actions = [CrudActions.READ_DETAIL]
+
+        response = NoListPlayerResource().read_related_list(request)
+
+        assert_that(response.reason, equal_to(error_types.MethodNotAllowed))
+
+
+class CaptainEntityActions(CountingEntityActions):
+    entities = PLAYERS[1:]
+
+
+class CaptainAuthorization(DefaultAuthorization):
+    def authorize_read_detail(self, request):
+        if request.context_params['entity']['name'] == 'carl':
+            return Response(is_success=False,
+                            reason=error_types.ActionForbidden)
+        return request
+
+
+class CaptainResource(PlayerResource):
+    entity_actions_cls = CaptainEntityActions
+    authorization_cls = CaptainAuthorization
+
+
+class CaptainTeamSchema(ApiSchema):
+    id = IntegerField()
+    captain = SubResourceField(resource_cls=CaptainResource,
+                               related_filter='team_id', batch=True)
+
+    class Meta:
+        schema_name = 'teams'
+
+
+class CaptainTeamResource(CrudResource):
+    schema_cls = CaptainTeamSchema
+    entity_actions_cls = TeamEntityActions
+
+
+class DetailOnlyCaptainResource(PlayerResource):
+    entity_actions_cls = CaptainEntityActions
+    allowed_actions = [CrudActions.READ_DETAIL]
+
+
+def get_detail_only_captain_team_resource(batch):
+    class DetailOnlyCaptainTeamSchema(ApiSchema):
+        id = IntegerField()
+        captain = SubResourceField(resource_cls=DetailOnlyCaptainResource,
+                                   related_filter='team_id', batch=batch)
+
+        class Meta:
+            schema_name = 'teams'
+
+    class DetailOnlyCaptainTeamResource(CrudResource):
+        schema_cls = DetailOnlyCaptainTeamSchema
+        entity_actions_cls = TeamEntityActions
+
+    return DetailOnlyCaptainTeamResource()
+
+
+class UpperPostActionHooks(DefaultPostActionHooks):
+    def read_list_hook(self, request):
+        for player in request.context_params['serialized_data']['objects']:
+            player['name'] = player['name'].upper()
+        return request
+
+
+class HookedPlayerResource(PlayerResource):
+    post_action_hooks_cls = UpperPostActionHooks
+
+
+class HookedTeamSchema(ApiSchema):
+    id = IntegerField()
+    players = ListSubResourceField(resource_cls=HookedPlayerResource,
+                                   related_filter='team_id', batch=True)
+
+    class Meta:
+        schema_name = 'teams'
+
+
+class HookedTeamResource(CrudResource):
+    schema_cls = HookedTeamSchema
+    entity_actions_cls = TeamEntityActions
+
+
+class SquadEntityActions(CountingEntityActions):
+    """
+    Players filtered by team_id, which is stored as their squad
+    """
+    entities = [dict(name=player['name'], squad=player['team_id'])
+                for player in PLAYERS]
+
+    def get_entity_list(self, request, **kwargs):
+        self.calls.append(kwargs)
+        if 'team_id' in kwargs:
+            return [entity for entity in self.entities
+                    if entity['squad'] == kwargs['team_id']]
+        return [entity for entity in self.entities
+                if entity['squad'] in kwargs['team_id__in']]
+
+
+class SquadPlayerResource(PlayerResource):
+    entity_actions_cls = SquadEntityActions
+
+
+class SquadTeamSchema(ApiSchema):
+    id = IntegerField()
+    players = ListSubResourceField(resource_cls=SquadPlayerResource,
+                                   related_filter='team_id', batch=True)
+
+    class Meta:
+        schema_name = 'teams'
+
+
+class SquadTeamResource(CrudResource):
+    schema_cls = SquadTeamSchema
+    entity_actions_cls = TeamEntityActions
+
+
+class TestBatchFallback(unittest.TestCase):
+    def setUp(self):
+        CountingEntityActions.calls = []
+
+    def test_should_authorize_each_detail_sub_resource(self):
+        request = request_factory.get_request(user=object())
+
+        response = CaptainTeamResource().read_list(request)
+
+        captains = [team['captain'] for team in response.data['objects']]
+        assert_that(captains, equal_to([{'name': 'bob'}, None, None]))
+        # the captain of each team is read on its own
+        assert_that(len(CountingEntityActions.calls), equal_to(4))
+
+    def test_should_read_each_parent_if_sub_resource_has_no_read_list(self):
+        def get_captains(batch):
+            request = request_factory.get_request(user=object())
+            response = get_detail_only_captain_team_resource(
+                batch).read_list(request)
+            return [team['captain'] for team in response.data['objects']]
+
+        batched_captains = get_captains(batch=True)
+
+        assert_that(batched_captains, equal_to(get_captains(batch=False)))
+        assert_that(batched_captains, equal_to([{'name': 'bob'},
+                                                {'name': 'carl'}, None]))
+
+    def test_should_run_hooks_of_list_sub_resource(self):
+        request = request_factory.get_request(user=object())
+
+        response = HookedTeamResource().read_list(request)
+
+        players = [team['players'] for team in response.data['objects']]
+        assert_that(players, equal_to([[{'name': 'ANNA'}, {'name': 'BOB'}],
+                                       [{'name': 'CARL'}],
+                                       []]))
+
+    def test_should_not_read_sub_resources_of_parents_without_value(self):
+        class NoIdTeamEntityActions(CountingEntityActions):
+            entities = TEAMS + [dict(id=None, name='white')]
+
+        class NoIdTeamResource(TeamResource):
+            entity_actions_cls = NoIdTeamEntityActions
+
+        request = request_factory.get_request(user=object())
+
+        response = NoIdTeamResource().read_list(request)
+
+        assert_that(sorted(CountingEntityActions.calls[1]['team_id__in']),
+                    equal_to([1, 2, 3]))
+        assert_that(response.data['objects'][-1]['players'], equal_to([]))
+
+    def test_should_read_each_parent_without_related_attribute(self):
+        request = request_factory.get_request(user=object())
+
+        response = SquadTeamResource().read_list(request)
+
+        players = [team['players'] for team in response.data['objects']]
+        assert_that(players, equal_to([[{'name': 'anna'}, {'name': 'bob'}],
+                                       [{'name': 'carl'}],
+                                       []]))
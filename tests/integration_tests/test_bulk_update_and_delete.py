@@ -0,0 +1,159 @@
+from hamcrest import assert_that, equal_to
+from mock import call, patch
+
+from rip import error_types
+from rip.crud.crud_actions import CrudActions
+from tests import request_factory
+from tests.integration_tests.person_base_test_case import \
+    PersonResourceBaseTestCase
+from tests.integration_tests.person_resource import PersonResource, \
+    PersonEntity
+
+
+class BulkUpdateAndDeleteIntegrationTest(PersonResourceBaseTestCase):
+    @patch.object(PersonResource.entity_actions_cls, 'update_entities')
+    def test_should_update_entities_matching_filters(self,
+                                                     update_entities):
+        resource = PersonResource()
+        update_entities.return_value = 3
+        request = request_factory.get_request(
+            user=object(),
+            request_params={'name': 'John', 'limit': 10},
+            data={'email': 'john@bar.com', 'phone': '1234'})
+
+        response = resource.update_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(response.data, equal_to({'count': 3}))
+        update_entities.assert_called_once_with(
+            request, {'name': 'John'}, {'email': 'john@bar.com'})
+
+    def test_should_update_entities_one_by_one_by_default(self):
+        resource = PersonResource()
+        entities = [PersonEntity(name='John'), PersonEntity(name='John')]
+        PersonResource.entity_actions_cls.get_entity_list.return_value = \
+            entities
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John'},
+            data={'email': 'john@bar.com'})
+
+        response = resource.update_list(request)
+
+        assert_that(response.data, equal_to({'count': 2}))
+        assert_that(
+            PersonResource.entity_actions_cls.update_entity.call_args_list,
+            equal_to([call(request, entity, email='john@bar.com')
+                      for entity in entities]))
+
+    def test_should_validate_update_data(self):
+        resource = PersonResource()
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John'},
+            data={'email': 'not an email'})
+
+        response = resource.update_list(request)
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.reason, equal_to(error_types.InvalidData))
+
+    def test_should_not_allow_update_data_that_is_not_an_object(self):
+        resource = PersonResource()
+        for data in ([{'email': 'john@bar.com'}], {}):
+            request = request_factory.get_request(
+                user=object(), request_params={'name': 'John'}, data=data)
+
+            response = resource.update_list(request)
+
+            assert_that(response.is_success, equal_to(False))
+            assert_that(response.reason, equal_to(error_types.InvalidData))
+        assert_that(
+            PersonResource.entity_actions_cls.get_entity_list.called,
+            equal_to(False))
+
+    def test_should_require_a_filter(self):
+        resource = PersonResource()
+        request = request_factory.get_request(
+            user=object(), request_params={'limit': 10},
+            data={'email': 'john@bar.com'})
+
+        response = resource.update_list(request)
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.reason, equal_to(error_types.InvalidData))
+        assert_that(
+            PersonResource.entity_actions_cls.get_entity_list.called,
+            equal_to(False))
+
+    @patch.object(PersonResource.entity_actions_cls, 'delete_entities')
+    def test_should_delete_entities_matching_filters(self, delete_entities):
+        resource = PersonResource()
+        delete_entities.return_value = 2
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John'})
+
+        response = resource.delete_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(response.data, equal_to({'count': 2}))
+        delete_entities.assert_called_once_with(request, {'name': 'John'})
+
+    @patch.object(PersonResource.authorization_cls, 'add_read_list_filters')
+    @patch.object(PersonResource.entity_actions_cls, 'delete_entities')
+    def test_should_apply_read_list_filters_by_default(
+            self, delete_entities, add_read_list_filters):
+        def add_read_list_filters_side_effect(request):
+            request.context_params['request_filters']['email'] = 'a@b.com'
+            return request
+
+        add_read_list_filters.side_effect = add_read_list_filters_side_effect
+        resource = PersonResource()
+        delete_entities.return_value = 1
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John'})
+
+        resource.delete_list(request)
+
+        delete_entities.assert_called_once_with(
+            request, {'name': 'John', 'email': 'a@b.com'})
+
+    @patch.object(PersonResource.authorization_cls, 'authorize_update_detail')
+    def test_should_forbid_update_if_only_detail_is_authorized(
+            self, authorize_update_detail):
+        resource = PersonResource()
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John'},
+            data={'email': 'john@bar.com'})
+
+        response = resource.update_list(request)
+
+        assert_that(response.reason, equal_to(error_types.ActionForbidden))
+        assert_that(PersonResource.entity_actions_cls.update_entity.called,
+                    equal_to(False))
+
+    @patch.object(PersonResource.authorization_cls, 'authorize_delete_detail')
+    def test_should_forbid_delete_if_only_detail_is_authorized(
+            self, authorize_delete_detail):
+        resource = PersonResource()
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John'})
+
+        response = resource.delete_list(request)
+
+        assert_that(response.reason, equal_to(error_types.ActionForbidden))
+        assert_that(PersonResource.entity_actions_cls.delete_entity.called,
+                    equal_to(False))
+
+    def test_should_not_allow_bulk_actions_with_all_actions(self):
+        class AllActionsPersonResource(PersonResource):
+            allowed_actions = CrudActions.get_all_actions()
+
+        resource = AllActionsPersonResource()
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John'})
+
+        response = resource.delete_list(request)
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.reason, equal_to(error_types.MethodNotAllowed))
+        assert_that(PersonResource.entity_actions_cls.delete_entity.called,
+                    equal_to(False))
@@ -0,0 +1,96 @@
+from hamcrest import assert_that, equal_to
+from mock import call, patch
+
+from rip import error_types
+from rip.response import Response
+from tests import request_factory
+from tests.integration_tests.person_base_test_case import \
+    PersonResourceBaseTestCase
+from tests.integration_tests.person_resource import (
+    PersonResource, PersonEntity,)
+
+
+class CreateListCrudResourceIntegrationTest(PersonResourceBaseTestCase):
+    @patch.object(PersonResource.entity_actions_cls, 'create_entities')
+    def test_should_create_all_items_in_one_call(self, create_entities):
+        resource = PersonResource()
+        entities = [PersonEntity(name='John', email='john@bar.com',
+                                 phone='1234', address=None, nick_names=[]),
+                    PersonEntity(name='Jane', email='jane@bar.com',
+                                 phone='5678', address=None, nick_names=[])]
+        create_entities.return_value = entities
+        request = request_factory.get_request(
+            user=object(),
+            data=[{'name': 'John', 'email': 'john@bar.com', 'phone': '1234'},
+                  {'name': 'Jane', 'email': 'jane@bar.com'}])
+
+        response = resource.create_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        create_entities.assert_called_once_with(
+            request, [{'name': 'John', 'email': 'john@bar.com'},
+                      {'name': 'Jane', 'email': 'jane@bar.com'}])
+        assert_that(response.data['meta'],
+                    equal_to({'offset': 0, 'limit': 0, 'total': 2}))
+        assert_that([person['name'] for person in response.data['objects']],
+                    equal_to(['John', 'Jane']))
+
+    def test_should_create_entities_one_by_one_by_default(self):
+        resource = PersonResource()
+        PersonResource.entity_actions_cls.create_entity.side_effect = \
+            lambda request, **kwargs: PersonEntity(nick_names=[], **kwargs)
+        request = request_factory.get_request(
+            user=object(), data=[{'name': 'John'}, {'name': 'Jane'}])
+
+        response = resource.create_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(
+            PersonResource.entity_actions_cls.create_entity.call_args_list,
+            equal_to([call(request, name='John'), call(request, name='Jane')]))
+
+    @patch.object(PersonResource.authorization_cls, 'authorize_create_detail')
+    def test_should_authorize_every_item(self, authorize_create_detail):
+        def authorize_create_detail_side_effect(request):
+            if request.context_params['data']['name'] == 'Jane':
+                return Response(is_success=False,
+                                reason=error_types.ActionForbidden)
+            return request
+
+        authorize_create_detail.side_effect = \
+            authorize_create_detail_side_effect
+        resource = PersonResource()
+        request = request_factory.get_request(
+            user=object(), data=[{'name': 'John'}, {'name': 'Jane'}])
+
+        response = resource.create_list(request)
+
+        assert_that(response.reason, equal_to(error_types.ActionForbidden))
+        assert_that(authorize_create_detail.call_count, equal_to(2))
+        assert_that(PersonResource.entity_actions_cls.create_entity.called,
+                    equal_to(False))
+
+    def test_should_report_errors_per_item(self):
+        resource = PersonResource()
+        request = request_factory.get_request(
+            user=object(),
+            data=[{'name': 'John'}, {'email': 'jane@bar.com'}, 'Jack'])
+
+        response = resource.create_list(request)
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.data,
+                    equal_to({1: {'name': 'This field is required'},
+                              2: 'This item should be an object.'}))
+        assert_that(
+            PersonResource.entity_actions_cls.create_entity.called,
+            equal_to(False))
+
+    def test_should_not_accept_an_object(self):
+        resource = PersonResource()
+        request = request_factory.get_request(user=object(),
+                                              data={'name': 'John'})
+
+        response = resource.create_list(request)
+
+        assert_that(response.is_success, equal_to(False))
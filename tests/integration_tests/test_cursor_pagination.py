@@ -0,0 +1,214 @@
+import datetime
+import unittest
+
+from hamcrest import assert_that, equal_to, has_entries
+from mock import ANY, MagicMock, patch
+
+from rip import cursor_pagination, error_types
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.crud.crud_resource import CrudResource
+from rip.cursor_pagination import Keyset
+from rip.generic_steps.default_entity_actions import DefaultEntityActions
+from rip.schema.datetime_field import DateTimeField
+from rip.schema.integer_field import IntegerField
+from tests import request_factory
+from tests.integration_tests.person_base_test_case import \
+    PersonResourceBaseTestCase
+from tests.integration_tests.person_resource import PersonResource, \
+    PersonEntity
+
+
+class CursorPersonResource(PersonResource):
+    cursor_pagination = True
+
+
+class EventSchema(ApiSchema):
+    id = IntegerField()
+    created = DateTimeField()
+
+    class Meta:
+        schema_name = 'events'
+
+
+class EventEntityActions(DefaultEntityActions):
+    pass
+
+
+class EventResource(CrudResource):
+    cursor_pagination = True
+    schema_cls = EventSchema
+    order_by_fields = ['created']
+    allowed_actions = [CrudActions.READ_LIST]
+    entity_actions_cls = EventEntityActions
+
+
+def compare(values, other_values, order_by):
+    for value, other_value, name in zip(values, other_values, order_by):
+        result = cmp(value, other_value)
+        if name.startswith('-'):
+            result = -result
+        if result:
+            return result
+    return 0
+
+
+def get_entity_list(people):
+    """
+    :return: get_entity_list of a backend with keyset filtering
+    """
+    def get_entity_list_side_effect(request, order_by, limit, keyset=None,
+                                    **filters):
+        def get_values(entity):
+            return [getattr(entity, name.lstrip('-')) for name in order_by]
+
+        entities = sorted(people, cmp=lambda entity, other: compare(
+            get_values(entity), get_values(other), order_by))
+        if keyset is not None:
+            entities = [entity for entity in entities
+                        if compare(get_values(entity), keyset.values,
+                                   order_by) > 0]
+        return entities[:limit]
+    return get_entity_list_side_effect
+
+
+class CursorPaginationIntegrationTest(PersonResourceBaseTestCase):
+    def setUp(self):
+        super(CursorPaginationIntegrationTest, self).setUp()
+        self.people = [
+            PersonEntity(id=index, name=name, email=None, phone='1234',
+                         address=None, nick_names=[])
+            for index, name in enumerate(['Amy', 'Bob', 'Bob', 'Cal', 'Dan'])]
+        entity_actions_cls = CursorPersonResource.entity_actions_cls
+        entity_actions_cls.get_entity_list.side_effect = \
+            get_entity_list(self.people)
+        entity_actions_cls.get_entity_list_total_count.return_value = 5
+
+    def read_list(self, **request_params):
+        request = request_factory.get_request(user=object(),
+                                              request_params=request_params)
+        return CursorPersonResource().read_list(request)
+
+    def get_names(self, response):
+        return [person['name'] for person in response.data['objects']]
+
+    def test_first_page_has_only_next_cursor(self):
+        response = self.read_list(order_by='name', limit=2)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(self.get_names(response), equal_to(['Amy', 'Bob']))
+        assert_that(response.data['meta'],
+                    has_entries(limit=2, total=5, prev=None))
+        assert_that(response.data['meta']['next'] is not None,
+                    equal_to(True))
+        CursorPersonResource.entity_actions_cls.get_entity_list \
+            .assert_called_once_with(ANY, order_by=[
+                'name', 'id'], limit=3, offset=0)
+
+    def test_should_page_through_ties_with_next_and_prev(self):
+        first = self.read_list(order_by='name', limit=2)
+        second = self.read_list(order_by='name', limit=2,
+                                cursor=first.data['meta']['next'])
+        third = self.read_list(order_by='name', limit=2,
+                               cursor=second.data['meta']['next'])
+        back = self.read_list(order_by='name', limit=2,
+                              cursor=third.data['meta']['prev'])
+
+        assert_that(self.get_names(second), equal_to(['Bob', 'Cal']))
+        assert_that(self.get_names(third), equal_to(['Dan']))
+        assert_that(third.data['meta']['next'], equal_to(None))
+        assert_that(self.get_names(back), equal_to(['Bob', 'Cal']))
+        assert_that(back.data['meta']['prev'] is not None, equal_to(True))
+        assert_that(back.data['meta']['next'] is not None, equal_to(True))
+
+    def test_should_pass_cursor_as_keyset_filter(self):
+        cursor = cursor_pagination.encode_cursor(['-name', 'id'],
+                                                 ['Bob', 2],
+                                                 cursor_pagination.PREV)
+        response = self.read_list(order_by='-name', limit=2, cursor=cursor)
+
+        call_kwargs = CursorPersonResource.entity_actions_cls \
+            .get_entity_list.call_args[1]
+        assert_that(call_kwargs['keyset'],
+                    equal_to(Keyset(['name', '-id'], ['Bob', 2])))
+        assert_that(call_kwargs['order_by'], equal_to(['name', '-id']))
+        # the entities before the cursor, in the order of the request
+        assert_that(self.get_names(response), equal_to(['Cal', 'Bob']))
+        assert_that(response.data['meta']['prev'] is not None,
+                    equal_to(True))
+        assert_that(response.data['meta']['next'] is not None,
+                    equal_to(True))
+
+    def test_should_count_without_the_keyset(self):
+        first = self.read_list(order_by='name', limit=2)
+        self.read_list(order_by='name', limit=2,
+                       cursor=first.data['meta']['next'])
+
+        count = CursorPersonResource.entity_actions_cls \
+            .get_entity_list_total_count
+        assert_that(count.call_args[1], equal_to({}))
+
+    def test_should_not_allow_cursor_of_another_order(self):
+        first = self.read_list(order_by='name', limit=2)
+
+        response = self.read_list(limit=2, cursor=first.data['meta']['next'])
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.reason, equal_to(error_types.InvalidData))
+        assert_that(response.data,
+                    equal_to({'cursor': 'Cursor of another order_by'}))
+
+    def test_should_not_allow_invalid_cursor(self):
+        response = self.read_list(cursor='not a cursor')
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.data, equal_to({'cursor': 'Invalid cursor'}))
+
+    def test_should_not_allow_cursor_with_offset(self):
+        first = self.read_list(limit=2)
+
+        response = self.read_list(limit=2, offset=2,
+                                  cursor=first.data['meta']['next'])
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.data,
+                    equal_to({'cursor': 'Cannot be used with offset'}))
+
+    def test_should_fetch_sort_key_with_fields(self):
+        self.read_list(order_by='name', fields='email')
+
+        assert_that(
+            CursorPersonResource.entity_actions_cls.get_entity_list
+                .call_args[1]['fields'],
+            equal_to(['email', 'name', 'id']))
+
+
+class DateTimeCursorIntegrationTest(unittest.TestCase):
+    def test_should_page_through_entities_sharing_a_second(self):
+        events = [PersonEntity(id=index, created=datetime.datetime(
+            2014, 1, 1, 10, 0, 0, microsecond))
+            for index, microsecond in enumerate([300, 100, 200])]
+        resource = EventResource()
+        mock_get_entity_list = MagicMock(
+            side_effect=get_entity_list(events))
+        request_params = {'order_by': 'created', 'limit': 1}
+
+        ids = []
+        with patch.object(EventEntityActions, 'get_entity_list',
+                          mock_get_entity_list), \
+                patch.object(EventEntityActions,
+                             'get_entity_list_total_count',
+                             MagicMock(return_value=3)):
+            # a page more than there are events, in case a cursor repeats
+            for _ in range(len(events) + 1):
+                response = resource.read_list(request_factory.get_request(
+                    user=object(), request_params=dict(request_params)))
+                ids.extend(event['id'] for event in response.data['objects'])
+                if response.data['meta']['next'] is None:
+                    break
+                request_params['cursor'] = response.data['meta']['next']
+
+        assert_that(ids, equal_to([1, 2, 0]))
+        assert_that(mock_get_entity_list.call_args[1]['keyset'], equal_to(
+            Keyset(['created', 'id'],
+                   [datetime.datetime(2014, 1, 1, 10, 0, 0, 200), 2])))
@@ -1,10 +1,19 @@
 from hamcrest import assert_that, equal_to
 
 from rip import error_types
+from rip.api_schema import ApiSchema
+from rip.crud.crud_resource import CrudResource
+from rip.filter_operators import EQUALS
+from rip.generic_steps.default_schema_serializer import \
+    DefaultEntitySerializer
+from rip.schema.integer_field import IntegerField
+from rip.schema.string_field import StringField
 from tests import request_factory
 from tests.integration_tests.person_base_test_case import \
     PersonResourceBaseTestCase
-from tests.integration_tests.person_resource import PersonResource, PersonEntity
+from tests.integration_tests.person_resource import PersonResource, \
+    PersonEntity, PersonSchema, FriendEntityActions
+from tests.utils import patch_class_field
 
 
 class ListCrudResourceIntegrationTest(PersonResourceBaseTestCase):
@@ -102,4 +111,167 @@ class ListCrudResourceIntegrationTest(PersonResourceBaseTestCase):
 
         response = resource.read_list(request)
         assert response.is_success is True
-        assert 'Johnny' in response.data['objects'][0]['nick_names']
\ No newline at end of file
+        assert 'Johnny' in response.data['objects'][0]['nick_names']
+
+    def test_should_expand_requested_sub_resources(self):
+        resource = PersonResource()
+        entity_actions = resource.configuration['entity_actions']
+        entity_actions.get_entity_list.return_value = [
+            PersonEntity(name='John', email=None, phone='1234', address=None,
+                         company=None, nick_names=[])]
+        entity_actions.get_entity_list_total_count.return_value = 1
+        FriendEntityActions.get_entity_list.return_value = [
+            dict(name='Jack', relationship_type='platonic')]
+        FriendEntityActions.get_entity_list_total_count.return_value = 1
+        request = request_factory.get_request(user=object(), request_params={
+            'expand': 'friends'})
+
+        response = resource.read_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        person = response.data['objects'][0]
+        assert_that(person['friends'][0]['name'], equal_to('Jack'))
+        self.assertTrue('company' not in person)
+        assert_that(
+            sorted(entity_actions.get_entity_list.call_args[1].keys()),
+            equal_to(['limit', 'offset']))
+
+    def test_should_fail_expanding_non_sub_resource_fields(self):
+        resource = PersonResource()
+        request = request_factory.get_request(user=object(), request_params={
+            'expand': 'friends,email'})
+
+        response = resource.read_list(request)
+
+        assert response.is_success is False
+        assert response.reason is error_types.InvalidData
+        assert_that(response.data, equal_to(
+            {'email': 'Expanding this field is not allowed'}))
+
+    @patch_class_field(PersonSchema._meta, 'link_unexpanded', True)
+    def test_should_link_unexpanded_sub_resources(self):
+        resource = PersonResource()
+        entity_actions = resource.configuration['entity_actions']
+        entity_actions.get_entity_list.return_value = [
+            PersonEntity(name='John', email=None, phone='1234', address=None,
+                         company=None, nick_names=[])]
+        request = request_factory.get_request(user=object(), request_params={
+            'expand': ''})
+
+        response = resource.read_detail(request)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(response.data['friends'],
+                    equal_to('/api/v2/persons/John/friends/'))
+        assert_that(response.data['company'],
+                    equal_to('/api/v2/persons/John/companies/'))
+
+    def test_should_serialize_and_fetch_requested_fields_only(self):
+        resource = PersonResource()
+        entity_actions = resource.configuration['entity_actions']
+        entity_actions.get_entity_list.return_value = [
+            PersonEntity(name='John', email=None, phone='1234',
+                         address={'city': 'bangalore', 'country': 'India'},
+                         company=None, nick_names=[])]
+        entity_actions.get_entity_list_total_count.return_value = 1
+        request = request_factory.get_request(user=object(), request_params={
+            'fields': 'name,address'})
+
+        response = resource.read_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(response.data['objects'], equal_to(
+            [{'name': 'John',
+              'address': {'city': 'bangalore', 'country': 'India'}}]))
+        assert_that(entity_actions.get_entity_list.call_args[1]['fields'],
+                    equal_to(['name', 'address']))
+        self.assertTrue('fields' not in
+                        entity_actions.get_entity_list_total_count.call_args[1])
+
+    def test_should_report_total_mode_if_not_counted_exactly(self):
+        resource = PersonResource()
+        entity_actions = resource.configuration['entity_actions']
+        entity_actions.get_entity_list.return_value = []
+        request = request_factory.get_request(user=object(),
+                                              request_params={'total': 'none'})
+
+        response = resource.read_list(request)
+
+        assert_that(response.data['meta'], equal_to(
+            {'offset': 0, 'limit': 20, 'total': None, 'total_mode': 'none'}))
+        self.assertFalse(entity_actions.get_entity_list_total_count.called)
+        self.assertTrue(
+            'total' not in entity_actions.get_entity_list.call_args[1])
+
+    def test_should_fail_requesting_unknown_total_mode(self):
+        resource = PersonResource()
+        request = request_factory.get_request(user=object(), request_params={
+            'total': 'approximate'})
+
+        response = resource.read_list(request)
+
+        assert response.is_success is False
+        assert_that(response.reason, equal_to(error_types.InvalidData))
+
+    def test_should_fail_requesting_unknown_fields(self):
+        resource = PersonResource()
+        request = request_factory.get_request(user=object(), request_params={
+            'fields': ['name', 'age']})
+
+        response = resource.read_list(request)
+
+        assert response.is_success is False
+        assert_that(response.data, equal_to({'age': 'No such field'}))
+
+    def test_should_serialize_list_with_overridden_serialize_entity(self):
+        class NameSerializer(DefaultEntitySerializer):
+            def serialize_entity(self, request, entity):
+                return {'name': entity.name.upper()}
+
+        class NamePersonResource(PersonResource):
+            serializer_cls = NameSerializer
+
+        resource = NamePersonResource()
+        entity_actions = resource.configuration['entity_actions']
+        entity_actions.get_entity_list.return_value = [
+            PersonEntity(name='John', email=None, phone='1234',
+                         address=None, nick_names=[])]
+        entity_actions.get_entity_list_total_count.return_value = 1
+
+        list_response = resource.read_list(
+            request_factory.get_request(user=object()))
+        detail_response = resource.read_detail(
+            request_factory.get_request(user=object(),
+                                        request_params={'name': 'John'}))
+
+        assert_that(list_response.data['objects'],
+                    equal_to([{'name': 'JOHN'}]))
+        assert_that(detail_response.data, equal_to({'name': 'JOHN'}))
+
+    def test_should_filter_by_field_named_like_a_param(self):
+        class ScoreSchema(ApiSchema):
+            name = StringField()
+            total = IntegerField()
+
+            class Meta:
+                schema_name = 'scores'
+
+        class ScoreResource(CrudResource):
+            schema_cls = ScoreSchema
+            filter_by_fields = {'total': EQUALS}
+            entity_actions_cls = PersonResource.entity_actions_cls
+
+        resource = ScoreResource()
+        entity_actions = resource.configuration['entity_actions']
+        entity_actions.get_entity_list.return_value = []
+        entity_actions.get_entity_list_total_count.return_value = 0
+        request = request_factory.get_request(user=object(),
+                                              request_params={'total': 3})
+
+        response = resource.read_list(request)
+
+        assert_that(response.is_success, equal_to(True))
+        assert_that(entity_actions.get_entity_list.call_args[1]['total'],
+                    equal_to(3))
+        assert_that(entity_actions.get_entity_list_total_count.call_args[1],
+                    equal_to({'total': 3}))
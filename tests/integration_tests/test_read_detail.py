@@ -2,6 +2,7 @@ from hamcrest import assert_that, equal_to
 
 from mock import patch
 
+from rip import error_types
 from tests import request_factory
 
 from tests.integration_tests.person_base_test_case import \
@@ -45,8 +46,8 @@ class GetCrudResourceIntegrationTest(PersonResourceBaseTestCase):
         response = resource.read_detail(request)
 
         assert_that(response.is_success, equal_to(True))
-        entity_actions.get_entity_list.assert_called_once_with(request,
-                                                               name='bar')
+        entity_actions.get_entity_list.assert_called_once_with(
+            request, name='bar', offset=0, limit=2)
 
 
     @patch.object(CompanyResource.entity_actions_cls, 'get_entity_list')
@@ -114,4 +115,30 @@ class GetCrudResourceIntegrationTest(PersonResourceBaseTestCase):
         assert_that(response.is_success, equal_to(True))
         expected_data = expected_entities[0].__dict__
         expected_data.update(friends=[])
-        assert_that(response.data, equal_to(expected_data))
\ No newline at end of file
+        assert_that(response.data, equal_to(expected_data))
+
+    def test_should_fail_requesting_unknown_fields(self):
+        resource = PersonResource()
+        entity_actions = resource.configuration['entity_actions']
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John',
+                                           'fields': ['name', 'bogus']})
+
+        response = resource.read_detail(request)
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.reason, equal_to(error_types.InvalidData))
+        assert_that(response.data, equal_to({'bogus': 'No such field'}))
+        assert_that(entity_actions.get_entity_list.called, equal_to(False))
+
+    def test_should_fail_expanding_non_sub_resource_fields(self):
+        resource = PersonResource()
+        request = request_factory.get_request(
+            user=object(), request_params={'name': 'John', 'expand': 'bogus'})
+
+        response = resource.read_detail(request)
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.reason, equal_to(error_types.InvalidData))
+        assert_that(response.data,
+                    equal_to({'bogus': 'Expanding this field is not allowed'}))
@@ -0,0 +1,70 @@
+from hamcrest import assert_that, equal_to
+from mock import patch
+
+from rip import error_types
+from rip.response import Response
+from tests import request_factory
+from tests.integration_tests.person_base_test_case import \
+    PersonResourceBaseTestCase
+from tests.integration_tests.person_resource import PersonResource, \
+    PersonEntity
+
+
+class ReadMultipleCrudResourceIntegrationTest(PersonResourceBaseTestCase):
+    def setUp(self):
+        super(ReadMultipleCrudResourceIntegrationTest, self).setUp()
+        self.john = PersonEntity(id='1', name='John', email='john@bar.com',
+                                 phone='1234', address=None, nick_names=[])
+        self.jane = PersonEntity(id='3', name='Jane', email='jane@bar.com',
+                                 phone='5678', address=None, nick_names=[])
+        PersonResource.entity_actions_cls.get_entity_list.return_value = \
+            [self.jane, self.john]
+
+    def get_request(self, **request_params):
+        request_params.setdefault('id__in', ['1', '2', '3', '1'])
+        return request_factory.get_request(user=object(),
+                                           request_params=request_params)
+
+    def test_should_read_all_ids_in_one_call(self):
+        resource = PersonResource()
+        request = self.get_request()
+
+        response = resource.read_multiple(request)
+
+        assert_that(response.is_success, equal_to(True))
+        PersonResource.entity_actions_cls.get_entity_list \
+            .assert_called_once_with(request, id__in=['1', '2', '3', '1'])
+        assert_that([person['name'] for person in response.data['objects']],
+                    equal_to(['John', 'Jane']))
+        assert_that(response.data['not_found'], equal_to(['2']))
+
+    def test_should_fetch_id_with_fields(self):
+        resource = PersonResource()
+        request = self.get_request(fields='name')
+
+        response = resource.read_multiple(request)
+
+        assert_that(response.data['objects'],
+                    equal_to([{'name': 'John'}, {'name': 'Jane'}]))
+        assert_that(
+            PersonResource.entity_actions_cls.get_entity_list.call_args[1][
+                'fields'],
+            equal_to(['name', 'id']))
+
+    @patch.object(PersonResource.authorization_cls, 'authorize_read_detail')
+    def test_should_authorize_every_entity(self, authorize_read_detail):
+        def authorize_read_detail_side_effect(request):
+            if request.context_params['entity'].name == 'Jane':
+                return Response(is_success=False,
+                                reason=error_types.ActionForbidden)
+            return request
+
+        authorize_read_detail.side_effect = authorize_read_detail_side_effect
+        resource = PersonResource()
+
+        response = resource.read_multiple(self.get_request())
+
+        assert_that(authorize_read_detail.call_count, equal_to(2))
+        assert_that([person['name'] for person in response.data['objects']],
+                    equal_to(['John']))
+        assert_that(response.data['not_found'], equal_to(['2', '3']))
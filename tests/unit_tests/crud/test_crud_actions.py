@@ -41,3 +41,13 @@ class TestAllActions(unittest.TestCase):
         assert CrudActions.CREATE_OR_UPDATE_DETAIL in all_actions
         assert CrudActions.DELETE_DETAIL in all_actions
         assert CrudActions.GET_AGGREGATES in all_actions
+
+    def test_should_not_allow_bulk_actions_with_all_actions(self):
+        all_actions = CrudActions.get_all_actions()
+
+        for action in CrudActions.get_bulk_actions():
+            assert action not in all_actions
+        assert CrudActions.READ_MULTIPLE in CrudActions.get_bulk_actions()
+        assert CrudActions.CREATE_LIST in CrudActions.get_bulk_actions()
+        assert CrudActions.UPDATE_LIST in CrudActions.get_bulk_actions()
+        assert CrudActions.DELETE_LIST in CrudActions.get_bulk_actions()
@@ -87,10 +87,12 @@ class TestCrudPipelineFactory(unittest.TestCase):
             convert_serialized_data_to_response = MagicMock()
         post_action_hooks = MagicMock()
         post_action_hooks.read_detail_hook = read_detail_hook = MagicMock()
+        request_params_validation = MagicMock()
 
         compose_pipeline.return_value = expected_pipeline = MagicMock()
         configuration = {
             'entity_actions': entity_actions,
+            'request_params_validation': request_params_validation,
             'authentication': authentication,
             'authorization': authorization,
             'serializer': serializer,
@@ -106,6 +108,7 @@ class TestCrudPipelineFactory(unittest.TestCase):
             name=CrudActions.READ_DETAIL,
             pipeline=[
                 authentication.authenticate,
+                request_params_validation.validate_read_detail_params,
                 clean_data_for_read_detail,
                 read_detail,
                 authorize_read_detail,
@@ -340,6 +343,144 @@ class TestCrudPipelineFactory(unittest.TestCase):
                 convert_serialized_data_to_response
             ])
 
+    @mock_patch.object(pipeline_composer, 'compose_pipeline')
+    def test_create_list_pipeline_has_all_steps_in_the_right_order(
+            self,
+            compose_pipeline):
+        configuration = {
+            'entity_actions': MagicMock(),
+            'authentication': MagicMock(),
+            'authorization': MagicMock(),
+            'schema_validation': MagicMock(),
+            'serializer': MagicMock(),
+            'data_cleaner': MagicMock(),
+            'post_action_hooks': MagicMock(),
+            'response_converter': MagicMock()
+        }
+
+        compose_pipeline.return_value = expected_pipeline = MagicMock()
+
+        pipeline = crud_pipeline_factory.create_list_pipeline(configuration)
+
+        assert_that(pipeline, equal_to(expected_pipeline))
+        compose_pipeline.assert_called_once_with(
+            name=CrudActions.CREATE_LIST,
+            pipeline=[
+                configuration['authentication'].authenticate,
+                configuration['schema_validation'].validate_request_data_list,
+                configuration['data_cleaner'].clean_data_for_create_list,
+                configuration['authorization'].authorize_create_list,
+                configuration['entity_actions'].create_list,
+                configuration['serializer'].serialize_list,
+                configuration['post_action_hooks'].create_list_hook,
+                configuration['response_converter']
+                    .convert_serialized_data_to_response
+            ])
+
+    @mock_patch.object(pipeline_composer, 'compose_pipeline')
+    def test_read_multiple_pipeline_has_all_steps_in_the_right_order(
+            self,
+            compose_pipeline):
+        configuration = {
+            'entity_actions': MagicMock(),
+            'authentication': MagicMock(),
+            'authorization': MagicMock(),
+            'request_params_validation': MagicMock(),
+            'serializer': MagicMock(),
+            'data_cleaner': MagicMock(),
+            'post_action_hooks': MagicMock(),
+            'response_converter': MagicMock()
+        }
+
+        compose_pipeline.return_value = expected_pipeline = MagicMock()
+
+        pipeline = crud_pipeline_factory.read_multiple_pipeline(configuration)
+
+        assert_that(pipeline, equal_to(expected_pipeline))
+        compose_pipeline.assert_called_once_with(
+            name=CrudActions.READ_MULTIPLE,
+            pipeline=[
+                configuration['authentication'].authenticate,
+                configuration['request_params_validation']
+                    .validate_read_detail_params,
+                configuration['data_cleaner'].clean_data_for_read_multiple,
+                configuration['entity_actions'].read_multiple,
+                configuration['authorization'].authorize_read_multiple,
+                configuration['serializer'].serialize_multiple,
+                configuration['post_action_hooks'].read_multiple_hook,
+                configuration['response_converter']
+                    .convert_serialized_data_to_response
+            ])
+
+    @mock_patch.object(pipeline_composer, 'compose_pipeline')
+    def test_update_list_pipeline_has_all_steps_in_the_right_order(
+            self,
+            compose_pipeline):
+        configuration = {
+            'entity_actions': MagicMock(),
+            'authentication': MagicMock(),
+            'authorization': MagicMock(),
+            'request_params_validation': MagicMock(),
+            'schema_validation': MagicMock(),
+            'data_cleaner': MagicMock(),
+            'post_action_hooks': MagicMock(),
+            'response_converter': MagicMock()
+        }
+
+        compose_pipeline.return_value = expected_pipeline = MagicMock()
+
+        pipeline = crud_pipeline_factory.update_list_pipeline(configuration)
+
+        assert_that(pipeline, equal_to(expected_pipeline))
+        compose_pipeline.assert_called_once_with(
+            name=CrudActions.UPDATE_LIST,
+            pipeline=[
+                configuration['authentication'].authenticate,
+                configuration['request_params_validation']
+                    .validate_bulk_request_params,
+                configuration['schema_validation']
+                    .validate_request_data_for_update_list,
+                configuration['data_cleaner'].clean_data_for_update_list,
+                configuration['authorization'].add_update_list_filters,
+                configuration['entity_actions'].update_list,
+                configuration['post_action_hooks'].update_list_hook,
+                configuration['response_converter']
+                    .convert_affected_count_to_response
+            ])
+
+    @mock_patch.object(pipeline_composer, 'compose_pipeline')
+    def test_delete_list_pipeline_has_all_steps_in_the_right_order(
+            self,
+            compose_pipeline):
+        configuration = {
+            'entity_actions': MagicMock(),
+            'authentication': MagicMock(),
+            'authorization': MagicMock(),
+            'request_params_validation': MagicMock(),
+            'data_cleaner': MagicMock(),
+            'post_action_hooks': MagicMock(),
+            'response_converter': MagicMock()
+        }
+
+        compose_pipeline.return_value = expected_pipeline = MagicMock()
+
+        pipeline = crud_pipeline_factory.delete_list_pipeline(configuration)
+
+        assert_that(pipeline, equal_to(expected_pipeline))
+        compose_pipeline.assert_called_once_with(
+            name=CrudActions.DELETE_LIST,
+            pipeline=[
+                configuration['authentication'].authenticate,
+                configuration['request_params_validation']
+                    .validate_bulk_request_params,
+                configuration['data_cleaner'].clean_data_for_delete_list,
+                configuration['authorization'].add_delete_list_filters,
+                configuration['entity_actions'].delete_list,
+                configuration['post_action_hooks'].delete_list_hook,
+                configuration['response_converter']
+                    .convert_affected_count_to_response
+            ])
+
     @mock_patch.object(pipeline_composer, 'compose_pipeline')
     def test_get_aggregates_pipeline_has_all_steps_in_the_right_order(
             self, compose_pipeline):
@@ -6,6 +6,7 @@ from rip.api_schema import ApiSchema
 from rip.crud.crud_resource import CrudResource, CrudActions, \
     crud_pipeline_factory
 from rip.generic_steps import default_authentication
+from rip.generic_steps.default_authorization import DefaultAuthorization
 from rip.generic_steps.default_entity_actions import \
     DefaultEntityActions
 from rip.pipeline_composer import PipelineComposer
@@ -145,6 +146,84 @@ class TestMethodNotAllowed(unittest.TestCase):
 
     def test_forbidden_response_if_methods_not_allowed(self):
         request = MagicMock()
-        for action in CrudActions.get_all_actions():
+        for action in CrudActions.get_all_actions() + \
+                CrudActions.get_bulk_actions():
             response = getattr(self.test_resource, action)(request=request)
             self.assert_forbidden_response(response)
+
+
+class TestCrudResourcePipelineRegistry(unittest.TestCase):
+    def setUp(self):
+        class TestSchema(ApiSchema):
+            name = StringField(max_length=32)
+
+        class TestResource(CrudResource):
+            schema_cls = TestSchema
+            authentication_cls = MagicMock()
+
+        self.TestResource = TestResource
+
+    @patch.object(crud_pipeline_factory, 'read_list_pipeline')
+    def test_pipeline_is_compiled_once(self, read_list_pipeline):
+        read_list_pipeline.return_value = pipeline = MagicMock()
+        test_resource = self.TestResource()
+
+        test_resource.read_list(request=MagicMock())
+        test_resource.read_list(request=MagicMock())
+
+        read_list_pipeline.assert_called_once_with(
+            configuration=test_resource.configuration)
+        self.assertEqual(pipeline.call_count, 2)
+
+    @patch.object(crud_pipeline_factory, 'read_list_pipeline')
+    def test_invalidated_pipeline_is_compiled_again(self, read_list_pipeline):
+        test_resource = self.TestResource()
+        read_list_pipeline.return_value = new_pipeline = MagicMock()
+
+        test_resource.invalidate_pipelines(CrudActions.READ_LIST)
+        test_resource.read_list(request=MagicMock())
+
+        self.assertEqual(read_list_pipeline.call_count, 2)
+        self.assertEqual(new_pipeline.call_count, 1)
+
+    def test_invalidate_without_actions_clears_registry(self):
+        test_resource = self.TestResource()
+
+        test_resource.invalidate_pipelines()
+
+        self.assertEqual(test_resource.pipelines, {})
+
+
+class TestCrudResourcePassThroughSteps(unittest.TestCase):
+    def setUp(self):
+        class TestSchema(ApiSchema):
+            name = StringField(max_length=32)
+
+        self.schema = TestSchema
+
+    def test_default_authorization_is_elided(self):
+        class TestResource(CrudResource):
+            schema_cls = self.schema
+
+        test_resource = TestResource()
+
+        pipeline = test_resource.get_pipeline(CrudActions.READ_LIST)
+        authorization = test_resource.configuration['authorization']
+        self.assertNotIn(authorization.add_read_list_filters,
+                         pipeline.pipeline)
+        self.assertEqual(len(pipeline.pipeline), 6)
+
+    def test_overridden_authorization_is_kept(self):
+        class TestAuthorization(DefaultAuthorization):
+            def add_read_list_filters(self, request):
+                return request
+
+        class TestResource(CrudResource):
+            schema_cls = self.schema
+            authorization_cls = TestAuthorization
+
+        test_resource = TestResource()
+
+        pipeline = test_resource.get_pipeline(CrudActions.READ_LIST)
+        authorization = test_resource.configuration['authorization']
+        self.assertIn(authorization.add_read_list_filters, pipeline.pipeline)
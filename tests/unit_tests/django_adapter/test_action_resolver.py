@@ -3,7 +3,9 @@ import unittest
 from hamcrest import assert_that, equal_to
 from mock import MagicMock
 
+from rip.api import Api
 from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
 from rip.crud.crud_resource import CrudResource
 from rip.django_adapter import action_resolver
 from rip.view.view_resource import ViewResource
@@ -17,112 +19,55 @@ class MockSchema(ApiSchema):
 
 
 class MockResource(CrudResource):
-    schema_cls = MockSchema()
+    schema_cls = MockSchema
+    allowed_actions = CrudActions.get_all_actions()
+
 
 class MockViewResource(ViewResource):
-    schema_cls = MockSchema()
+    schema_cls = MockSchema
 
 
 class TestActionResolver(unittest.TestCase):
-    def test_resolve_update_action_on_api(self):
+    def setUp(self):
+        self.api = Api(name='api')
+        self.resource = MockResource()
+        self.view_resource = MockViewResource()
+        self.api.register_resource('mock', self.resource)
+        self.api.register_resource('views/mock', self.view_resource)
+
+    def resolve(self, method, url):
         mock_http_request = MagicMock()
-        mock_http_request.method = 'PATCH'
-        mock_api = MagicMock()
-        mock_resource = MockResource()
-        mock_api.resolve_resource.return_value = mock_resource
-        mock_resource.update_detail = expected_action = MagicMock()
+        mock_http_request.method = method
+        return action_resolver.resolve_route_action(
+            mock_http_request, self.api.match_route(url))
 
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo/1')
-        assert_that(action, equal_to(expected_action))
+    def test_resolve_update_action_on_api(self):
+        assert_that(self.resolve('PATCH', 'mock/1'),
+                    equal_to(self.resource.update_detail))
 
     def test_resolve_put_action_on_api(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'PUT'
-        mock_api = MagicMock()
-        mock_resource = MockResource()
-        mock_api.resolve_resource.return_value = mock_resource
-        mock_resource.create_or_update_detail = expected_action = MagicMock()
-
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo/1')
-        assert_that(action, equal_to(expected_action))
+        assert_that(self.resolve('PUT', 'mock/1'),
+                    equal_to(self.resource.create_or_update_detail))
 
     def test_resolve_detail_action_on_api(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'DELETE'
-        mock_api = MagicMock()
-        mock_resource = MockResource()
-        mock_api.resolve_resource.return_value = mock_resource
-        mock_resource.delete_detail = expected_delete_action = MagicMock()
-
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo/1')
-        assert_that(action, equal_to(expected_delete_action))
+        assert_that(self.resolve('DELETE', 'mock/1'),
+                    equal_to(self.resource.delete_detail))
 
     def test_resolve_post_on_list_as_create_detail(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'POST'
-        mock_api = MagicMock()
-        mock_resource = MockResource()
-        mock_api.resolve_resource.return_value = mock_resource
-        mock_resource.create_detail = expected_create_action = MagicMock()
-
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo')
-        assert_that(action, equal_to(expected_create_action))
-
-    def test_resolve_non_existing_endpoint(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'DELETE'
-        mock_api = MagicMock(
-            spec_set=[])
-
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo')
-        assert_that(action, equal_to(None))
-
-    def test_resolve_non_existing_action_delete(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'DELETE'
-        mock_api = MagicMock()
-        mock_resource = object()
-        mock_api.resolve_resource.return_value = mock_resource
-
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo')
-        assert_that(action, equal_to(None))
+        assert_that(self.resolve('POST', 'mock'),
+                    equal_to(self.resource.create_detail))
 
-    def test_resolve_non_existing_action_put(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'PUT'
-        mock_api = MagicMock()
-        mock_resource = object()
-        mock_api.resolve_resource.return_value = mock_resource
+    def test_resolve_non_existing_action_options(self):
+        assert_that(self.resolve('OPTIONS', 'mock'), equal_to(None))
 
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo')
-        assert_that(action, equal_to(None))
+    def test_resolve_not_allowed_action(self):
+        self.resource.allowed_actions = [CrudActions.READ_LIST]
 
-    def test_resolve_non_existing_action_options(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'OPTIONS'
-        mock_api = MagicMock()
-        mock_resource = object()
-        mock_api.resolve_resource.return_value = mock_resource
+        action = self.resolve('DELETE', 'mock/1')
 
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo')
-        assert_that(action, equal_to(None))
+        assert_that(action_resolver.is_method_not_allowed(action),
+                    equal_to(True))
 
     def test_resolve_view_action(self):
-        mock_http_request = MagicMock()
-        mock_http_request.method = 'GET'
-        mock_api = MagicMock()
-        mock_resource = MockViewResource()
-        mock_api.resolve_resource.return_value = mock_resource
-        mock_resource.read = expected_read_action = MagicMock()
-
-        action = action_resolver.resolve_action(mock_http_request, api=mock_api,
-                                                url='foo')
-        assert_that(action, equal_to(expected_read_action))
+        assert_that(self.resolve('GET', 'views/mock'),
+                    equal_to(self.view_resource.read))
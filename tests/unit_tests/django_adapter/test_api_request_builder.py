@@ -67,6 +67,11 @@ class TestBuildApiRequest(unittest.TestCase):
                     has_entry('api_version', mock_api.version))
         assert_that(request.context_params,
                     has_entry('api_name', mock_api.name))
+        assert_that(request.context_params,
+                    has_entry('thread_pool',
+                              mock_api.get_thread_pool.return_value))
+        assert_that(request.context_params,
+                    has_entry('resource_registry', mock_api.resource_registry))
 
     @patch.object(conf, 'settings')
     @patch.object(metadata_factory, 'api_breadcrumb_filters')
@@ -0,0 +1,125 @@
+import json
+import unittest
+
+from mock import ANY, MagicMock, call, patch
+
+from rip.django_adapter import api_request_builder, batch_handler, \
+    db_connections
+
+
+class TestExecuteSubRequests(unittest.TestCase):
+    def test_should_execute_in_order_without_thread_pool(self):
+        execute = MagicMock(side_effect=lambda sub_request: sub_request['url'])
+
+        results = batch_handler.execute_sub_requests(
+            [{'url': 'a'}, {'url': 'b', 'method': 'POST'}], execute)
+
+        self.assertEqual(results, ['a', 'b'])
+
+    @patch.object(db_connections, 'close_db_connections')
+    def test_should_map_reads_before_first_write_on_thread_pool(
+            self, mock_close_db_connections):
+        execute = MagicMock(side_effect=lambda sub_request: sub_request['url'])
+        thread_pool = MagicMock()
+        thread_pool.map.side_effect = lambda func, items: map(func, items)
+        reads = [{'url': 'a'}, {'url': 'b', 'method': 'get'}]
+        write = {'url': 'c', 'method': 'PATCH'}
+        last_reads = [{'url': 'd'}, {'url': 'e'}]
+
+        results = batch_handler.execute_sub_requests(
+            reads + [write] + last_reads, execute, thread_pool=thread_pool)
+
+        self.assertEqual(results, ['a', 'b', 'c', 'd', 'e'])
+        thread_pool.map.assert_called_once_with(ANY, reads)
+        self.assertEqual(execute.call_args_list,
+                         [call(read) for read in reads] +
+                         [call(write)] +
+                         [call(read) for read in last_reads])
+        # once per read run on the thread pool, not for the others
+        self.assertEqual(mock_close_db_connections.call_count, 2)
+
+
+class TestExecuteSubRequest(unittest.TestCase):
+    def test_should_reject_request_without_url(self):
+        result = batch_handler.execute_sub_request(
+            {'method': 'GET'}, MagicMock(), None, MagicMock())
+
+        self.assertEqual(result['status'], 400)
+
+    def test_should_return_not_found_for_unknown_url(self):
+        api = MagicMock()
+        api.match_route.return_value = None
+
+        result = batch_handler.execute_sub_request(
+            {'url': '/unknown/'}, MagicMock(), None, api)
+
+        api.match_route.assert_called_once_with('unknown')
+        self.assertEqual(result['status'], 404)
+
+    @patch.object(api_request_builder, 'build_sub_request')
+    def test_should_call_action_of_route(self, mock_build_sub_request):
+        api = MagicMock()
+        route_match = api.match_route.return_value
+        action = route_match.get_action.return_value
+        action.return_value = MagicMock(is_success=True, data={'id': 1})
+        http_request, user = MagicMock(), MagicMock()
+
+        result = batch_handler.execute_sub_request(
+            {'url': 'teams', 'method': 'post', 'body': {'name': 'rip'}},
+            http_request, user, api)
+
+        route_match.get_action.assert_called_once_with('POST', many=False)
+        mock_build_sub_request.assert_called_once_with(
+            http_request=http_request, user=user, route_match=route_match,
+            api=api, request_params={}, request_data={'name': 'rip'})
+        action.assert_called_once_with(mock_build_sub_request.return_value)
+        self.assertEqual(result, {'status': 201, 'body': {'id': 1}})
+
+    def test_should_return_server_error_for_failing_action(self):
+        api = MagicMock()
+        action = api.match_route.return_value.get_action.return_value
+        action.side_effect = ValueError
+
+        with patch.object(batch_handler.logger, 'exception'):
+            result = batch_handler.execute_sub_request(
+                {'url': 'teams'}, MagicMock(), None, api)
+
+        self.assertEqual(result['status'], 500)
+
+
+class TestHandleBatchCall(unittest.TestCase):
+    def get_http_request(self, body):
+        http_request = MagicMock(method='POST',
+                                 META={'CONTENT_TYPE': 'application/json'})
+        http_request.read.return_value = body
+        return http_request
+
+    def test_should_only_allow_post(self):
+        response = batch_handler.handle_batch_call(MagicMock(method='GET'),
+                                                   MagicMock())
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_should_reject_body_that_is_not_a_list(self):
+        response = batch_handler.handle_batch_call(
+            self.get_http_request('{"url": "teams"}'), MagicMock())
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_should_reject_batch_larger_than_max_batch_size(self):
+        response = batch_handler.handle_batch_call(
+            self.get_http_request(json.dumps([{'url': 'teams'}] * 3)),
+            MagicMock(), max_batch_size=2)
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(batch_handler, 'execute_sub_requests')
+    def test_should_reject_batch_without_user(self,
+                                              mock_execute_sub_requests):
+        http_request = self.get_http_request(json.dumps([{'url': 'teams'}]))
+        http_request.user.is_anonymous.return_value = True
+
+        response = batch_handler.handle_batch_call(http_request, MagicMock())
+
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(mock_execute_sub_requests.called)
@@ -0,0 +1,14 @@
+import unittest
+
+from mock import MagicMock, patch
+
+from rip.django_adapter import db_connections
+
+
+class TestCloseDbConnections(unittest.TestCase):
+    @patch.object(db_connections, 'settings', MagicMock(configured=False))
+    def test_should_do_nothing_without_django_settings(self):
+        result = db_connections.run_and_close_db_connections(
+            lambda value: value + 1, 1)
+
+        self.assertEqual(result, 2)
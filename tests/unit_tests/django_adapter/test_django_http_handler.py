@@ -1,6 +1,7 @@
 import json
 
-from django.http import HttpResponseNotAllowed, HttpResponseBadRequest
+from django.http import HttpResponseNotAllowed, HttpResponseBadRequest, \
+    HttpResponseNotFound
 from django.utils import unittest
 from hamcrest.core import assert_that
 from hamcrest.core.core.isequal import equal_to
@@ -9,47 +10,69 @@ from mock import MagicMock, patch
 from rip.django_adapter import django_response_builder, \
     action_resolver, django_http_handler
 from rip.django_adapter import api_request_builder
+from rip.route_match import method_not_allowed
 
 
 class DjangoHttpHandler(unittest.TestCase):
     @patch.object(api_request_builder, 'build_request')
     @patch.object(django_response_builder, 'build_http_response')
-    @patch.object(action_resolver, 'resolve_action')
-    @patch.object(action_resolver, 'is_valid_resource')
+    @patch.object(action_resolver, 'resolve_route_action')
     def test_handle_api_call_for_unhandled_action(self,
-                                                  mock_is_valid_resource,
                                                   mock_resolve_action,
                                                   mock_build_response,
                                                   mock_build_request):
-        mock_is_valid_resource.return_value = True
         mock_resolve_action.return_value = None
 
         mock_http_request = MagicMock()
         mock_api = MagicMock()
+        mock_api.match_route.return_value = route_match = MagicMock()
 
         response = django_http_handler.handle_api_call(
             mock_http_request, 'test_endpoint', mock_api)
 
-        mock_is_valid_resource.assert_called_once_with('test_endpoint',
-                                                       mock_api)
+        mock_api.match_route.assert_called_once_with('test_endpoint')
         mock_resolve_action.assert_called_once_with(mock_http_request,
-                                                    'test_endpoint', mock_api)
+                                                    route_match)
         self.assertIsInstance(response, HttpResponseNotAllowed)
 
     @patch.object(api_request_builder, 'build_request_data')
-    @patch.object(action_resolver, 'resolve_action')
-    @patch.object(action_resolver, 'is_valid_resource')
+    @patch.object(action_resolver, 'resolve_route_action')
+    def test_handle_api_call_for_disallowed_action(self,
+                                                   mock_resolve_action,
+                                                   mock_build_request_data):
+        mock_resolve_action.return_value = method_not_allowed
+        mock_http_request = MagicMock()
+        mock_http_request.method = 'DELETE'
+
+        response = django_http_handler.handle_api_call(
+            mock_http_request, 'test_endpoint', MagicMock())
+
+        self.assertEqual(response.status_code, 405)
+        self.assertFalse(mock_build_request_data.called)
+
+    @patch.object(action_resolver, 'resolve_route_action')
+    def test_handle_api_call_for_unknown_url(self, mock_resolve_action):
+        mock_api = MagicMock()
+        mock_api.match_route.return_value = None
+
+        response = django_http_handler.handle_api_call(
+            MagicMock(), 'test_endpoint', mock_api)
+
+        self.assertIsInstance(response, HttpResponseNotFound)
+        self.assertFalse(mock_resolve_action.called)
+
+    @patch.object(api_request_builder, 'build_request_data')
+    @patch.object(action_resolver, 'resolve_route_action')
     def test_handle_api_call_for_bad_json_data(self,
-                                               mock_is_valid_resource,
                                                mock_resolve_action,
                                                mock_build_request_data):
-        mock_is_valid_resource.return_value = True
         mock_resolve_action.return_value = MagicMock()
         mock_build_request_data.return_value = expected_request_data = {
             'error_message': 'Expected } at line 3'}
 
         mock_http_request = MagicMock()
         mock_api = MagicMock()
+        mock_api.match_route.return_value = route_match = MagicMock()
         mock_http_request.META = http_request_meta = MagicMock()
         mock_http_request.read.return_value = request_body = MagicMock()
 
@@ -57,10 +80,8 @@ class DjangoHttpHandler(unittest.TestCase):
         response = django_http_handler.handle_api_call(
             mock_http_request, 'test_endpoint', mock_api)
 
-        mock_is_valid_resource.assert_called_once_with('test_endpoint',
-                                                       mock_api)
         mock_resolve_action.assert_called_once_with(mock_http_request,
-                                                    'test_endpoint', mock_api)
+                                                    route_match)
         mock_build_request_data.assert_called_once_with(request_body, http_request_meta)
         self.assertIsInstance(response, HttpResponseBadRequest)
         assert json.loads(response.content) == expected_request_data
@@ -68,15 +89,34 @@ class DjangoHttpHandler(unittest.TestCase):
     @patch.object(api_request_builder, 'build_request_data')
     @patch.object(api_request_builder, 'build_request')
     @patch.object(django_response_builder, 'build_http_response')
-    @patch.object(action_resolver, 'resolve_action')
-    @patch.object(action_resolver, 'is_valid_resource')
+    @patch.object(action_resolver, 'resolve_route_action')
+    def test_handle_api_call_with_list_data(self,
+                                            mock_resolve_action,
+                                            mock_build_response,
+                                            mock_build_request,
+                                            mock_build_request_data):
+        detail_action, list_action = MagicMock(), MagicMock()
+        mock_resolve_action.side_effect = \
+            lambda http_request, route_match, many=False: \
+            list_action if many else detail_action
+        mock_build_request_data.return_value = [{'name': 'rip'}]
+        mock_api = MagicMock()
+
+        django_http_handler.handle_api_call(MagicMock(), 'test_endpoint',
+                                            mock_api)
+
+        list_action.assert_called_once_with(mock_build_request.return_value)
+        self.assertFalse(detail_action.called)
+
+    @patch.object(api_request_builder, 'build_request_data')
+    @patch.object(api_request_builder, 'build_request')
+    @patch.object(django_response_builder, 'build_http_response')
+    @patch.object(action_resolver, 'resolve_route_action')
     def test_handle_api_call(self,
-                             mock_is_valid_resource,
                              mock_resolve_action,
                              mock_build_response,
                              mock_build_request,
                              mock_build_request_data):
-        mock_is_valid_resource.return_value = True
         mock_resolve_action.return_value = expected_action = MagicMock()
         expected_action.return_value = expected_response = MagicMock()
         mock_build_request.return_value = expected_request = MagicMock()
@@ -85,20 +125,18 @@ class DjangoHttpHandler(unittest.TestCase):
         mock_http_request = MagicMock()
         mock_http_request.read.return_value = request_body = MagicMock()
         mock_api = MagicMock()
+        mock_api.match_route.return_value = route_match = MagicMock()
         url = 'test_endpoint'
 
         http_response = django_http_handler.handle_api_call(
             mock_http_request, url, mock_api)
 
-        mock_is_valid_resource.assert_called_once_with('test_endpoint',
-                                                       mock_api)
         mock_resolve_action.assert_called_once_with(mock_http_request,
-                                                    'test_endpoint',
-                                                    mock_api)
+                                                    route_match)
         mock_build_request.assert_called_once_with(
             http_request=mock_http_request,
             url=url, api=mock_api, request_data=expected_request_data,
-            request_body=request_body)
+            request_body=request_body, route_match=route_match)
         expected_action.assert_called_once_with(expected_request)
         assert_that(http_response, equal_to(expected_http_response))
         mock_build_response.assert_called_once_with(mock_http_request,
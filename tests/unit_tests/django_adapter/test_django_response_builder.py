@@ -31,6 +31,24 @@ class TestDjangoResponseBuilder(unittest.TestCase):
         self.assertEqual(http_response.content,
                          simplejson.dumps({'defg': 1121}))
 
+    def test_get_status_code(self):
+        self.assertEqual(django_response_builder.get_status_code(
+            'POST', Response(is_success=True)), 201)
+        self.assertEqual(django_response_builder.get_status_code(
+            'GET', Response(is_success=False,
+                            reason=error_types.ObjectNotFound)), 404)
+
+    def test_should_not_drop_data_of_successful_delete(self):
+        http_request = MagicMock(method='DELETE')
+
+        self.assertEqual(django_response_builder.build_http_response(
+            http_request, Response(is_success=True)).status_code, 204)
+        http_response = django_response_builder.build_http_response(
+            http_request, Response(is_success=True, data={'count': 2}))
+        self.assertEqual(http_response.status_code, 200)
+        self.assertEqual(simplejson.loads(http_response.content),
+                         {'count': 2})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,10 @@
+import threading
 import unittest
+from multiprocessing.pool import ThreadPool
 
-from mock import MagicMock
+from mock import MagicMock, patch
 
+from rip.django_adapter import db_connections
 from rip.error_types import ObjectNotFound, \
     MultipleObjectsFound
 from rip.generic_steps.default_entity_actions import \
@@ -96,6 +99,45 @@ class TestEntityActionsGetEntity(unittest.TestCase):
 
         self.assertEqual(entity, None)
 
+    def test_should_fetch_at_most_two_entities(self):
+        entity_actions = DefaultEntityActions(schema_cls=None,
+                                              default_offset=0,
+                                              default_limit=20)
+        entity_actions.get_entity_list = MagicMock()
+        entity_actions.get_entity_list.return_value = [object()]
+
+        entity_actions.get_entity(request=None, id=2)
+
+        entity_actions.get_entity_list.assert_called_once_with(
+            None, id=2, offset=0, limit=2)
+
+    def test_should_slice_lazy_entity_list(self):
+        entity_actions = DefaultEntityActions(schema_cls=None,
+                                              default_offset=0,
+                                              default_limit=20)
+        entity_actions.get_entity_list = MagicMock()
+        entity_list = entity_actions.get_entity_list.return_value = \
+            MagicMock()
+        entity_list.__getitem__.return_value = expected_objs = [object()]
+
+        entity = entity_actions.get_entity(request=None)
+
+        entity_list.__getitem__.assert_called_once_with(slice(None, 2))
+        self.assertFalse(entity_list.__len__.called)
+        self.assertEqual(entity, expected_objs[0])
+
+    def test_should_read_two_entities_of_an_iterator(self):
+        entity_actions = DefaultEntityActions(schema_cls=None,
+                                              default_offset=0,
+                                              default_limit=20)
+        entity_actions.get_entity_list = MagicMock()
+        entities = iter([object(), object(), object()])
+        entity_actions.get_entity_list.return_value = entities
+
+        self.assertRaises(MultipleObjectsFound, entity_actions.get_entity,
+                          request=None)
+        self.assertEqual(len(list(entities)), 1)
+
 
 class TestEntityActionsReadList(unittest.TestCase):
     def test_should_call_get_entity_list(self):
@@ -135,3 +177,173 @@ class TestEntityActionsUpdateDetail(unittest.TestCase):
 
 
 
+
+class TestEntityActionsTotalCountModes(unittest.TestCase):
+    def setUp(self):
+        self.entity_actions = DefaultEntityActions(schema_cls=MagicMock(),
+                                                   default_offset=0,
+                                                   default_limit=20)
+        self.entity_actions.get_entity_list = MagicMock(return_value=[])
+        self.entity_actions.get_entity_list_total_count = MagicMock(
+            return_value=42)
+
+    def read_list(self, total_count_mode=None, user='admin'):
+        request = MagicMock(user=user)
+        request.context_params = {'request_filters': {'name': 'John'}}
+        if total_count_mode is not None:
+            request.context_params['total_count_mode'] = total_count_mode
+        return self.entity_actions.read_list(request).context_params
+
+    def test_should_count_exactly_by_default(self):
+        context_params = self.read_list()
+
+        self.assertEqual(context_params['total_count'], 42)
+        self.assertEqual(context_params['total_count_mode'], 'exact')
+
+    def test_should_not_count_in_none_mode(self):
+        context_params = self.read_list('none')
+
+        self.assertIsNone(context_params['total_count'])
+        self.assertFalse(
+            self.entity_actions.get_entity_list_total_count.called)
+
+    def test_should_estimate_in_estimate_mode(self):
+        self.entity_actions.get_entity_list_total_count_estimate = MagicMock(
+            return_value=40)
+
+        context_params = self.read_list('estimate')
+
+        self.assertEqual(context_params['total_count'], 40)
+        self.assertEqual(context_params['total_count_mode'], 'estimate')
+        self.assertEqual(
+            self.entity_actions.get_entity_list_total_count_estimate
+                .call_args[1], {'name': 'John'})
+        self.assertFalse(
+            self.entity_actions.get_entity_list_total_count.called)
+
+    def test_should_count_exactly_without_estimate(self):
+        context_params = self.read_list('estimate')
+
+        self.assertEqual(context_params['total_count'], 42)
+        self.assertEqual(context_params['total_count_mode'], 'exact')
+
+    def test_should_cache_count_per_filters_in_cached_mode(self):
+        self.entity_actions.total_count_mode = 'cached'
+
+        self.read_list()
+        context_params = self.read_list()
+
+        self.assertEqual(context_params['total_count'], 42)
+        self.assertEqual(context_params['total_count_mode'], 'cached')
+        self.assertEqual(
+            self.entity_actions.get_entity_list_total_count.call_count, 1)
+
+    def test_should_cache_count_per_user_in_cached_mode(self):
+        self.entity_actions.total_count_mode = 'cached'
+
+        self.read_list(user='admin')
+        self.read_list(user='guest')
+
+        self.assertEqual(
+            self.entity_actions.get_entity_list_total_count.call_count, 2)
+
+    def test_request_mode_can_lower_cost_of_count(self):
+        self.entity_actions.total_count_mode = 'cached'
+
+        context_params = self.read_list('none')
+
+        self.assertEqual(context_params['total_count_mode'], 'none')
+        self.assertFalse(
+            self.entity_actions.get_entity_list_total_count.called)
+
+    def test_request_mode_cannot_raise_cost_of_count(self):
+        self.entity_actions.total_count_mode = 'cached'
+
+        self.read_list()
+        context_params = self.read_list('exact')
+
+        self.assertEqual(context_params['total_count_mode'], 'cached')
+        self.assertEqual(
+            self.entity_actions.get_entity_list_total_count.call_count, 1)
+
+
+class TestEntityActionsConcurrentTotalCount(unittest.TestCase):
+    def setUp(self):
+        self.thread_pool = ThreadPool(2)
+        close_patcher = patch.object(db_connections, 'close_db_connections')
+        self.mock_close_db_connections = close_patcher.start()
+        self.addCleanup(close_patcher.stop)
+        self.entity_actions = DefaultEntityActions(schema_cls=MagicMock(),
+                                                   default_offset=0,
+                                                   default_limit=20)
+        self.entity_actions.concurrent_total_count = True
+        self.entity_actions.get_entity_list = MagicMock(return_value=[1, 2])
+        self.entity_actions.get_entity_list_total_count = MagicMock(
+            return_value=42)
+
+    def tearDown(self):
+        self.thread_pool.terminate()
+
+    def get_request(self):
+        request = MagicMock()
+        request.context_params = {'request_filters': {'name': 'John'},
+                                  'thread_pool': self.thread_pool}
+        return request
+
+    def test_should_count_on_thread_pool(self):
+        count_threads = []
+
+        def get_entity_list_total_count(request, **kwargs):
+            count_threads.append(threading.current_thread())
+            return 42
+
+        self.entity_actions.get_entity_list_total_count = \
+            get_entity_list_total_count
+
+        context_params = self.entity_actions.read_list(
+            self.get_request()).context_params
+
+        self.assertEqual(context_params['entities'], [1, 2])
+        self.assertEqual(context_params['total_count'], 42)
+        self.assertIsNot(count_threads[0], threading.current_thread())
+
+    def test_should_close_db_connections_of_count_thread(self):
+        close_threads = []
+        self.mock_close_db_connections.side_effect = \
+            lambda: close_threads.append(threading.current_thread())
+
+        self.entity_actions.read_list(self.get_request())
+
+        self.assertEqual(len(close_threads), 1)
+        self.assertIsNot(close_threads[0], threading.current_thread())
+
+    def test_should_raise_error_of_count(self):
+        self.entity_actions.get_entity_list_total_count.side_effect = \
+            ValueError
+
+        self.assertRaises(ValueError, self.entity_actions.read_list,
+                          self.get_request())
+
+    def test_should_raise_error_of_fetch_after_count_finishes(self):
+        count_finished = threading.Event()
+
+        def get_entity_list_total_count(request, **kwargs):
+            count_finished.wait(0.01)
+            count_finished.set()
+            raise ValueError
+
+        self.entity_actions.get_entity_list_total_count = \
+            get_entity_list_total_count
+        self.entity_actions.get_entity_list.side_effect = KeyError
+
+        self.assertRaises(KeyError, self.entity_actions.read_list,
+                          self.get_request())
+        self.assertTrue(count_finished.is_set())
+
+    def test_should_count_after_fetch_without_thread_pool(self):
+        request = self.get_request()
+        request.context_params.pop('thread_pool')
+
+        context_params = self.entity_actions.read_list(request).context_params
+
+        self.assertEqual(context_params['total_count'], 42)
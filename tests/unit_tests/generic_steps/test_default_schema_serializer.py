@@ -1,11 +1,17 @@
 import unittest
 
+from mock import patch
+
 from rip.api_schema import ApiSchema
 from rip.generic_steps.default_schema_serializer import \
     DefaultEntitySerializer
 from rip.request import Request
 from rip.schema.boolean_field import \
     BooleanField
+from rip.schema.datetime_field import DateTimeField
+from rip.schema.float_field import FloatField
+from rip.schema.resource_link_field import ResourceLinkField
+from rip.schema.resource_uri_field import ResourceUriField
 from rip.schema.string_field import StringField
 
 
@@ -64,3 +70,126 @@ class TestSerializeSchemaToResponse(unittest.TestCase):
                          dict(id='aaaa', name='asdf', is_active=True))
         self.assertEqual(data[1],
                          dict(id='bbbb', name='asdf', is_active=False))
+
+    def test_should_compile_serialization_plan_once_per_action(self):
+        request = Request(user=None, request_params=None,
+                          context_params={'crud_action': 'read_detail'})
+        with patch.object(
+                self.serializer, 'get_fields_to_serialize',
+                wraps=self.serializer.get_fields_to_serialize) as get_fields:
+            self.serializer.serialize_entity(
+                request, dict(id='aaaa', name='asdf', is_active=True))
+            data = self.serializer.serialize_entity(
+                request, dict(id='bbbb', name='asdf', is_active=False))
+
+        self.assertEqual(data, dict(id='bbbb', name='asdf', is_active=False))
+        self.assertEqual(get_fields.call_count, 1)
+
+    def test_should_compile_serialization_plan_again_if_fields_change(self):
+        entity = dict(id='aaaa', name='asdf', is_active=True)
+        request = Request(user=None, request_params=None,
+                          context_params={'crud_action': 'read_detail'})
+        self.serializer.serialize_entity(request, entity)
+
+        self.TestSchema._meta.fields.pop('is_active')
+
+        self.assertEqual(self.serializer.serialize_entity(request, entity),
+                         dict(id='aaaa', name='asdf'))
+
+    def test_should_compile_serialization_plan_per_fields_param(self):
+        entity = dict(id='aaaa', name='asdf', is_active=True)
+        request = Request(user=None, request_params=None,
+                          context_params={'crud_action': 'read_detail'})
+        fields_request = Request(
+            user=None, request_params=None,
+            context_params={'crud_action': 'read_detail',
+                            'fields': {self.TestSchema: ('id',)}})
+
+        self.assertEqual(self.serializer.serialize_entity(request, entity),
+                         entity)
+        self.assertEqual(
+            self.serializer.serialize_entity(fields_request, entity),
+            dict(id='aaaa'))
+
+    def test_should_not_cache_plans_if_fields_selection_is_overridden(self):
+        class NamesSerializer(DefaultEntitySerializer):
+            def get_fields_to_serialize(self, request):
+                fields = self.schema_cls._meta.fields
+                return {field_name: fields[field_name]
+                        for field_name in request.context_params['names']}
+
+        serializer = NamesSerializer(schema_cls=self.TestSchema)
+        entity = dict(id='aaaa', name='asdf', is_active=True)
+
+        first = serializer.serialize_entity(
+            Request(user=None, request_params=None,
+                    context_params={'names': ['id']}), entity)
+        second = serializer.serialize_entity(
+            Request(user=None, request_params=None,
+                    context_params={'names': ['name']}), entity)
+
+        self.assertEqual(first, dict(id='aaaa'))
+        self.assertEqual(second, dict(name='asdf'))
+
+    def test_should_serialize_list_column_by_column(self):
+        request = Request(user=None, request_params=None,
+                          context_params={'crud_action': 'read_list'})
+        entities = [dict(id='aaaa', name='asdf', is_active=True),
+                    dict(id='bbbb', is_active=False)]
+
+        with patch.object(StringField, 'serialize_many',
+                          autospec=True,
+                          side_effect=lambda field, request, values: values) \
+                as serialize_many:
+            data = self.serializer.serialize_entities(request, entities)
+
+        self.assertEqual(data, [dict(id='aaaa', name='asdf', is_active=True),
+                                dict(id='bbbb', is_active=False)])
+        self.assertEqual(serialize_many.call_count, 2)
+
+    def test_should_serialize_list_with_serialize_of_field_object(self):
+        class PriceSchema(ApiSchema):
+            price = FloatField()
+
+            class Meta:
+                schema_name = 'prices'
+
+        PriceSchema._meta.fields['price'].serialize = \
+            lambda request, value: '{:.1f}'.format(value)
+        serializer = DefaultEntitySerializer(schema_cls=PriceSchema)
+        request = Request(user=None, request_params=None,
+                          context_params={'crud_action': 'read_list'})
+
+        data = serializer.serialize_entities(request, [dict(price=1.25)])
+
+        self.assertEqual(data, [dict(price='1.2')])
+
+    def test_should_serialize_list_without_values_and_context(self):
+        class EventSchema(ApiSchema):
+            resource_uri = ResourceUriField()
+            starts_at = DateTimeField()
+
+            class Meta:
+                schema_name = 'events'
+
+        serializer = DefaultEntitySerializer(schema_cls=EventSchema)
+        request = Request(user=None, request_params=None,
+                          context_params={'crud_action': 'read_list'})
+
+        self.assertEqual(serializer.serialize_entities(request, []), [])
+        self.assertEqual(
+            DateTimeField().serialize_many(request, [None, None]),
+            [None, None])
+        self.assertEqual(
+            ResourceLinkField(of_type=EventSchema).serialize_many(
+                request, [None]),
+            [None])
+
+    def test_should_throw_error_on_missing_required_fields_in_list(self):
+        request = Request(user=None, request_params=None,
+                          context_params={'crud_action': 'read_list'})
+        entities = [dict(id='aaaa', name='asdf', is_active=True),
+                    dict(name='asdf', is_active=False)]
+
+        self.assertRaises(AttributeError, self.serializer.serialize_entities,
+                          request, entities)
@@ -142,6 +142,30 @@ class TestSchemaPartialValidation(unittest.TestCase):
         assert_that(response.is_success, equal_to(False))
         assert_that(response.data, has_item('country'))
 
+    def test_validates_every_item_of_a_list(self):
+        data = [{'name': 'John', 'is_active': True},
+                {'name': 'Jane'},
+                None]
+        request = request_factory.get_request(
+            data=data,
+            context_params={'crud_action': CrudActions.CREATE_LIST})
+
+        response = self.validation.validate_request_data_list(request)
+
+        assert_that(response.is_success, equal_to(False))
+        assert_that(response.reason, equal_to(error_types.InvalidData))
+        assert_that(sorted(response.data), equal_to([1, 2]))
+        assert_that(response.data[1], has_item('is_active'))
+
+    def test_list_validation_fails_for_an_object(self):
+        request = request_factory.get_request(
+            data={'name': 'John Smith', 'is_active': True},
+            context_params={'crud_action': CrudActions.CREATE_LIST})
+
+        response = self.validation.validate_request_data_list(request)
+
+        assert_that(response.is_success, equal_to(False))
+
 
 if __name__ == '__main__':
     unittest.main()
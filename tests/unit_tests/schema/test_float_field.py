@@ -14,3 +14,8 @@ class TestFloatField(unittest.TestCase):
     def test_serialize_should_round_off_to_1(self):
         float_field = FloatField(precision=1)
         assert float_field.serialize(request={}, value=23.45667) == 23.5
+
+    def test_serialize_many_should_round_off_all_values(self):
+        float_field = FloatField(precision=1)
+        assert float_field.serialize_many(
+            request={}, values=[23.45667, 1.04]) == [23.5, 1.0]
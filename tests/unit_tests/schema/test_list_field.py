@@ -1,5 +1,6 @@
 import unittest
 from rip.schema.list_field import ListField
+from rip.schema.float_field import FloatField
 from rip.schema.string_field import StringField
 
 
@@ -42,3 +43,24 @@ class TestValidateListField(unittest.TestCase):
         assert not result.is_success
         assert isinstance(result.reason, list)
         assert len(result.reason) == 1
+
+
+class TestSerializeListField(unittest.TestCase):
+    def test_should_serialize_many_lists(self):
+        field = ListField(field=FloatField(precision=1))
+
+        values = field.serialize_many(request=None,
+                                      values=[[1.04, 2.16], None, [], [3.0]])
+
+        assert values == [[1.0, 2.2], None, [], [3.0]]
+
+    def test_should_use_serialize_override_of_item_field(self):
+        class UpperStringField(StringField):
+            def serialize(self, request, value):
+                return value.upper()
+
+        field = ListField(field=UpperStringField())
+
+        values = field.serialize_many(request=None, values=[['a'], ['b']])
+
+        assert values == [['A'], ['B']]
@@ -20,3 +20,17 @@ class TestResourceUriField(unittest.TestCase):
         value = field.serialize(request, 22)
 
         assert_that(value, equal_to('/api/v2/test/22/'))
+
+    def test_should_serialize_many_resource_uris(self):
+        field = ResourceUriField()
+        field.schema_cls = schema_cls = MagicMock()
+        schema_cls._meta = schema_meta = MagicMock()
+        schema_meta.schema_name = 'test'
+        request = request_factory.get_request()
+        request.context_params['api_breadcrumbs'] = [('parent', 1)]
+
+        values = field.serialize_many(request, [22, 23])
+
+        assert_that(values, equal_to([field.serialize(request, 22),
+                                      field.serialize(request, 23)]))
+        assert_that(values[0], equal_to('/api/v2/parent/1/test/22/'))
@@ -68,6 +68,26 @@ class TestApi(unittest.TestCase):
         assert endpoint_2 == 'boo/car'
 
 
+    def test_registered_resource_is_shared(self):
+        test_resource = self.TestResource()
+
+        self.http_api.register_resource('test_objs', test_resource)
+
+        self.assertIs(self.http_api.get_resource(self.TestResource),
+                      test_resource)
+
+    def test_apis_do_not_share_resources(self):
+        test_resource = self.TestResource()
+        other_api = Api(name='other_api', version='v1')
+
+        self.http_api.register_resource('test_objs', test_resource)
+        other_api.register_resource('test_objs', self.TestResource())
+
+        self.assertIs(self.http_api.get_resource(self.TestResource),
+                      test_resource)
+        self.assertIsNot(other_api.get_resource(self.TestResource),
+                         test_resource)
+
     def test_register_with_mismatching_schema_raises(self):
         test_resource = self.TestResource()
         self.assertRaises(ValueError, self.http_api.register_resource,
@@ -75,3 +95,13 @@ class TestApi(unittest.TestCase):
 
     def test_registered_action_should_be_accessible_to_call(self):
         pass
+
+    def test_thread_pool_is_created_once(self):
+        self.assertIsNone(self.http_api.get_thread_pool())
+
+        api = Api(name='api', version='v1', thread_pool_size=2)
+        thread_pool = api.get_thread_pool()
+
+        self.assertIs(api.get_thread_pool(), thread_pool)
+        self.assertEqual(thread_pool.map(abs, [-1, 2]), [1, 2])
+        thread_pool.terminate()
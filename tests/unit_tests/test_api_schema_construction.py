@@ -1,6 +1,7 @@
 import unittest
 
 from rip.api_schema import ApiSchema
+from rip.schema.base_field import FieldTypes
 from rip.schema.boolean_field import \
     BooleanField
 from rip.schema.string_field import StringField
@@ -51,3 +52,51 @@ class TestApiSchemaConstruction(unittest.TestCase):
 
         self.assertTrue('new_field' in NewSchema._meta.fields)
         self.assertTrue('new_field' in NewSchema._meta.declared_fields)
+
+    def test_should_cache_field_indexes(self):
+        class IndexedSchema(self.TestSchema):
+            read_only = StringField(field_type=FieldTypes.READONLY)
+            hidden = StringField(show_in_list=False)
+
+        meta = IndexedSchema._meta
+        self.assertIs(meta.non_readonly_fields, meta.non_readonly_fields)
+        self.assertNotIn('read_only', meta.non_readonly_field_names)
+        self.assertIn('read_only', IndexedSchema.list_fields())
+        self.assertNotIn('hidden', IndexedSchema.list_fields())
+        self.assertRaises(TypeError, meta.list_fields.pop, 'email')
+
+    def test_should_return_copies_of_field_indexes(self):
+        list_fields = self.TestSchema.list_fields()
+
+        list_fields.pop('email')
+
+        self.assertIn('email', self.TestSchema.list_fields())
+        self.assertIn('email', self.TestSchema._meta.list_fields)
+
+    def test_should_rebuild_indexes_when_fields_change(self):
+        class ChangedSchema(self.TestSchema):
+            pass
+
+        fields = ChangedSchema._meta.fields
+        fields['added'] = StringField(entity_attribute='added_attr')
+        fields.pop('email')
+
+        self.assertIn('added', ChangedSchema.list_fields())
+        self.assertEqual(ChangedSchema._meta.entity_attributes['added'],
+                         'added_attr')
+        self.assertNotIn('email', ChangedSchema.updatable_fields())
+        self.assertIn('email', self.TestSchema.updatable_fields())
+
+    def test_should_rebuild_indexes_when_fields_are_added(self):
+        class NewSchema(self.TestSchema):
+            new_field = EmailField(max_length=20)
+
+        self.TestSchema.added = StringField(entity_attribute='added_attr')
+
+        for schema_cls in (self.TestSchema, NewSchema):
+            self.assertIn('added', schema_cls._meta.fields)
+            self.assertIn('added', schema_cls.list_fields())
+            self.assertIn('added', schema_cls.updatable_fields())
+            self.assertEqual(schema_cls._meta.entity_attributes['added'],
+                             'added_attr')
+        self.assertNotIn('added', NewSchema._meta.declared_fields)
@@ -0,0 +1,91 @@
+import unittest
+
+from rip import attribute_getter
+
+
+class Entity(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class OrderedDictEntity(dict):
+    pass
+
+
+class TestCompileAccessor(unittest.TestCase):
+    def test_should_read_from_dicts_and_objects(self):
+        get_name = attribute_getter.compile_accessor('name')
+
+        self.assertEqual(get_name(dict(name='dict')), 'dict')
+        self.assertEqual(get_name(Entity(name='object')), 'object')
+        self.assertEqual(get_name(OrderedDictEntity(name='subclass')),
+                         'subclass')
+
+    def test_should_raise_attribute_error_for_missing_attribute(self):
+        get_name = attribute_getter.compile_accessor('name')
+
+        self.assertRaises(AttributeError, get_name, dict(id=1))
+        self.assertRaises(AttributeError, get_name, Entity(id=1))
+
+    def test_should_follow_dotted_paths(self):
+        get_city = attribute_getter.compile_accessor('profile.address.city')
+        entity = Entity(profile=dict(address=Entity(city='Chennai')))
+
+        self.assertEqual(get_city(entity), 'Chennai')
+        self.assertEqual(
+            attribute_getter.get_attribute(entity, 'profile.address.city'),
+            'Chennai')
+        self.assertRaises(AttributeError, get_city,
+                          Entity(profile=dict(address=None)))
+
+    def test_should_read_dict_key_with_dots(self):
+        entity = {'profile.city': 'Chennai', 'profile': {'city': 'Pune'}}
+
+        self.assertEqual(
+            attribute_getter.get_attribute(entity, 'profile.city'),
+            'Chennai')
+        self.assertEqual(
+            attribute_getter.get_attribute(dict(profile=dict(city='Pune')),
+                                           'profile.city'),
+            'Pune')
+
+    def test_should_follow_paths_of_entities_shaped_differently(self):
+        get_city = attribute_getter.compile_accessor('profile.address.city')
+        entities = [Entity(profile=dict(address=Entity(city='a'))),
+                    Entity(profile=Entity(address=dict(city='b'))),
+                    Entity(profile=dict(address=dict(city='c'))),
+                    dict(profile=Entity(address=Entity(city='d')))]
+
+        self.assertEqual(map(get_city, entities), ['a', 'b', 'c', 'd'])
+        self.assertRaises(AttributeError, get_city,
+                          Entity(profile=dict(address=Entity(town='e'))))
+        self.assertRaises(AttributeError, get_city, Entity(profile=None))
+        self.assertEqual(get_city(entities[0]), 'a')
+
+
+class TestCompileColumnAccessor(unittest.TestCase):
+    def test_should_read_column_of_entities(self):
+        get_names = attribute_getter.compile_column_accessor('name')
+
+        self.assertEqual(
+            get_names([dict(name='a'), dict(name='b')], None), ['a', 'b'])
+        self.assertEqual(
+            get_names([Entity(name='a'), Entity(name='b')], None), ['a', 'b'])
+        self.assertEqual(get_names([], None), [])
+
+    def test_should_read_column_of_dict_keys_with_dots(self):
+        get_cities = attribute_getter.compile_column_accessor('profile.city')
+
+        self.assertEqual(
+            get_cities([{'profile.city': 'a'}, dict(profile=dict(city='b'))],
+                       None),
+            ['a', 'b'])
+
+    def test_should_use_default_for_missing_attribute(self):
+        get_names = attribute_getter.compile_column_accessor('name')
+        missing = object()
+
+        self.assertEqual(
+            get_names([dict(name='a'), dict(id=1), Entity(name='c')],
+                      missing),
+            ['a', missing, 'c'])
@@ -0,0 +1,47 @@
+import datetime
+import unittest
+
+import pytz
+
+from rip.cursor_pagination import NEXT, PREV, decode_cursor, \
+    encode_cursor, get_sort_key, reverse_order
+
+
+class TestCursor(unittest.TestCase):
+    def test_decodes_encoded_cursor(self):
+        cursor = encode_cursor(['-name', 'id'], [u'John', 5], PREV)
+
+        self.assertNotIn('=', cursor)
+        self.assertEqual(decode_cursor(cursor),
+                         ([u'-name', u'id'], [u'John', 5], PREV))
+
+    def test_keeps_microseconds_of_dates_and_datetimes(self):
+        values = [datetime.datetime(1800, 1, 1, 10, 0, 0, 123),
+                  datetime.datetime(2014, 1, 1, 10, 0, 0),
+                  datetime.datetime(2014, 1, 1, 10, 0, 0, 5, pytz.UTC),
+                  datetime.date(2014, 1, 1)]
+
+        _, decoded, _ = decode_cursor(encode_cursor(
+            ['a', 'b', 'c', 'd'], values, NEXT))
+
+        self.assertEqual(decoded, values)
+        self.assertEqual(decoded[2].tzinfo, pytz.UTC)
+
+    def test_invalid_cursors_raise_value_error(self):
+        for cursor in ['not a cursor', encode_cursor(['id'], [1, 2], NEXT),
+                       encode_cursor(['id'], [1], 'up'), u'\xe9',
+                       encode_cursor(['id'], [{'date': '2014-13-01'}],
+                                     NEXT)]:
+            self.assertRaises(ValueError, decode_cursor, cursor)
+
+
+class TestSortKey(unittest.TestCase):
+    def test_id_breaks_ties(self):
+        self.assertEqual(get_sort_key(['-name']), ['-name', 'id'])
+        self.assertEqual(get_sort_key([]), ['id'])
+
+    def test_id_is_not_repeated(self):
+        self.assertEqual(get_sort_key(['-id', 'name']), ['-id', 'name'])
+
+    def test_reverse_order(self):
+        self.assertEqual(reverse_order(['-name', 'id']), ['name', '-id'])
@@ -0,0 +1,57 @@
+import calendar
+import datetime
+import unittest
+
+import pytz
+
+from rip import datetime_converter
+
+
+def pytz_datetime_to_timestamp(_date, timezone):
+    return calendar.timegm(pytz.timezone(timezone).localize(_date).astimezone(
+        pytz.UTC).utctimetuple())
+
+
+class TestDatetimeConverter(unittest.TestCase):
+    dates = [datetime.datetime(2015, 3, 8, 2, 30, 15, 999999),
+             datetime.datetime(2015, 11, 1, 1, 30),
+             datetime.datetime(1969, 12, 31, 23, 59, 59, 500000),
+             datetime.datetime(2016, 2, 29, 12)]
+    timezones = ['UTC', 'Asia/Calcutta', 'America/New_York']
+
+    def test_should_convert_datetime_to_timestamp(self):
+        for timezone in self.timezones:
+            for _date in self.dates:
+                self.assertEqual(
+                    datetime_converter.datetime_to_timestamp(_date, timezone),
+                    pytz_datetime_to_timestamp(_date, timezone))
+
+    def test_should_convert_date_to_timestamp_of_midnight(self):
+        timestamp = datetime_converter.datetime_to_timestamp(
+            datetime.date(2015, 1, 2), 'Asia/Calcutta')
+
+        self.assertEqual(timestamp, pytz_datetime_to_timestamp(
+            datetime.datetime(2015, 1, 2), 'Asia/Calcutta'))
+
+    def test_should_convert_timestamp_to_naive_local_datetime(self):
+        for timezone in self.timezones:
+            for timestamp in (1425796215.5, 1446355800, -0.5, 1456747200):
+                self.assertEqual(
+                    datetime_converter.timestamp_to_datetime(timestamp,
+                                                             timezone),
+                    datetime.datetime.fromtimestamp(
+                        timestamp, tz=pytz.timezone(timezone)).replace(
+                            tzinfo=None))
+
+    def test_should_convert_column_of_dates(self):
+        dates = self.dates + [None]
+
+        for timezone in self.timezones:
+            self.assertEqual(
+                datetime_converter.datetimes_to_timestamps(dates, timezone),
+                [pytz_datetime_to_timestamp(_date, timezone)
+                 for _date in self.dates] + [None])
+
+    def test_should_cache_timezones(self):
+        self.assertIs(datetime_converter.get_timezone('Asia/Calcutta'),
+                      datetime_converter.get_timezone('Asia/Calcutta'))
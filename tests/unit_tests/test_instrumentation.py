@@ -0,0 +1,71 @@
+import unittest
+
+from rip import instrumentation
+from rip.instrumentation import LatencyHistogram, LatencyRecorder
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles_of_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(histogram.percentile(50), None)
+        self.assertEqual(histogram.summary()['count'], 0)
+
+    def test_percentiles_fall_in_bucket_of_value(self):
+        histogram = LatencyHistogram()
+        for _ in range(98):
+            histogram.record(0.001)
+        histogram.record(0.5)
+        histogram.record(0.5)
+
+        summary = histogram.summary()
+
+        self.assertEqual(summary['count'], 100)
+        self.assertTrue(0.001 <= summary['p50'] < 0.002)
+        self.assertTrue(0.001 <= summary['p95'] < 0.002)
+        self.assertEqual(summary['p99'], 0.5)
+        self.assertEqual(summary['max'], 0.5)
+
+    def test_values_beyond_last_bucket_report_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(1000.0)
+
+        self.assertEqual(histogram.percentile(99), 1000.0)
+
+
+class TestLatencyRecorder(unittest.TestCase):
+    def test_aggregates_by_resource_pipeline_and_step(self):
+        recorder = LatencyRecorder()
+        recorder.record('PersonResource', 'read_list', 'authenticate',
+                        0.002, 0.001)
+        recorder.record('PersonResource', 'read_list', 'authenticate',
+                        0.004, 0.001)
+
+        latencies = recorder.get_step_latencies()
+
+        step_latency = latencies[('PersonResource', 'read_list',
+                                  'authenticate')]
+        self.assertEqual(step_latency['wall']['count'], 2)
+        self.assertAlmostEqual(step_latency['wall']['mean'], 0.003)
+        self.assertAlmostEqual(step_latency['cpu']['max'], 0.001)
+
+    def test_reset_clears_latencies(self):
+        recorder = LatencyRecorder()
+        recorder.record('PersonResource', 'read_list', 'authenticate',
+                        0.002, 0.001)
+
+        recorder.reset()
+
+        self.assertEqual(recorder.get_step_latencies(), {})
+
+
+class TestStepName(unittest.TestCase):
+    def test_bound_method_is_named_with_its_class(self):
+        class DefaultAuthentication(object):
+            def authenticate(self, request):
+                return request
+
+        step_name = instrumentation.get_step_name(
+            DefaultAuthentication().authenticate)
+
+        self.assertEqual(step_name, 'DefaultAuthentication.authenticate')
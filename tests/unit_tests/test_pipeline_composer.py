@@ -3,8 +3,8 @@ import unittest
 from mock import MagicMock
 from mock import patch as mock_patch
 
-from rip import pipeline_composer
-from rip.pipeline_composer import PipelineComposer
+from rip import instrumentation, pipeline_composer
+from rip.pipeline_composer import PipelineComposer, pass_through_step
 from rip.request import Request
 from rip.response import Response
 
@@ -79,3 +79,107 @@ class TestComposePipeline(unittest.TestCase):
         pipeline_composer.compose_pipeline(name='asdf', pipeline=['asdf'])
 
         PipelineComposer.assertCalledOnceWith(name='asdf', pipeline=['asdf'])
+
+
+class TestPipelineComposerInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.enable()
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_records_latency_of_every_step(self):
+        def get_obj(request):
+            return request
+
+        def del_obj(request):
+            return Response()
+
+        test_method = PipelineComposer(name='read_list',
+                                       pipeline=[get_obj, del_obj],
+                                       resource_name='TestResource')
+
+        test_method(Request(user=None, request_params=None))
+        test_method(Request(user=None, request_params=None))
+
+        latencies = instrumentation.get_step_latencies()
+        self.assertEqual(set(latencies),
+                         {('TestResource', 'read_list', 'get_obj'),
+                          ('TestResource', 'read_list', 'del_obj')})
+        get_obj_latency = latencies[('TestResource', 'read_list', 'get_obj')]
+        self.assertEqual(get_obj_latency['wall']['count'], 2)
+        self.assertEqual(get_obj_latency['cpu']['count'], 2)
+
+    def test_does_not_record_when_disabled(self):
+        instrumentation.disable()
+        test_method = PipelineComposer(name='read_list',
+                                       pipeline=[lambda request: Response()])
+
+        test_method(Request(user=None, request_params=None))
+
+        self.assertEqual(instrumentation.get_step_latencies(), {})
+
+
+class TestPipelineComposerTrustedSteps(unittest.TestCase):
+    def setUp(self):
+        self.request = Request(user=None, request_params=None)
+
+    def test_non_callable_step_fails_composition(self):
+        self.assertRaises(AssertionError, PipelineComposer,
+                          pipeline=[object()])
+
+    @mock_patch.object(PipelineComposer, 'trusted_steps', True)
+    def test_trusted_pipeline_exits_on_response(self):
+        expected_response = Response()
+        last_step = MagicMock()
+        test_method = PipelineComposer(
+            pipeline=[lambda request: expected_response, last_step])
+
+        response = test_method(self.request)
+
+        self.assertEqual(response, expected_response)
+        self.assertEqual(last_step.call_count, 0)
+
+    @mock_patch.object(PipelineComposer, 'trusted_steps', True)
+    def test_trusted_pipeline_skips_step_checks(self):
+        test_method = PipelineComposer(
+            pipeline=[lambda request: object(), lambda request: Response()])
+
+        response = test_method(self.request)
+
+        self.assertIsInstance(response, Response)
+
+    @mock_patch.object(PipelineComposer, 'trusted_steps', True)
+    def test_trusted_pipeline_throws_if_no_response(self):
+        test_method = PipelineComposer(pipeline=[lambda request: request])
+
+        self.assertRaises(AssertionError, test_method, self.request)
+
+    @mock_patch.object(PipelineComposer, 'trusted_steps', True)
+    @mock_patch.object(PipelineComposer, 'contract_sample_rate', 1.0)
+    def test_sampled_calls_check_steps(self):
+        test_method = PipelineComposer(
+            pipeline=[lambda request: object(), lambda request: Response()])
+
+        self.assertRaises(AssertionError, test_method, self.request)
+
+
+class TestPipelineComposerPassThroughSteps(unittest.TestCase):
+    def test_pass_through_steps_are_elided(self):
+        @pass_through_step
+        def authorize(request):
+            return request
+
+        def respond(request):
+            return Response()
+
+        test_method = PipelineComposer(pipeline=[authorize, respond])
+
+        self.assertEqual(test_method.pipeline, [respond])
+
+    def test_mock_steps_are_not_elided(self):
+        step = MagicMock()
+
+        test_method = PipelineComposer(pipeline=[step])
+
+        self.assertEqual(test_method.pipeline, [step])
@@ -0,0 +1,52 @@
+import unittest
+
+from mock import MagicMock
+
+from rip import resource_registry
+from rip.request import Request
+from rip.resource_registry import ResourceRegistry
+
+
+class TestResourceRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = ResourceRegistry()
+
+    def test_creates_instance_once(self):
+        resource_cls = MagicMock()
+
+        first = self.registry.get_instance(resource_cls)
+        second = self.registry.get_instance(resource_cls)
+
+        self.assertIs(first, second)
+        resource_cls.assert_called_once_with()
+
+    def test_returns_registered_instance(self):
+        class TestResource(object):
+            pass
+
+        resource = TestResource()
+        self.registry.register(resource)
+
+        self.assertIs(self.registry.get_instance(TestResource), resource)
+
+    def test_registries_do_not_share_instances(self):
+        class TestResource(object):
+            pass
+
+        resource = TestResource()
+        self.registry.register(resource)
+
+        self.assertIsNot(ResourceRegistry().get_instance(TestResource),
+                         resource)
+
+    def test_uses_registry_of_request(self):
+        request = Request(user=None, request_params={}, context_params={
+            resource_registry.CONTEXT_PARAM: self.registry})
+
+        self.assertIs(resource_registry.get_registry(request), self.registry)
+
+    def test_uses_default_registry_without_api(self):
+        request = Request(user=None, request_params={}, context_params={})
+
+        self.assertIs(resource_registry.get_registry(request),
+                      resource_registry.default_registry)
@@ -0,0 +1,208 @@
+import unittest
+
+from mock import MagicMock
+
+from rip.api import Api
+from rip.api_schema import ApiSchema
+from rip.crud.crud_actions import CrudActions
+from rip.crud.crud_resource import CrudResource
+from rip.django_adapter import action_resolver, metadata_factory
+from rip.route_match import method_not_allowed
+from rip.schema.string_field import StringField
+from rip.view.view_resource import ViewResource
+
+
+class TeamSchema(ApiSchema):
+    name = StringField()
+
+    class Meta:
+        schema_name = 'teams'
+
+
+class TeamResource(CrudResource):
+    schema_cls = TeamSchema
+    allowed_actions = [CrudActions.READ_DETAIL, CrudActions.READ_LIST,
+                       CrudActions.READ_MULTIPLE,
+                       CrudActions.CREATE_DETAIL, CrudActions.CREATE_LIST,
+                       CrudActions.GET_AGGREGATES]
+
+
+class CompanySchema(ApiSchema):
+    name = StringField()
+
+    class Meta:
+        schema_name = 'companies'
+
+
+class CompanyResource(CrudResource):
+    schema_cls = CompanySchema
+
+
+class ReportResource(ViewResource):
+    schema_cls = TeamSchema
+
+
+def resolve_action_by_name(http_request, url, api):
+    """
+    Resolves an action by its name, as actions were resolved before the
+    dispatch table of routes
+    """
+    resource = api.resolve_resource(url)
+    if isinstance(resource, ViewResource):
+        return resource.read
+    if url.endswith('aggregates'):
+        return resource.get_aggregates
+    endpoint = 'detail' if http_request.method == 'POST' or \
+        len(url.split('/')) % 2 == 0 else 'list'
+    action_prefix = {'GET': 'read', 'POST': 'create',
+                     'PATCH': 'update'}[http_request.method]
+    return getattr(resource, '%s_%s' % (action_prefix, endpoint))
+
+
+class TestRouteMatch(unittest.TestCase):
+    def setUp(self):
+        self.api = Api(name='api', version='v1')
+        self.team_resource = TeamResource()
+        self.report_resource = ReportResource()
+        self.api.register_resource('companies/{company_id}/teams',
+                                   self.team_resource)
+        self.api.register_resource('reports/teams', self.report_resource)
+
+    def test_should_match_detail_url(self):
+        route_match = self.api.match_route('companies/1/teams/2')
+
+        self.assertIs(route_match.resource, self.team_resource)
+        self.assertEqual(route_match.endpoint, 'companies/{company_id}/teams')
+        self.assertEqual(route_match.kind, 'detail')
+        self.assertEqual(route_match.breadcrumbs, [('companies', '1')])
+        self.assertEqual(route_match.breadcrumb_filters,
+                         {'company_id': '1', 'id': '2'})
+
+    def test_should_match_list_and_aggregates_urls(self):
+        list_match = self.api.match_route('companies/1/teams')
+        aggregates_match = self.api.match_route('companies/1/teams/aggregates')
+
+        self.assertEqual(list_match.kind, 'list')
+        self.assertEqual(list_match.get_endpoint_kind('POST'), 'detail')
+        self.assertEqual(list_match.breadcrumb_filters, {'company_id': '1'})
+        self.assertEqual(aggregates_match.kind, 'aggregates')
+        self.assertEqual(aggregates_match.get_endpoint_kind('POST'),
+                         'aggregates')
+        self.assertEqual(aggregates_match.breadcrumb_filters,
+                         {'company_id': '1'})
+
+    def test_should_match_multiple_url(self):
+        route_match = self.api.match_route('companies/1/teams/set/2;3;')
+
+        self.assertIs(route_match.resource, self.team_resource)
+        self.assertEqual(route_match.kind, 'multiple')
+        self.assertEqual(route_match.breadcrumbs, [('companies', '1')])
+        self.assertEqual(route_match.breadcrumb_filters,
+                         {'company_id': '1', 'id__in': ['2', '3']})
+        self.assertEqual(route_match.get_action('GET'),
+                         self.team_resource.read_multiple)
+        self.assertIsNone(route_match.get_action('PATCH'))
+
+    def test_should_match_set_only_at_the_set_route(self):
+        self.api.register_resource('companies', CompanyResource())
+
+        nested_match = self.api.match_route('companies/set/teams')
+        multiple_match = self.api.match_route('companies/set/1;2')
+
+        self.assertIs(nested_match.resource, self.team_resource)
+        self.assertEqual(nested_match.kind, 'list')
+        self.assertEqual(nested_match.breadcrumb_filters,
+                         {'company_id': 'set'})
+        self.assertEqual(multiple_match.kind, 'multiple')
+        self.assertEqual(multiple_match.breadcrumb_filters,
+                         {'id__in': ['1', '2']})
+        self.assertIsNone(self.api.match_route('reports/set/1'))
+
+    def test_should_match_view_resource_url(self):
+        route_match = self.api.match_route('reports/teams')
+
+        self.assertIs(route_match.resource, self.report_resource)
+        self.assertEqual(route_match.endpoint, 'reports/teams')
+
+    def test_should_not_match_unknown_url(self):
+        self.assertIsNone(self.api.match_route('companies/1/players'))
+        self.assertIsNone(self.api.match_route('teams'))
+
+    def test_should_dispatch_to_allowed_actions(self):
+        route_match = self.api.match_route('companies/1/teams/2')
+
+        self.assertEqual(route_match.get_action('GET'),
+                         self.team_resource.read_detail)
+        self.assertIs(route_match.get_action('DELETE'), method_not_allowed)
+        self.assertIsNone(route_match.get_action('OPTIONS'))
+
+    def test_should_dispatch_any_method_of_view_to_read(self):
+        route_match = self.api.match_route('reports/teams')
+
+        for method in ('GET', 'POST', 'HEAD', 'OPTIONS', 'TRACE'):
+            self.assertEqual(route_match.get_action(method),
+                             self.report_resource.read)
+
+    def test_should_dispatch_with_current_allowed_actions(self):
+        route_match = self.api.match_route('companies/1/teams/2')
+
+        self.team_resource.allowed_actions = [CrudActions.DELETE_DETAIL]
+
+        self.assertIs(route_match.get_action('GET'), method_not_allowed)
+        self.assertEqual(route_match.get_action('DELETE'),
+                         self.team_resource.delete_detail)
+
+    def test_should_dispatch_with_allowed_actions_changed_in_place(self):
+        route_match = self.api.match_route('companies/1/teams/2')
+        self.team_resource.allowed_actions = list(
+            TeamResource.allowed_actions)
+        self.assertEqual(route_match.get_action('GET'),
+                         self.team_resource.read_detail)
+
+        self.team_resource.allowed_actions.remove(CrudActions.READ_DETAIL)
+        self.team_resource.invalidate_pipelines()
+
+        self.assertIs(route_match.get_action('GET'), method_not_allowed)
+
+    def test_should_dispatch_post_of_many_entities_to_create_list(self):
+        route_match = self.api.match_route('companies/1/teams')
+
+        self.assertEqual(route_match.get_action('POST'),
+                         self.team_resource.create_detail)
+        self.assertEqual(route_match.get_action('POST', many=True),
+                         self.team_resource.create_list)
+        self.assertEqual(
+            self.api.match_route('companies/1/teams').get_action('POST'),
+            self.team_resource.create_detail)
+        self.assertEqual(
+            self.api.match_route(
+                'companies/1/teams/aggregates').get_action('OPTIONS'),
+            self.team_resource.get_aggregates)
+        self.assertEqual(
+            self.api.match_route('reports/teams').get_action('GET'),
+            self.report_resource.read)
+
+    def test_should_match_like_url_parsing_of_each_stage(self):
+        for url in ('companies/1/teams', 'companies/1/teams/2',
+                    'companies/1/teams/aggregates', 'reports/teams'):
+            for method in ('GET', 'POST', 'PATCH'):
+                http_request = MagicMock()
+                http_request.method = method
+                route_match = self.api.match_route(url)
+                endpoint = self.api.resolve_endpoint(url)
+
+                route_action = action_resolver.resolve_route_action(
+                    http_request, route_match)
+                action = resolve_action_by_name(http_request, url,
+                                                self.api)
+                if action_resolver.is_method_not_allowed(route_action):
+                    self.assertFalse(route_match.resource.is_action_allowed(
+                        action.__name__))
+                else:
+                    self.assertEqual(route_action, action)
+                self.assertEqual(
+                    route_match.breadcrumbs,
+                    metadata_factory.api_breadcrumbs(url, endpoint))
+                self.assertEqual(
+                    route_match.breadcrumb_filters,
+                    metadata_factory.api_breadcrumb_filters(url, endpoint))
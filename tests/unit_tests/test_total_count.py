@@ -0,0 +1,60 @@
+import unittest
+
+from rip.total_count import TotalCountCache, TotalCountModes, \
+    get_cache_key, resolve_mode
+
+
+class TestGetCacheKey(unittest.TestCase):
+    def test_key_does_not_depend_on_order_of_filters(self):
+        self.assertEqual(
+            get_cache_key({'name': 'John', 'id__in': [1, 2]}),
+            get_cache_key(dict([('id__in', [1, 2]), ('name', 'John')])))
+        self.assertNotEqual(get_cache_key({'id__in': [1, 2]}),
+                            get_cache_key({'id__in': [1, 3]}))
+
+    def test_unhashable_filters_have_no_key(self):
+        self.assertIsNone(get_cache_key({'id__in': set([1, 2])}))
+
+    def test_key_depends_on_user(self):
+        self.assertNotEqual(get_cache_key({'name': 'John'}, 'admin'),
+                            get_cache_key({'name': 'John'}, 'guest'))
+
+
+class TestResolveMode(unittest.TestCase):
+    def test_should_use_mode_of_resource_without_requested_mode(self):
+        self.assertEqual(resolve_mode(TotalCountModes.CACHED),
+                         TotalCountModes.CACHED)
+
+    def test_should_only_use_cheaper_requested_mode(self):
+        self.assertEqual(
+            resolve_mode(TotalCountModes.EXACT, TotalCountModes.ESTIMATE),
+            TotalCountModes.ESTIMATE)
+        self.assertEqual(
+            resolve_mode(TotalCountModes.ESTIMATE, TotalCountModes.EXACT),
+            TotalCountModes.ESTIMATE)
+        self.assertEqual(
+            resolve_mode(TotalCountModes.NONE, TotalCountModes.CACHED),
+            TotalCountModes.NONE)
+
+
+class TestTotalCountCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        self.cache = TotalCountCache(ttl=10, max_size=2,
+                                     clock=lambda: self.now)
+
+    def test_count_expires_after_ttl(self):
+        self.cache.set('a', 5)
+
+        self.now += 9
+        self.assertEqual(self.cache.get('a'), 5)
+        self.now += 1
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_cache_is_cleared_when_full(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.set('c', 3)
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('c'), 3)
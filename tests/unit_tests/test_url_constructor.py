@@ -0,0 +1,40 @@
+import unittest
+
+from rip import url_constructor
+
+
+class TestUrlConstructor(unittest.TestCase):
+    def test_should_construct_url(self):
+        url = url_constructor.construct_url(
+            api_name='api', api_version='v1', schema_name='users',
+            entity_id=2)
+
+        self.assertEqual(url, u'/api/v1/users/2/')
+
+    def test_should_construct_url_with_parents(self):
+        for parents in ([('teams', 1)], [['teams', 1]]):
+            url = url_constructor.construct_url(
+                api_name='api', api_version='v1', schema_name='users',
+                entity_id=2, parents=parents)
+
+            self.assertEqual(url, u'/api/v1/teams/1/users/2/')
+
+    def test_should_cache_list_url(self):
+        first = url_constructor.construct_list_url(
+            api_name='api', api_version='v1', schema_name='users',
+            parents=[('teams', 1)])
+        second = url_constructor.construct_list_url(
+            api_name='api', api_version='v1', schema_name='users',
+            parents=[('teams', 1)])
+        other_parent = url_constructor.construct_list_url(
+            api_name='api', api_version='v1', schema_name='users',
+            parents=[('teams', 2)])
+
+        self.assertIs(first, second)
+        self.assertEqual(other_parent, u'/api/v1/teams/2/users/')
+
+    def test_should_get_entity_id_from_url(self):
+        self.assertEqual(url_constructor.get_entity_id('/api/v1/users/2/'),
+                         '2')
+        self.assertEqual(url_constructor.get_entity_id('/api/v1/users/3'),
+                         '3')